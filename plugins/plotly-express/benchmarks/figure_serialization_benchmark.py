@@ -0,0 +1,137 @@
+"""
+Benchmark serializing large layered figures into the messages sent to the client.
+
+Layers figures with many traces, as a plot by with many partitions does, and reports the time to build the message
+for a new figure, for the same figure sent again, and for a figure with one more trace, which is sent as a patch.
+The previous pipeline, which converted the figure to and from JSON several times, is measured for comparison.
+
+Run with `python benchmarks/figure_serialization_benchmark.py [--traces N] [--repeat N]` from the
+`plugins/plotly-express` directory.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from unittest.mock import Mock
+
+
+def start_server() -> None:
+    from deephaven_server.server import Server
+
+    if Server.instance is None:
+        Server(port=11000, jvm_args=["-Xmx4g"]).start()
+
+
+def make_figure(traces: int):
+    """
+    Create a layered figure.
+
+    Args:
+        traces: The number of traces to layer.
+
+    Returns:
+        The layered DeephavenFigure.
+    """
+    from plotly.graph_objects import Figure, Scatter
+    from deephaven.plot.express import DeephavenFigure
+    from deephaven.plot.express.plots._layer import atomic_layer
+
+    figs = [
+        DeephavenFigure(
+            Figure(
+                Scatter(
+                    x=[None],
+                    y=[None],
+                    name=f"Partition {i}",
+                    mode="markers",
+                    hovertemplate="X=%{x}<br>Y=%{y}<extra></extra>",
+                    legendgroup=f"Partition {i}",
+                )
+            )
+        )
+        for i in range(traces)
+    ]
+    return atomic_layer(*figs, which_layout=0)
+
+
+def previous_message(figure, exporter) -> bytes:
+    """
+    Build a message the way it was built before figures cached their JSON.
+
+    Args:
+        figure: The figure to send.
+        exporter: The exporter to use.
+
+    Returns:
+        The encoded message.
+    """
+    plotly = json.loads(figure._plotly_fig.to_json())
+    payload = json.dumps(
+        {"plotly": plotly, "deephaven": figure.get_deephaven_dict(exporter)}
+    )
+    message = {
+        "type": "NEW_FIGURE",
+        "figure": json.loads(payload),
+        "revision": 0,
+        "new_references": [],
+        "removed_references": [],
+    }
+    return json.dumps(message).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--traces", type=int, default=500, help="Traces layered")
+    parser.add_argument("--repeat", type=int, default=20, help="Messages built")
+    args = parser.parse_args()
+
+    start_server()
+
+    from deephaven.plot.express.communication.DeephavenFigureListener import (
+        DeephavenFigureListener,
+    )
+
+    figure = make_figure(args.traces)
+    added_figure = make_figure(args.traces + 1)
+
+    listener = DeephavenFigureListener(figure, Mock())
+
+    def new_figure() -> None:
+        # a new figure has to be serialized, as nothing is cached yet
+        figure._plotly_cache = None
+        listener._sent_figure = None
+        listener._build_figure_message(figure)
+
+    def patched_figure() -> None:
+        added_figure._plotly_cache = None
+        listener._build_figure_message(figure)
+        listener._build_figure_message(added_figure, allow_patch=True)
+
+    results = {
+        "previous pipeline": timeit.timeit(
+            lambda: previous_message(figure, listener._exporter), number=args.repeat
+        ),
+        "new figure": timeit.timeit(new_figure, number=args.repeat),
+        "same figure again": timeit.timeit(
+            lambda: listener._build_figure_message(figure), number=args.repeat
+        ),
+        "one trace added": timeit.timeit(patched_figure, number=args.repeat),
+    }
+
+    sizes = {
+        "new figure": len(listener._build_figure_message(figure)[0]),
+        "one trace added": len(
+            listener._build_figure_message(added_figure, allow_patch=True)[0]
+        ),
+    }
+
+    print(f"{args.traces} layered traces, {args.repeat} messages each")
+    for name, elapsed in results.items():
+        print(f"{name:<20} {elapsed / args.repeat * 1e3:8.2f} ms/message")
+    for name, size in sizes.items():
+        print(f"{name:<20} {size / 1e3:8.1f} KB/message")
+
+
+if __name__ == "__main__":
+    main()
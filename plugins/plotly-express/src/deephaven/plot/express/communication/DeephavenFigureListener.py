@@ -1,31 +1,34 @@
 from __future__ import annotations
 
 import json
-from functools import partial
-from typing import Any
+from typing import Any, Dict, Tuple, cast
 
 from deephaven.plugin.object_type import MessageStream
-from deephaven.table_listener import listen, TableUpdate
-from deephaven.liveness_scope import LivenessScope
 
 from ..exporter import Exporter
-from ..deephaven_figure import DeephavenFigure, DeephavenFigureNode, RevisionManager
+from ..deephaven_figure import DeephavenFigure, RevisionManager
+from ..shared import json_dumps, json_loads
+from .FigurePatch import create_figure_patch, is_patch_smaller
+from .FigureUpdateEngine import subscribe, unsubscribe
 
 
 class DeephavenFigureListener:
     """
-    Listener for DeephavenFigure
+    Listener for DeephavenFigure. The figure is kept up to date by a
+    FigureUpdateEngine shared by all the clients of the figure, and this
+    listener sends it to one client.
 
     Attributes:
         _connection: MessageStream: The connection to send messages to
-        _figure: DeephavenFigure: The figure to listen to
+        _source: DeephavenFigure: The figure the client is connected to
+        _engine: FigureUpdateEngine: The engine keeping the figure up to date
         _exporter: Exporter: The exporter to use for exporting the figure
-        _liveness_scope: Any: The liveness scope to use for the listeners
-        _listeners: list[Any]: The listeners for the partitioned tables
-        _partitioned_tables: dict[str, tuple[PartitionedTable, DeephavenFigureNode]]:
-            The partitioned tables to listen to
-        _revision_manager: RevisionManager: The revision manager to use for the figure
-        _handles: list[Any]: The handles for the listeners
+        _revision_manager: RevisionManager: The revision manager tracking the
+            revisions sent to the client
+        _sent_figure: tuple[DeephavenFigure, str | None, dict[str, Any]] | None:
+            The last figure sent to the client, with its plotly JSON and its
+            deephaven part, that patches are created against
+        _sent_revision: int | None: The revision of the last figure sent
     """
 
     def __init__(
@@ -41,38 +44,13 @@ class DeephavenFigureListener:
             connection: The connection to send messages to
         """
         self._connection = connection
-
-        # copy the figure so only this session's figure is updated
-        # the liveness scope is needed to keep any tables alive
-        self._figure = figure.copy()
+        self._source = figure
         self._exporter = Exporter()
-        self._liveness_scope = LivenessScope()
-        # store hard references to the handles so they don't get garbage collected
-        self._handles = []
-        self._listeners = []
         self._revision_manager = RevisionManager()
+        self._sent_figure = None
+        self._sent_revision = None
 
-        head_node = self._figure.get_head_node()
-        self._partitioned_tables = head_node.partitioned_tables
-
-        self._setup_listeners()
-
-        # force figure to be recreated after listeners are setup
-        # this ensures the figures are created correctly
-        # such as when partitions have been added but no listeners have been running
-        self._figure.recreate_figure()
-
-    def _setup_listeners(self) -> None:
-        """
-        Setup listeners for the partitioned tables
-        """
-        for table, node in self._partitioned_tables.values():
-            listen_func = partial(self._on_update, node)
-            # if a table is not refreshing, it will never update, so no need to listen
-            if table.is_refreshing:
-                handle = listen(table, listen_func)
-                self._handles.append(handle)
-                self._liveness_scope.manage(handle)
+        self._engine = subscribe(figure, self)
 
     def _get_figure(self) -> DeephavenFigure | None:
         """
@@ -81,30 +59,32 @@ class DeephavenFigureListener:
         Returns:
             The current figure
         """
-        return self._figure.get_figure()
+        return self._engine.get_figure()
 
-    def _on_update(
-        self, node: DeephavenFigureNode, update: TableUpdate, is_replay: bool
-    ) -> None:
+    def on_figure_update(self, figure: DeephavenFigure, revision: int) -> None:
         """
-        Update the figure. Because this is called when the PartitionedTable
-        meta table is updated, it will always trigger a rerender.
+        Send a figure recreated by the engine to the client.
 
         Args:
-            node: The node to update. Changes will propagate up from this node.
-            update: Not used. Required for the listener.
-            is_replay: Not used. Required for the listener.
+            figure: The recreated figure
+            revision: The revision of the figure
         """
         if self._connection:
-            revision = self._revision_manager.get_revision()
-            node.recreate_figure()
-            figure = self._get_figure()
             try:
-                self._connection.on_data(*self._build_figure_message(figure, revision))
+                self._connection.on_data(
+                    *self._build_figure_message(figure, revision, allow_patch=True)
+                )
             except RuntimeError:
                 # trying to send data when the connection is closed, ignore
                 pass
 
+    def close(self) -> None:
+        """
+        Stop sending updates to the client
+        """
+        unsubscribe(self._source, self)
+        self._connection = None
+
     def _handle_retrieve_figure(self) -> tuple[bytes, list[Any]]:
         """
         Handle a retrieve message. This will return a message with the current
@@ -116,14 +96,21 @@ class DeephavenFigureListener:
         return self._build_figure_message(self._get_figure())
 
     def _build_figure_message(
-        self, figure: DeephavenFigure | None, revision: int | None = None
+        self,
+        figure: DeephavenFigure | None,
+        revision: int | None = None,
+        allow_patch: bool = False,
     ) -> tuple[bytes, list[Any]]:
         """
         Build a message to send to the client with the current figure.
+        If allowed, a FIGURE_PATCH message with only the changes since the last
+        figure sent is built instead, unless the patch is about as large as
+        the figure.
 
         Args:
             figure: The figure to send
             revision: The revision to send
+            allow_patch: If a patch can be sent instead of the full figure
 
         Returns:
             The result of the message as a tuple of (new payload, new references)
@@ -138,21 +125,89 @@ class DeephavenFigureListener:
             if revision is not None:
                 self._revision_manager.updated_revision(revision)
 
-            new_figure = figure.to_dict(exporter=exporter)
+            deephaven = figure.get_deephaven_dict(exporter)
 
             new_objects, new_references, removed_references = exporter.references()
 
             message = {
                 "type": "NEW_FIGURE",
-                "figure": new_figure,
                 "revision": self._revision_manager.current_revision,
                 "new_references": new_references,
                 "removed_references": removed_references,
             }
-            return json.dumps(message).encode(), new_objects
+
+            payload = None
+            sent = self._sent_figure
+            plotly_json = figure.get_plotly_json()
+            deephaven_json = json_dumps(deephaven)
+            if (
+                allow_patch
+                and sent is not None
+                and sent[1] is not None
+                and plotly_json is not None
+            ):
+                patch = create_figure_patch(
+                    self._get_sent_figure_dict(),
+                    {"plotly": figure.get_plotly_dict(), "deephaven": deephaven},
+                )
+                patch_json = json_dumps(patch)
+                figure_size = len(plotly_json) + len(deephaven_json)
+                if is_patch_smaller(len(patch_json), figure_size):
+                    message["type"] = "FIGURE_PATCH"
+                    message["base_revision"] = self._sent_revision
+                    payload = self._encode_message(message, "patch", patch_json)
+
+            if payload is None:
+                # the plotly JSON is cached by the figure, so it is inserted as is
+                # instead of being decoded and encoded again
+                plotly = plotly_json.encode() if plotly_json is not None else b"null"
+                figure_json = (
+                    b'{"plotly": ' + plotly + b', "deephaven": ' + deephaven_json + b"}"
+                )
+                payload = self._encode_message(message, "figure", figure_json)
+
+            self._sent_figure = (figure, plotly_json, deephaven)
+            self._sent_revision = self._revision_manager.current_revision
+
+            return payload, new_objects
             # otherwise, don't need to send anything, as a newer revision has
             # already been sent
 
+    def _get_sent_figure_dict(self) -> dict[str, Any]:
+        """
+        Get the last figure sent to the client as a dictionary. The plotly
+        dictionary cached by the figure is used if the figure was not modified
+        since it was sent.
+
+        Returns:
+            The figure sent as a dictionary
+        """
+        figure, plotly_json, deephaven = cast(
+            Tuple[DeephavenFigure, str, Dict[str, Any]], self._sent_figure
+        )
+        if figure.get_plotly_json() is plotly_json:
+            plotly = figure.get_plotly_dict()
+        else:
+            plotly = json_loads(plotly_json)
+        return {"plotly": plotly, "deephaven": deephaven}
+
+    @staticmethod
+    def _encode_message(message: dict[str, Any], key: str, value: bytes) -> bytes:
+        """
+        Encode a message, adding a value that is already encoded as JSON.
+
+        Args:
+            message: The message to encode, without the value
+            key: The key of the value
+            value: The JSON of the value
+
+        Returns:
+            The encoded message
+        """
+        encoded = json_dumps(message)
+        # insert the value before the closing brace of the message
+        return encoded[:-1] + b', "' + key.encode() + b'": ' + value + b"}"
+
     def process_message(
         self, payload: bytes, references: list[Any]
     ) -> tuple[bytes, list[Any]]:
@@ -173,6 +228,3 @@ class DeephavenFigureListener:
         if message["type"] == "RETRIEVE":
             return self._handle_retrieve_figure()
         return b"", []
-
-    def __del__(self):
-        self._liveness_scope.release()
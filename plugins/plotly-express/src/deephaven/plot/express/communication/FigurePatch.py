@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Any
+
+# if a patch is larger than this fraction of the full figure, the full figure
+# is sent instead, as applying the patch would save the client little work
+MAX_PATCH_RATIO = 0.5
+
+
+def splice_patch(old: list[Any], new: list[Any]) -> dict[str, Any] | None:
+    """
+    Create a patch that turns the old list into the new list by replacing
+    the items between the common prefix and the common suffix of the lists.
+    Adding or removing items in one place, such as adding a trace, only sends
+    the items added.
+
+    Args:
+        old: The list the client has
+        new: The new list
+
+    Returns:
+        A dictionary with the start index, the number of items to delete and the
+        items to insert, or None if the lists are equal
+    """
+    start = 0
+    max_start = min(len(old), len(new))
+    while start < max_start and old[start] == new[start]:
+        start += 1
+
+    if start == len(old) == len(new):
+        return None
+
+    end_old, end_new = len(old), len(new)
+    while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+        end_old -= 1
+        end_new -= 1
+
+    return {
+        "start": start,
+        "delete": end_old - start,
+        "insert": new[start:end_new],
+    }
+
+
+def dict_patch(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Create a patch that turns the old dictionary into the new dictionary by
+    setting the top level keys that changed and removing the keys that are gone
+
+    Args:
+        old: The dictionary the client has
+        new: The new dictionary
+
+    Returns:
+        A dictionary with the keys to set and the keys to remove, or None if the
+        dictionaries are equal
+    """
+    set_keys = {key: val for key, val in new.items() if old.get(key, None) != val}
+    remove_keys = [key for key in old if key not in new]
+
+    if not set_keys and not remove_keys:
+        return None
+
+    return {"set": set_keys, "remove": remove_keys}
+
+
+def create_figure_patch(
+    old_figure: dict[str, Any], new_figure: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Create a patch that turns the old figure into the new figure. Traces and
+    mappings are patched as lists, and the layout and the other deephaven
+    settings by top level key.
+
+    Args:
+        old_figure: The figure the client has, as sent in a NEW_FIGURE message
+        new_figure: The new figure
+
+    Returns:
+        The patch, with only the parts of the figure that changed
+    """
+    old_plotly, new_plotly = old_figure["plotly"] or {}, new_figure["plotly"] or {}
+    old_deephaven, new_deephaven = old_figure["deephaven"], new_figure["deephaven"]
+
+    patches = {
+        "data": splice_patch(old_plotly.get("data", []), new_plotly.get("data", [])),
+        "layout": dict_patch(
+            old_plotly.get("layout", {}), new_plotly.get("layout", {})
+        ),
+        "mappings": splice_patch(old_deephaven["mappings"], new_deephaven["mappings"]),
+        "deephaven": dict_patch(
+            {key: val for key, val in old_deephaven.items() if key != "mappings"},
+            {key: val for key, val in new_deephaven.items() if key != "mappings"},
+        ),
+    }
+
+    return {key: patch for key, patch in patches.items() if patch is not None}
+
+
+def is_patch_smaller(patch_size: int, figure_size: int) -> bool:
+    """
+    Check if a patch is small enough compared to the full figure to be sent
+    instead of it
+
+    Args:
+        patch_size: The size of the encoded patch
+        figure_size: The size of the encoded figure
+
+    Returns:
+        True if the patch should be sent, False if the full figure should be
+    """
+    return patch_size <= MAX_PATCH_RATIO * figure_size
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import logging
+import threading
+from functools import partial
+from typing import Any, Protocol
+
+from deephaven.table_listener import listen, TableUpdate
+from deephaven.liveness_scope import LivenessScope
+
+from ..deephaven_figure import DeephavenFigure, DeephavenFigureNode, RevisionManager
+
+logger = logging.getLogger(__name__)
+
+
+class FigureUpdateClient(Protocol):
+    """
+    A client of a FigureUpdateEngine, sent the figure when it is recreated
+    """
+
+    def on_figure_update(self, figure: DeephavenFigure, revision: int) -> None:
+        """
+        Send the recreated figure to the client
+
+        Args:
+            figure: The recreated figure
+            revision: The revision of the figure
+        """
+        ...
+
+
+class FigureUpdateEngine:
+    """
+    Keeps a figure up to date for all the clients of the figure. The figure
+    graph is copied and the partitioned tables listened to once, so a
+    partition change recreates the figure once, and the figure is then sent to
+    every client. Each client tracks the revisions it was sent.
+
+    Attributes:
+        _source: DeephavenFigure: The figure the engine was created for
+        _figure: DeephavenFigure: The copy of the figure that is updated
+        _liveness_scope: Any: The liveness scope to use for the listeners
+        _handles: list[Any]: The handles for the listeners
+        _partitioned_tables: dict[str, tuple[PartitionedTable, DeephavenFigureNode]]:
+            The partitioned tables to listen to
+        _revision_manager: RevisionManager: The revision manager that assigns
+            revisions to the recreated figures
+        _clients: list[FigureUpdateClient]: The clients of the figure
+        _lock: threading.Lock: The lock for the clients
+    """
+
+    def __init__(self, figure: DeephavenFigure):
+        """
+        Create a new engine for the figure
+
+        Args:
+            figure: The figure to keep up to date
+        """
+        self._source = figure
+        # copy the figure so the original figure isn't updated
+        # the liveness scope is needed to keep any tables alive
+        self._figure = figure.copy()
+        self._liveness_scope = LivenessScope()
+        # store hard references to the handles so they don't get garbage collected
+        self._handles = []
+        self._revision_manager = RevisionManager()
+        self._clients = []
+        self._lock = threading.Lock()
+
+        head_node = self._figure.get_head_node()
+        self._partitioned_tables = head_node.partitioned_tables
+
+        self._setup_listeners()
+
+        # force figure to be recreated after listeners are setup
+        # this ensures the figures are created correctly
+        # such as when partitions have been added but no listeners have been running
+        self._figure.recreate_figure()
+
+    def _setup_listeners(self) -> None:
+        """
+        Setup listeners for the partitioned tables
+        """
+        for table, node in self._partitioned_tables.values():
+            listen_func = partial(self._on_update, node)
+            # if a table is not refreshing, it will never update, so no need to listen
+            if table.is_refreshing:
+                handle = listen(table, listen_func)
+                self._handles.append(handle)
+                self._liveness_scope.manage(handle)
+
+    def get_figure(self) -> DeephavenFigure | None:
+        """
+        Get the current figure
+
+        Returns:
+            The current figure
+        """
+        return self._figure.get_figure()
+
+    def _on_update(
+        self, node: DeephavenFigureNode, update: TableUpdate, is_replay: bool
+    ) -> None:
+        """
+        Update the figure once and send it to all the clients. Because this is
+        called when the PartitionedTable meta table is updated, it will always
+        trigger a rerender. The figure is rebuilt from the cache of the node,
+        so only the figures of added partitions are drawn.
+
+        Args:
+            node: The node to update. Changes will propagate up from this node.
+            update: Not used. Required for the listener.
+            is_replay: Not used. Required for the listener.
+        """
+        with self._lock:
+            clients = list(self._clients)
+        if not clients:
+            return
+
+        revision = self._revision_manager.get_revision()
+        node.recreate_figure()
+        figure = self.get_figure()
+        if not figure:
+            return
+
+        for client in clients:
+            try:
+                client.on_figure_update(figure, revision)
+            except Exception as e:
+                # one client failing should not stop the others from updating
+                logger.exception("Error sending figure update: %s", e)
+
+    def add_client(self, client: FigureUpdateClient) -> None:
+        """
+        Add a client, sent the figure when it is recreated
+
+        Args:
+            client: The client to add
+        """
+        with self._lock:
+            self._clients.append(client)
+
+    def remove_client(self, client: FigureUpdateClient) -> bool:
+        """
+        Remove a client
+
+        Args:
+            client: The client to remove
+
+        Returns:
+            True if there are no clients left, False otherwise
+        """
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+            return not self._clients
+
+    def close(self) -> None:
+        """
+        Stop listening to the partitioned tables
+        """
+        self._handles = []
+        self._liveness_scope.release()
+
+
+_engines: dict[int, FigureUpdateEngine] = {}
+_creating: dict[int, threading.Event] = {}
+_engines_lock = threading.Lock()
+
+
+def subscribe(
+    figure: DeephavenFigure, client: FigureUpdateClient
+) -> FigureUpdateEngine:
+    """
+    Add a client to the engine of a figure, creating the engine for the first
+    client of the figure. The engine is created without holding the lock, as
+    creating it recreates the figure, and other clients of the figure wait
+    for it to be created.
+
+    Args:
+        figure: The figure the client is connected to
+        client: The client
+
+    Returns:
+        The engine of the figure
+    """
+    while True:
+        with _engines_lock:
+            # the engine holds the figure, so the id isn't reused while it exists
+            engine = _engines.get(id(figure))
+            if engine is not None:
+                engine.add_client(client)
+                return engine
+            creating = _creating.get(id(figure))
+            if creating is None:
+                creating = _creating[id(figure)] = threading.Event()
+                break
+        # another client is creating the engine, use it once it is created
+        creating.wait()
+
+    try:
+        engine = FigureUpdateEngine(figure)
+        with _engines_lock:
+            _engines[id(figure)] = engine
+            engine.add_client(client)
+        return engine
+    finally:
+        with _engines_lock:
+            del _creating[id(figure)]
+        creating.set()
+
+
+def unsubscribe(figure: DeephavenFigure, client: FigureUpdateClient) -> None:
+    """
+    Remove a client from the engine of a figure, closing the engine when its
+    last client is removed
+
+    Args:
+        figure: The figure the client is connected to
+        client: The client
+    """
+    with _engines_lock:
+        engine = _engines.get(id(figure))
+        if engine is None or not engine.remove_client(client):
+            return
+        del _engines[id(figure)]
+    engine.close()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import Generator
-from typing import Callable, Any
+from typing import Callable, Any, cast
 from plotly.graph_objects import Figure
 from abc import abstractmethod
 from copy import copy
@@ -11,10 +11,11 @@ from deephaven.table import PartitionedTable, Table
 from deephaven.execution_context import ExecutionContext, get_exec_ctx
 from deephaven.liveness_scope import LivenessScope
 
-from ..shared import args_copy
+from ..shared import args_copy, json_loads
 from ..data_mapping import DataMapping
 from ..exporter import Exporter
 from .RevisionManager import RevisionManager
+from .TraceCache import TraceCache
 
 
 def has_color_args(call_args: dict[str, Any]) -> bool:
@@ -115,6 +116,9 @@ class DeephavenFigureNode(DeephavenNode):
         func: Callable: The function to call
         cached_figure: DeephavenFigure: The cached figure
         revision_manager: RevisionManager: The revision manager to use for the figure node
+        trace_cache: TraceCache: The cache of the partition of each
+          constituent, so only added constituents are queried when the
+          partitions change
     """
 
     def __init__(
@@ -142,6 +146,7 @@ class DeephavenFigureNode(DeephavenNode):
         self.func = func if func else lambda **kwargs: None
         self.cached_figure = None
         self.revision_manager = RevisionManager()
+        self.trace_cache = TraceCache()
 
     def recreate_figure(self, update_parent: bool = True) -> None:
         """
@@ -159,6 +164,8 @@ class DeephavenFigureNode(DeephavenNode):
             table = self.table
             copied_args = args_copy(self.args)
             copied_args["args"]["table"] = table
+            if isinstance(table, PartitionedTable):
+                copied_args["trace_cache"] = self.trace_cache
             new_figure = self.func(**copied_args)
 
         with self.revision_manager:
@@ -383,6 +390,10 @@ class DeephavenFigure:
         _data_mappings: list[DataMapping]: The data mappings
         _has_subplots: bool: If this figure has subplots
         _liveness_scope: LivenessScope: The liveness scope to use for the figure
+        _plotly_cache: tuple[Figure, str, dict[str, Any] | None] | None: The
+            plotly figure the cache was created from, its JSON and its parsed
+            JSON. Cleared when the plotly figure is retrieved, as it might be
+            modified.
     """
 
     def __init__(
@@ -434,6 +445,8 @@ class DeephavenFigure:
 
         self._liveness_scope = LivenessScope()
 
+        self._plotly_cache = None
+
     def copy_mappings(self: DeephavenFigure, offset: int = 0) -> list[DataMapping]:
         """Copy all DataMappings within this figure, adding a specific offset
 
@@ -465,6 +478,59 @@ class DeephavenFigure:
             for links in mapping.get_links(exporter)
         ]
 
+    def get_plotly_json(self: DeephavenFigure) -> str | None:
+        """Get the plotly figure as JSON. The JSON is cached until the plotly
+        figure is retrieved with get_plotly_fig or replaced, so it is only
+        created once for each version of the figure.
+
+        Returns:
+          The plotly figure as JSON, or None if there is no plotly figure
+
+        """
+        fig = self._plotly_fig
+        if not fig:
+            return None
+        cache = self._plotly_cache
+        if cache is None or cache[0] is not fig:
+            fig_json = fig.to_json()
+            if fig_json is None:
+                return None
+            cache = self._plotly_cache = (fig, fig_json, None)
+        return cache[1]
+
+    def get_plotly_dict(self: DeephavenFigure) -> dict[str, Any] | None:
+        """Get the plotly figure as a JSON compatible dictionary. Like the JSON,
+        the dictionary is cached and shared, so it must not be modified.
+
+        Returns:
+          The plotly figure as a dictionary, or None if there is no plotly figure
+
+        """
+        if self.get_plotly_json() is None:
+            return None
+        fig, fig_json, fig_dict = cast(tuple, self._plotly_cache)
+        if fig_dict is None:
+            fig_dict = json_loads(fig_json)
+            self._plotly_cache = (fig, fig_json, fig_dict)
+        return fig_dict
+
+    def get_deephaven_dict(self: DeephavenFigure, exporter: Exporter) -> dict[str, Any]:
+        """Get the deephaven part of the figure, with the data mappings and
+        settings
+
+        Args:
+          exporter: The exporter to use to send tables
+
+        Returns:
+          The deephaven part of the figure as a dictionary
+
+        """
+        return {
+            "mappings": self.get_json_links(exporter),
+            "is_user_set_template": self._has_template,
+            "is_user_set_color": self._has_color,
+        }
+
     def to_dict(self: DeephavenFigure, exporter: Exporter) -> dict[str, Any]:
         """Convert the DeephavenFigure to dict
 
@@ -475,7 +541,9 @@ class DeephavenFigure:
           The DeephavenFigure as a dictionary
 
         """
-        return json.loads(self.to_json(exporter))
+        fig_json = self.get_plotly_json()
+        plotly = json_loads(fig_json) if fig_json is not None else None
+        return {"plotly": plotly, "deephaven": self.get_deephaven_dict(exporter)}
 
     def to_json(self: DeephavenFigure, exporter: Exporter) -> str:
         """Convert the DeephavenFigure to JSON
@@ -487,17 +555,11 @@ class DeephavenFigure:
           The DeephavenFigure as a JSON string
 
         """
-        plotly = None
-        if self._plotly_fig and (fig_json := self._plotly_fig.to_json()) is not None:
-            plotly = json.loads(fig_json)
-        mappings = self.get_json_links(exporter)
-        deephaven = {
-            "mappings": mappings,
-            "is_user_set_template": self._has_template,
-            "is_user_set_color": self._has_color,
-        }
-        payload = {"plotly": plotly, "deephaven": deephaven}
-        return json.dumps(payload)
+        # the plotly JSON is inserted as is, so it is not decoded and encoded again
+        fig_json = self.get_plotly_json()
+        deephaven = json.dumps(self.get_deephaven_dict(exporter))
+        plotly = fig_json if fig_json is not None else "null"
+        return f'{{"plotly": {plotly}, "deephaven": {deephaven}}}'
 
     def add_layer_to_graph(
         self, layer_func: Callable, args: dict[str, Any], exec_ctx: ExecutionContext
@@ -603,6 +665,8 @@ class DeephavenFigure:
         """
         figure = self.get_figure()
         if not figure:
+            # the figure might be modified, so it needs to be serialized again
+            self._plotly_cache = None
             return self._plotly_fig
         return figure.get_plotly_fig()
 
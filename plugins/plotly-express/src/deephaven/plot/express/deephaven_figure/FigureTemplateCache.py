@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import plotly.express as px
+import plotly.io as pio
+from plotly.graph_objects import Figure
+
+from deephaven.table import Table
+
+
+def _defaults_key() -> str:
+    """
+    Create a key for the plotly express defaults, as they change the figures
+    drawn
+
+    Returns:
+        The defaults and the default template encoded as JSON
+    """
+    defaults = {
+        name: getattr(px.defaults, name) for name in type(px.defaults).__slots__
+    }
+    return json.dumps(
+        [str(pio.templates.default), defaults], sort_keys=True, default=repr
+    )
+
+
+def figure_template_key(
+    draw: Callable,
+    call_args: dict[str, Any],
+    table: Table,
+    data_cols: list[str],
+) -> tuple[Hashable, ...] | None:
+    """
+    Create the key of the figure drawn with a function and args. As figures
+    are drawn from a single row of nulls, the figure only depends on the
+    function, the args and the types of the columns used.
+
+    Args:
+        draw: The plotly express function used to draw the figure
+        call_args: The args passed to plotly express
+        table: The table the figure is drawn from
+        data_cols: The columns used in the figure
+
+    Returns:
+        The key, or None if the args can't be compared, so the figure should
+        not be cached
+    """
+    try:
+        args_key = json.dumps(call_args, sort_keys=True)
+    except (TypeError, ValueError):
+        # args such as numpy values or functions can't reliably be compared
+        return None
+
+    used_cols = set(data_cols)
+    column_types = tuple(
+        (col.name, col.data_type.j_name)
+        for col in table.columns
+        if col.name in used_cols
+    )
+    return draw, args_key, column_types, _defaults_key()
+
+
+class FigureTemplateCache:
+    """
+    A bounded cache of the figures drawn by plotly express, before any styles
+    or data mappings are applied. Repeated partitions, recreated figures and
+    identical charts reuse the cached figure instead of creating a dataframe
+    and calling plotly express again. The least recently used figures are
+    evicted when the cache is full.
+
+    Attributes:
+        lock: threading.Lock: The lock to use for the cache
+        max_size: int: The maximum number of figures cached
+        figures: OrderedDict[tuple[Hashable, ...], Figure]: The cached figures,
+          from least to most recently used
+        hits: int: The number of figures reused from the cache
+        misses: int: The number of figures drawn
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.lock = threading.Lock()
+        self.max_size = max_size
+        self.figures = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_figure(
+        self,
+        key: tuple[Hashable, ...] | None,
+        draw: Callable[[], Figure],
+    ) -> Figure:
+        """
+        Get the figure for a key, drawing it if it is not cached.
+        A copy is returned, so it can be modified.
+
+        Args:
+            key: The key created with figure_template_key, or None to always draw
+            draw: The function that draws the figure
+
+        Returns:
+            The figure
+        """
+        if key is None or self.max_size <= 0:
+            return draw()
+
+        with self.lock:
+            fig = self.figures.get(key)
+            if fig is not None:
+                self.figures.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if fig is not None:
+            return Figure(fig)
+
+        fig = draw()
+        with self.lock:
+            self.figures[key] = Figure(fig)
+            while len(self.figures) > self.max_size:
+                self.figures.popitem(last=False)
+        return fig
+
+    def resize(self, max_size: int) -> None:
+        """
+        Change the maximum number of figures cached, evicting the least
+        recently used figures over it
+
+        Args:
+            max_size: The maximum number of figures cached. 0 disables the cache.
+        """
+        if max_size < 0:
+            raise ValueError(f"max_size must not be negative, got {max_size}")
+        with self.lock:
+            self.max_size = max_size
+            while len(self.figures) > self.max_size:
+                self.figures.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all figures
+        """
+        with self.lock:
+            self.figures.clear()
+
+
+_figure_template_cache = FigureTemplateCache()
+
+
+def get_figure_template_cache() -> FigureTemplateCache:
+    """
+    Get the cache of the figures drawn by plotly express
+
+    Returns:
+        The figure template cache
+    """
+    return _figure_template_cache
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable
+
+from deephaven.table import Table
+
+
+class TraceCache:
+    """
+    A cache of the partition of each constituent of a partitioned figure, so
+    when partitions are added or removed only the new constituents are
+    queried for their partition. The figures drawn for each constituent are
+    cached by the FigureTemplateCache.
+
+    Attributes:
+        lock: threading.Lock: The lock to use for the cache
+        partitions: dict[Any, dict[str, str] | None]: The partition of each
+          constituent, by the java table of the constituent
+        hits: int: The number of partitions reused from the cache
+        misses: int: The number of partitions retrieved
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.partitions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_partition(
+        self, table: Table, create: Callable[[], dict[str, str] | None]
+    ) -> dict[str, str] | None:
+        """
+        Get the partition of a constituent, creating it if it is not cached
+
+        Args:
+            table: The constituent table
+            create: The function that creates the partition
+
+        Returns:
+            The partition dictionary mapping column to value, or None if the
+            constituent has no rows
+        """
+        key = table.j_table
+        with self.lock:
+            if key in self.partitions:
+                self.hits += 1
+                return self.partitions[key]
+            self.misses += 1
+        partition = create()
+        if partition is not None:
+            # an empty partition might get rows, so only cache filled ones
+            with self.lock:
+                self.partitions[key] = partition
+        return partition
+
+    def retain(self, tables: list[Table]) -> None:
+        """
+        Remove the partitions of tables that are no longer constituents
+
+        Args:
+            tables: The current constituent tables
+        """
+        keep = {table.j_table for table in tables}
+        with self.lock:
+            self.partitions = {
+                key: partition
+                for key, partition in self.partitions.items()
+                if key in keep
+            }
+
+    def clear(self) -> None:
+        """
+        Remove all entries
+        """
+        with self.lock:
+            self.partitions = {}
@@ -5,3 +5,5 @@ from .DeephavenFigure import (
 from .generate import generate_figure, update_traces
 from .custom_draw import draw_ohlc, draw_candlestick, draw_density_heatmap
 from .RevisionManager import RevisionManager
+from .TraceCache import TraceCache
+from .FigureTemplateCache import FigureTemplateCache, get_figure_template_cache
@@ -13,6 +13,7 @@ from deephaven.table import Table
 from deephaven import empty_table
 
 from .DeephavenFigure import DeephavenFigure
+from .FigureTemplateCache import get_figure_template_cache, figure_template_key
 from ..data_mapping import create_data_mapping
 from ..shared import combined_generator
 
@@ -1032,11 +1033,18 @@ def generate_figure(
 
     data_cols = get_data_cols(filtered_call_args)
 
-    data_frame = construct_min_dataframe(
-        table, data_cols=merge_cols(list(data_cols.values()))
-    )
+    min_data_cols = merge_cols(list(data_cols.values()))
+
+    def draw_px_fig() -> Figure:
+        data_frame = construct_min_dataframe(table, data_cols=min_data_cols)
+        return draw(data_frame=data_frame, **filtered_call_args)
 
-    px_fig = draw(data_frame=data_frame, **filtered_call_args)
+    # the figure only depends on the draw function, the args and the column types
+    # so identical figures, such as for each partition, are only drawn once
+    px_fig = get_figure_template_cache().get_figure(
+        figure_template_key(draw, filtered_call_args, table, min_data_cols),
+        draw_px_fig,
+    )
 
     data_mapping, hover_mapping = create_data_mapping(
         data_cols, custom_call_args, table, start_index
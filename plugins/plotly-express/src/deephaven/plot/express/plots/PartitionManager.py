@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Generator, Callable
 from copy import copy
+from functools import partial
 from typing import Any, cast, Tuple, Dict
 
 import plotly.express as px
@@ -13,6 +14,7 @@ from deephaven import merge, empty_table
 
 from ._layer import atomic_layer
 from .. import DeephavenFigure
+from ..deephaven_figure import TraceCache
 from ..preprocess.Preprocessor import Preprocessor
 from ..shared import get_unique_names
 
@@ -134,6 +136,8 @@ class PartitionManager:
           passed in if already created)
         draw_figure: Callable: The function used to draw the figure
         constituents: list[Table]: The list of constituent tables
+        trace_cache: TraceCache: The cache of the partition of each
+          constituent, kept by the figure node between updates
     """
 
     def __init__(
@@ -143,6 +147,7 @@ class PartitionManager:
         groups: set[str] | None,
         marg_args: dict[str, Any] | None,
         marg_func: Callable,
+        trace_cache: TraceCache | None = None,
     ):
         self.by = None
         self.by_vars = None
@@ -171,6 +176,7 @@ class PartitionManager:
         self.partitioned_table = self.process_partitions()
         self.draw_figure = draw_figure
         self.constituents = []
+        self.trace_cache = trace_cache if trace_cache else TraceCache()
 
     def set_long_mode_variables(self) -> None:
         """
@@ -516,23 +522,33 @@ class PartitionManager:
         # sort the columns so the order is consistent
         key_columns.sort()
 
-        for table in self.constituents:
-
+        def create_partition(table: Table) -> dict[str, str] | None:
             key_column_table = dhpd.to_pandas(table.select(key_columns))
             key_column_tuples = get_partition_key_column_tuples(
                 key_column_table, key_columns
             )
 
             if len(key_column_tuples) < 1:
-                # this partition might have no data, so skip it
-                continue
+                return None
 
-            current_partition = dict(
+            return dict(
                 zip(
                     key_columns,
                     key_column_tuples[0],
                 )
             )
+
+        for table in self.constituents:
+            # the partition of a constituent never changes, so it is only
+            # retrieved the first time the constituent is seen
+            current_partition = self.trace_cache.get_partition(
+                table, partial(create_partition, table)
+            )
+
+            if current_partition is None:
+                # this partition might have no data, so skip it
+                continue
+
             yield current_partition
 
     def table_partition_generator(
@@ -623,6 +639,8 @@ class PartitionManager:
         if isinstance(self.partitioned_table, PartitionedTable):
             # lock constituents in case they are deleted
             self.constituents = [*self.partitioned_table.constituent_tables]
+            # drop the partitions of removed constituents
+            self.trace_cache.retain(self.constituents)
 
             if len(self.constituents) == 0:
                 return self.default_figure()
@@ -13,7 +13,7 @@ import deephaven.pandas as dhpd
 
 from ._layer import atomic_layer
 from .PartitionManager import PartitionManager
-from ..deephaven_figure import generate_figure, DeephavenFigure
+from ..deephaven_figure import generate_figure, DeephavenFigure, TraceCache
 from ..shared import args_copy, unsafe_figure_update_wrapper
 from ..shared.distribution_args import (
     SHARED_DEFAULTS,
@@ -177,6 +177,7 @@ def create_deephaven_figure(
     pop: list[str] | None = None,
     remap: dict[str, str] | None = None,
     px_func: Callable = lambda: None,
+    trace_cache: TraceCache | None = None,
 ) -> tuple[DeephavenFigure, Table | PartitionedTable, Table | None, dict[str, Any]]:
     """Process the provided args
 
@@ -191,6 +192,8 @@ def create_deephaven_figure(
       remap:
         A dictionary mapping of keys to keys
       px_func: the function (generally from px) to use to create the figure
+      trace_cache: The cache of the partition of each constituent, kept
+        between updates of a partitioned figure
 
     Returns:
       A tuple of the figure, the table, a table to listen to, and an
@@ -209,7 +212,7 @@ def create_deephaven_figure(
 
     draw_figure = partial(generate_figure, draw=px_func)
     partitioned = PartitionManager(
-        args, draw_figure, groups, marg_args, attach_marginals
+        args, draw_figure, groups, marg_args, attach_marginals, trace_cache
     )
 
     apply_args_groups(args, groups)
@@ -7,3 +7,4 @@ from .distribution_args import (
     STRIP_DEFAULTS,
     HISTOGRAM_DEFAULTS,
 )
+from ._json_encoding import json_dumps, json_loads
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    # orjson is much faster at encoding and decoding large figures, but is optional
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode an object as JSON, using orjson if it is installed
+
+    Args:
+      obj: The object to encode. It must only contain JSON types.
+
+    Returns:
+      The UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode JSON, using orjson if it is installed
+
+    Args:
+      data: The JSON to decode
+
+    Returns:
+      The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
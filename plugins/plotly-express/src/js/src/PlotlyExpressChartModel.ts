@@ -5,12 +5,15 @@ import Log from '@deephaven/log';
 import {
   DownsampleInfo,
   PlotlyChartWidgetData,
+  PlotlyChartWidgetMessage,
+  applyFigurePatch,
   areSameAxisRange,
   downsample,
   getDataMappings,
   getPathParts,
   getWidgetData,
   isAutoAxis,
+  isFigurePatch,
   isLineSeries,
   isLinearAxis,
   removeColorsFromData,
@@ -50,6 +53,7 @@ export class PlotlyExpressChartModel extends ChartModel {
 
     this.handleFigureUpdated = this.handleFigureUpdated.bind(this);
     this.handleWidgetUpdated = this.handleWidgetUpdated.bind(this);
+    this.handleWidgetMessage = this.handleWidgetMessage.bind(this);
 
     // Chart only fetches the model layout once on init, so it needs to be set
     // before the widget is subscribed to.
@@ -104,6 +108,11 @@ export class PlotlyExpressChartModel extends ChartModel {
    */
   tableDataMap: Map<number, { [key: string]: unknown[] }> = new Map();
 
+  /**
+   * The last figure received from the server, that figure patches are applied to.
+   */
+  widgetData?: PlotlyChartWidgetData;
+
   plotlyData: Data[] = [];
 
   layout: Partial<Layout> = {};
@@ -176,7 +185,7 @@ export class PlotlyExpressChartModel extends ChartModel {
     this.widgetUnsubscribe = this.widget.addEventListener<DhType.Widget>(
       this.dh.Widget.EVENT_MESSAGE,
       ({ detail }) => {
-        this.handleWidgetUpdated(
+        this.handleWidgetMessage(
           JSON.parse(detail.getDataAsString()),
           detail.exportedObjects
         );
@@ -223,6 +232,40 @@ export class PlotlyExpressChartModel extends ChartModel {
     };
   }
 
+  handleWidgetMessage(
+    message: PlotlyChartWidgetMessage,
+    references: DhType.Widget['exportedObjects']
+  ): void {
+    if (!isFigurePatch(message)) {
+      this.handleWidgetUpdated(message, references);
+      return;
+    }
+
+    if (
+      this.widgetData == null ||
+      this.widgetData.revision !== message.base_revision
+    ) {
+      log.warn(
+        'Figure patch does not apply to the current figure, retrieving the figure',
+        message.base_revision,
+        this.widgetData?.revision
+      );
+      // References are only sent once, so they must be tracked even if the patch is not applied
+      this.handleReferencesUpdated(
+        message.new_references,
+        message.removed_references,
+        references
+      );
+      this.widget?.sendMessage(JSON.stringify({ type: 'RETRIEVE' }), []);
+      return;
+    }
+
+    this.handleWidgetUpdated(
+      applyFigurePatch(this.widgetData, message),
+      references
+    );
+  }
+
   handleWidgetUpdated(
     data: PlotlyChartWidgetData,
     references: DhType.Widget['exportedObjects']
@@ -234,6 +277,7 @@ export class PlotlyExpressChartModel extends ChartModel {
       removed_references: removedReferences,
     } = data;
     const { plotly, deephaven } = figure;
+    this.widgetData = data;
     const { layout: plotlyLayout = {} } = plotly;
     this.tableColumnReplacementMap = getDataMappings(data);
 
@@ -246,6 +290,14 @@ export class PlotlyExpressChartModel extends ChartModel {
       );
     }
 
+    this.handleReferencesUpdated(newReferences, removedReferences, references);
+  }
+
+  handleReferencesUpdated(
+    newReferences: number[],
+    removedReferences: number[],
+    references: DhType.Widget['exportedObjects']
+  ): void {
     newReferences.forEach(async (id, i) => {
       this.tableDataMap.set(id, {}); // Plot may render while tables are being fetched. Set this to avoid a render error
       const table = (await references[i].fetch()) as DhType.Table;
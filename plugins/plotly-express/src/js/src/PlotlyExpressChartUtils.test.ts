@@ -6,6 +6,7 @@ import {
   areSameAxisRange,
   removeColorsFromData,
   getDataMappings,
+  applyFigurePatch,
   PlotlyChartWidgetData,
 } from './PlotlyExpressChartUtils';
 
@@ -52,6 +53,67 @@ describe('getDataMappings', () => {
   });
 });
 
+describe('applyFigurePatch', () => {
+  const widgetData = {
+    type: 'NEW_FIGURE',
+    figure: {
+      deephaven: {
+        mappings: [
+          { table: 0, data_columns: { x: ['/plotly/data/0/x'] } },
+          { table: 1, data_columns: { x: ['/plotly/data/1/x'] } },
+        ],
+        is_user_set_color: false,
+        is_user_set_template: false,
+      },
+      plotly: {
+        data: [{ name: 'A' }, { name: 'B' }],
+        layout: { title: 'title', showlegend: true },
+      },
+    },
+    revision: 1,
+    new_references: [0, 1],
+    removed_references: [],
+  } satisfies PlotlyChartWidgetData;
+
+  it('should apply trace, layout and mapping changes', () => {
+    const patched = applyFigurePatch(widgetData, {
+      type: 'FIGURE_PATCH',
+      patch: {
+        data: { start: 1, delete: 0, insert: [{ name: 'C' }] },
+        layout: { set: { title: 'new title' }, remove: ['showlegend'] },
+        mappings: {
+          start: 1,
+          delete: 1,
+          insert: [
+            { table: 2, data_columns: { x: ['/plotly/data/1/x'] } },
+            { table: 1, data_columns: { x: ['/plotly/data/2/x'] } },
+          ],
+        },
+        deephaven: { set: { is_user_set_color: true }, remove: [] },
+      },
+      base_revision: 1,
+      revision: 2,
+      new_references: [2],
+      removed_references: [],
+    });
+
+    expect(patched.figure.plotly.data).toEqual([
+      { name: 'A' },
+      { name: 'C' },
+      { name: 'B' },
+    ]);
+    expect(patched.figure.plotly.layout).toEqual({ title: 'new title' });
+    expect(patched.figure.deephaven.mappings.map(m => m.table)).toEqual([
+      0, 2, 1,
+    ]);
+    expect(patched.figure.deephaven.is_user_set_color).toBe(true);
+    expect(patched.revision).toBe(2);
+    expect(patched.new_references).toEqual([2]);
+    // The widget data the patch was applied to is not modified
+    expect(widgetData.figure.plotly.data).toHaveLength(2);
+  });
+});
+
 describe('removeColorsFromData', () => {
   it('should remove colors in the original colorway', () => {
     const colorway = ['red', 'green', 'blue'];
@@ -28,6 +28,108 @@ export interface PlotlyChartWidgetData {
   removed_references: number[];
 }
 
+/**
+ * Replaces the items of a list between `start` and `start + delete` with `insert`
+ */
+export interface SplicePatch<T> {
+  start: number;
+  delete: number;
+  insert: T[];
+}
+
+/**
+ * Sets and removes top level keys of an object
+ */
+export interface ObjectPatch {
+  set: Record<string, unknown>;
+  remove: string[];
+}
+
+export interface FigurePatch {
+  data?: SplicePatch<Data>;
+  layout?: ObjectPatch;
+  mappings?: SplicePatch<
+    PlotlyChartWidgetData['figure']['deephaven']['mappings'][number]
+  >;
+  deephaven?: ObjectPatch;
+}
+
+export interface PlotlyChartWidgetPatch {
+  type: 'FIGURE_PATCH';
+  patch: FigurePatch;
+  base_revision: number;
+  revision: number;
+  new_references: number[];
+  removed_references: number[];
+}
+
+export type PlotlyChartWidgetMessage =
+  | PlotlyChartWidgetData
+  | PlotlyChartWidgetPatch;
+
+export function isFigurePatch(
+  message: PlotlyChartWidgetMessage
+): message is PlotlyChartWidgetPatch {
+  return message.type === 'FIGURE_PATCH';
+}
+
+function applySplicePatch<T>(items: T[], patch?: SplicePatch<T>): T[] {
+  if (patch == null) {
+    return items;
+  }
+  const newItems = [...items];
+  newItems.splice(patch.start, patch.delete, ...patch.insert);
+  return newItems;
+}
+
+function applyObjectPatch<T extends object>(
+  object: T,
+  patch?: ObjectPatch
+): T {
+  if (patch == null) {
+    return object;
+  }
+  const newObject: Record<string, unknown> = { ...object, ...patch.set };
+  patch.remove.forEach(key => {
+    delete newObject[key];
+  });
+  return newObject as T;
+}
+
+/**
+ * Applies a figure patch to the widget data the patch was created against.
+ * The widget data is not modified.
+ *
+ * @param data The widget data with the base revision of the patch
+ * @param patch The patch message
+ * @returns The widget data with the patch applied
+ */
+export function applyFigurePatch(
+  data: PlotlyChartWidgetData,
+  patch: PlotlyChartWidgetPatch
+): PlotlyChartWidgetData {
+  const { plotly, deephaven } = data.figure;
+  const { patch: figurePatch } = patch;
+  const { mappings, ...settings } = deephaven;
+  return {
+    type: 'NEW_FIGURE',
+    figure: {
+      deephaven: {
+        ...applyObjectPatch(settings, figurePatch.deephaven),
+        mappings: applySplicePatch(mappings, figurePatch.mappings),
+      },
+      plotly: {
+        ...plotly,
+        data: applySplicePatch(plotly.data, figurePatch.data),
+        layout: applyObjectPatch(plotly.layout ?? {}, figurePatch.layout),
+      },
+    },
+    revision: patch.revision,
+    new_references: patch.new_references,
+    removed_references: patch.removed_references,
+  };
+}
+
 export function getWidgetData(
   widgetInfo: DhType.Widget
 ): PlotlyChartWidgetData {
@@ -0,0 +1,140 @@
+import json
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+
+def make_figure(traces, layout=None, is_user_set_color=False):
+    return {
+        "plotly": {
+            "data": [{"name": name} for name in traces],
+            "layout": layout if layout is not None else {"title": "title"},
+        },
+        "deephaven": {
+            "mappings": [
+                {"table": i, "data_columns": {"x": [f"/plotly/data/{i}/x"]}}
+                for i in range(len(traces))
+            ],
+            "is_user_set_template": False,
+            "is_user_set_color": is_user_set_color,
+        },
+    }
+
+
+def size(obj):
+    return len(json.dumps(obj))
+
+
+class FigurePatchTestCase(BaseTestCase):
+    def test_splice_patch(self):
+        from src.deephaven.plot.express.communication.FigurePatch import (
+            splice_patch,
+        )
+
+        self.assertIsNone(splice_patch([1, 2, 3], [1, 2, 3]))
+        self.assertEqual(
+            splice_patch([1, 2, 3], [1, 4, 2, 3]),
+            {"start": 1, "delete": 0, "insert": [4]},
+        )
+        self.assertEqual(
+            splice_patch([1, 2, 3], [1, 3]),
+            {"start": 1, "delete": 1, "insert": []},
+        )
+        self.assertEqual(
+            splice_patch([1, 1], [1, 1, 1]),
+            {"start": 2, "delete": 0, "insert": [1]},
+        )
+
+    def test_dict_patch(self):
+        from src.deephaven.plot.express.communication.FigurePatch import (
+            dict_patch,
+        )
+
+        self.assertIsNone(dict_patch({"a": 1}, {"a": 1}))
+        self.assertEqual(
+            dict_patch({"a": 1, "b": 2}, {"a": 3, "c": 4}),
+            {"set": {"a": 3, "c": 4}, "remove": ["b"]},
+        )
+
+    def test_create_figure_patch(self):
+        from src.deephaven.plot.express.communication.FigurePatch import (
+            create_figure_patch,
+        )
+
+        old_figure = make_figure(["A", "B"])
+        new_figure = make_figure(
+            ["A", "B", "C"], {"title": "new title"}, is_user_set_color=True
+        )
+
+        patch = create_figure_patch(old_figure, new_figure)
+
+        self.assertEqual(
+            patch,
+            {
+                "data": {"start": 2, "delete": 0, "insert": [{"name": "C"}]},
+                "layout": {"set": {"title": "new title"}, "remove": []},
+                "mappings": {
+                    "start": 2,
+                    "delete": 0,
+                    "insert": [
+                        {"table": 2, "data_columns": {"x": ["/plotly/data/2/x"]}}
+                    ],
+                },
+                "deephaven": {"set": {"is_user_set_color": True}, "remove": []},
+            },
+        )
+
+        self.assertEqual(create_figure_patch(new_figure, new_figure), {})
+
+    def test_is_patch_smaller(self):
+        from src.deephaven.plot.express.communication.FigurePatch import (
+            create_figure_patch,
+            is_patch_smaller,
+        )
+
+        old_figure = make_figure([str(i) for i in range(100)])
+        new_figure = make_figure([str(i) for i in range(101)])
+        patch = create_figure_patch(old_figure, new_figure)
+        self.assertTrue(is_patch_smaller(size(patch), size(new_figure)))
+
+        # a patch replacing every trace and mapping is not sent
+        new_figure = make_figure([f"new {i}" for i in range(100)])
+        for mapping in new_figure["deephaven"]["mappings"]:
+            mapping["table"] += 100
+        patch = create_figure_patch(old_figure, new_figure)
+        self.assertFalse(is_patch_smaller(size(patch), size(new_figure)))
+
+    def test_figure_patch_message(self):
+        from unittest.mock import Mock
+        from plotly.graph_objects import Figure, Scatter
+        from src.deephaven.plot.express import DeephavenFigure
+        from src.deephaven.plot.express.communication.DeephavenFigureListener import (
+            DeephavenFigureListener,
+        )
+
+        def make_dh_figure(traces):
+            return DeephavenFigure(
+                Figure([Scatter(x=[None], y=[None], name=name) for name in traces])
+            )
+
+        figure = make_dh_figure([str(i) for i in range(10)])
+        listener = DeephavenFigureListener(figure, Mock())
+
+        payload, _ = listener._build_figure_message(figure, allow_patch=True)
+        message = json.loads(payload)
+        self.assertEqual(message["type"], "NEW_FIGURE")
+        self.assertEqual(message["figure"], figure.to_dict(listener._exporter))
+
+        new_figure = make_dh_figure([str(i) for i in range(11)])
+        payload, _ = listener._build_figure_message(new_figure, 1, allow_patch=True)
+        message = json.loads(payload)
+        self.assertEqual(message["type"], "FIGURE_PATCH")
+        self.assertEqual(message["base_revision"], 0)
+        self.assertEqual(message["revision"], 1)
+        self.assertEqual(message["patch"]["data"]["start"], 10)
+        self.assertEqual(message["patch"]["data"]["insert"][0]["name"], "10")
+        listener.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
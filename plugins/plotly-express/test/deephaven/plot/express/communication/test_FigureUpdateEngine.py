@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import Mock
+
+from ..BaseTest import BaseTestCase
+
+
+class FigureUpdateEngineTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from plotly.graph_objects import Figure, Scatter
+        from src.deephaven.plot.express import DeephavenFigure
+
+        self.figure = DeephavenFigure(Figure(Scatter(x=[None], y=[None])))
+
+    def test_shared_engine(self):
+        from src.deephaven.plot.express.communication.DeephavenFigureListener import (
+            DeephavenFigureListener,
+        )
+        from src.deephaven.plot.express.communication import FigureUpdateEngine
+
+        listener1 = DeephavenFigureListener(self.figure, Mock())
+        listener2 = DeephavenFigureListener(self.figure, Mock())
+        # all the clients of a figure share one engine
+        self.assertIs(listener1._engine, listener2._engine)
+        self.assertIn(id(self.figure), FigureUpdateEngine._engines)
+
+        listener1.close()
+        self.assertIn(id(self.figure), FigureUpdateEngine._engines)
+        listener2.close()
+        self.assertNotIn(id(self.figure), FigureUpdateEngine._engines)
+
+    def test_create_outside_lock(self):
+        import threading
+        from unittest.mock import patch
+        from plotly.graph_objects import Figure
+        from src.deephaven.plot.express import DeephavenFigure
+        from src.deephaven.plot.express.communication import FigureUpdateEngine
+
+        other_figure = DeephavenFigure(Figure())
+        started = threading.Event()
+        finish = threading.Event()
+        created = []
+
+        def create_engine(figure):
+            created.append(figure)
+            if figure is self.figure:
+                started.set()
+                finish.wait(5)
+            return Mock()
+
+        engines = []
+        with patch.object(
+            FigureUpdateEngine, "FigureUpdateEngine", side_effect=create_engine
+        ):
+            threads = [
+                threading.Thread(
+                    target=lambda: engines.append(
+                        FigureUpdateEngine.subscribe(self.figure, Mock())
+                    )
+                )
+                for _ in range(2)
+            ]
+            threads[0].start()
+            self.assertTrue(started.wait(5))
+            threads[1].start()
+
+            # the engine of another figure is created while the first one is
+            other_engine = FigureUpdateEngine.subscribe(other_figure, Mock())
+            self.assertIsNotNone(other_engine)
+
+            finish.set()
+            for thread in threads:
+                thread.join(5)
+
+        # the clients of a figure share the engine, created once
+        self.assertEqual(len(engines), 2)
+        self.assertIs(engines[0], engines[1])
+        self.assertEqual(created, [self.figure, other_figure])
+        FigureUpdateEngine._engines.pop(id(self.figure))
+        FigureUpdateEngine._engines.pop(id(other_figure))
+
+    def test_fan_out(self):
+        from src.deephaven.plot.express.communication.FigureUpdateEngine import (
+            FigureUpdateEngine,
+        )
+
+        engine = FigureUpdateEngine(self.figure)
+        engine.get_figure = Mock(return_value=self.figure)
+        client1, client2 = Mock(), Mock()
+        engine.add_client(client1)
+        engine.add_client(client2)
+        # a failing client doesn't stop the others from updating
+        client1.on_figure_update.side_effect = RuntimeError("closed")
+
+        node = Mock()
+        engine._on_update(node, Mock(), False)
+
+        # the figure is recreated once for all the clients
+        node.recreate_figure.assert_called_once()
+        client1.on_figure_update.assert_called_once_with(self.figure, 1)
+        client2.on_figure_update.assert_called_once_with(self.figure, 1)
+
+        self.assertFalse(engine.remove_client(client1))
+        self.assertTrue(engine.remove_client(client2))
+        engine.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import json
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+
+class DeephavenFigureSerializationTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from plotly.graph_objects import Figure, Scatter
+        from src.deephaven.plot.express import DeephavenFigure
+
+        self.figure = DeephavenFigure(Figure(Scatter(x=[None], y=[None], name="A")))
+
+    def test_to_json(self):
+        figure_dict = self.figure.to_dict(self.exporter)
+        self.assertEqual(json.loads(self.figure.to_json(self.exporter)), figure_dict)
+        self.assertEqual(figure_dict["plotly"]["data"][0]["name"], "A")
+        self.assertEqual(
+            figure_dict["deephaven"],
+            {
+                "mappings": [],
+                "is_user_set_template": False,
+                "is_user_set_color": False,
+            },
+        )
+
+        # dictionaries returned are not shared with the cache
+        figure_dict["plotly"]["data"].clear()
+        self.assertEqual(len(self.figure.to_dict(self.exporter)["plotly"]["data"]), 1)
+
+    def test_plotly_cache(self):
+        plotly_json = self.figure.get_plotly_json()
+        self.assertIs(self.figure.get_plotly_json(), plotly_json)
+        self.assertIs(self.figure.get_plotly_dict(), self.figure.get_plotly_dict())
+
+        # retrieving the plotly figure clears the cache, as it might be modified
+        self.figure.get_plotly_fig().update_traces(name="B")
+        self.assertEqual(self.figure.get_plotly_dict()["data"][0]["name"], "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
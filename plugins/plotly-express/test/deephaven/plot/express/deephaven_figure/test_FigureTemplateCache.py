@@ -0,0 +1,77 @@
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+
+class FigureTemplateCacheTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col, double_col
+
+        self.source = new_table(
+            [
+                int_col("X", [1, 2, 3]),
+                int_col("Y", [1, 2, 3]),
+                double_col("Z", [1.0, 2.0, 3.0]),
+            ]
+        )
+
+    def test_figure_template_key(self):
+        import plotly.express as px
+        from src.deephaven.plot.express.deephaven_figure.FigureTemplateCache import (
+            figure_template_key,
+        )
+
+        key = figure_template_key(
+            px.scatter, {"x": "X", "y": "Y"}, self.source, ["X", "Y"]
+        )
+        self.assertEqual(
+            key,
+            figure_template_key(
+                px.scatter, {"y": "Y", "x": "X"}, self.source, ["X", "Y"]
+            ),
+        )
+        # the figure depends on the draw function, args and column types
+        self.assertNotEqual(
+            key,
+            figure_template_key(px.line, {"x": "X", "y": "Y"}, self.source, ["X", "Y"]),
+        )
+        self.assertNotEqual(
+            key,
+            figure_template_key(
+                px.scatter, {"x": "X", "y": "Z"}, self.source, ["X", "Z"]
+            ),
+        )
+        # args that can't be compared are not cached
+        self.assertIsNone(
+            figure_template_key(
+                px.scatter, {"x": "X", "y": "Y", "f": print}, self.source, ["X"]
+            )
+        )
+
+    def test_get_figure(self):
+        from plotly.graph_objects import Figure, Scatter
+        from src.deephaven.plot.express.deephaven_figure.FigureTemplateCache import (
+            FigureTemplateCache,
+        )
+
+        cache = FigureTemplateCache(max_size=1)
+        draw = lambda: Figure(Scatter(x=[0], y=[0]))
+
+        fig = cache.get_figure(("a",), draw)
+        fig.update_traces(name="changed")
+        # figures are copied, so changes don't modify the cache
+        self.assertNotEqual(cache.get_figure(("a",), draw).data[0].name, "changed")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # the least recently used figure is evicted
+        cache.get_figure(("b",), draw)
+        self.assertEqual(list(cache.figures.keys()), [("b",)])
+
+        # figures without a key are not cached
+        cache.get_figure(None, draw)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
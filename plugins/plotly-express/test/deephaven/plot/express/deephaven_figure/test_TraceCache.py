@@ -0,0 +1,55 @@
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+
+class TraceCacheTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col, string_col
+
+        self.source = new_table(
+            [
+                string_col("Sym", ["A", "B", "C", "A", "B", "C"]),
+                int_col("X", [1, 2, 3, 4, 5, 6]),
+                int_col("Y", [1, 2, 3, 4, 5, 6]),
+            ]
+        )
+
+    def test_reuse_partitions(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.scatter(self.source, x="X", y="Y", by="Sym")
+        expected = chart.to_dict(self.exporter)
+
+        node = chart.get_head_node().node
+        node.recreate_figure()
+        self.assertEqual(node.trace_cache.misses, 3)
+
+        # the partitions are reused, and the figure is the same
+        node.recreate_figure()
+        self.assertEqual(node.trace_cache.misses, 3)
+        self.assertEqual(node.trace_cache.hits, 3)
+        self.assertEqual(chart.to_dict(self.exporter), expected)
+
+    def test_retain(self):
+        from deephaven import empty_table
+        from src.deephaven.plot.express.deephaven_figure import TraceCache
+
+        cache = TraceCache()
+        kept, removed = empty_table(1), empty_table(2)
+        cache.get_partition(kept, lambda: {"Sym": "A"})
+        cache.get_partition(removed, lambda: {"Sym": "B"})
+
+        # the partitions of tables that are no longer constituents are dropped
+        cache.retain([kept])
+        self.assertEqual(list(cache.partitions), [kept.j_table])
+
+        # only the removed constituent is queried again
+        cache.get_partition(kept, lambda: {"Sym": "A"})
+        cache.get_partition(removed, lambda: {"Sym": "B"})
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Benchmark creating elements with the components in `deephaven.ui.components`.
+
+Creates elements with every component that can be called without arguments, or with a single child, and reports the
+throughput for each component and for all of them. Each element is created with a few props set, as components are
+when rendered.
+
+Run with `python benchmarks/element_creation_benchmark.py [--repeat N] [--top N]` from the `plugins/ui` directory.
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import timeit
+from typing import Any, Callable, Dict
+
+
+def start_server() -> None:
+    from deephaven_server.server import Server
+
+    if Server.instance is None:
+        Server(port=11000, jvm_args=["-Xmx4g"]).start()
+
+
+def get_factories() -> Dict[str, Callable[[], Any]]:
+    """
+    Get a function creating an element for each component that can be created without specific arguments.
+
+    Returns:
+        The functions creating an element, by component name.
+    """
+    from deephaven.ui import components
+    from deephaven.ui.elements import BaseElement
+
+    factories: Dict[str, Callable[[], Any]] = {}
+    for name in sorted(components.__all__):
+        component = getattr(components, name)
+        if not inspect.isfunction(component):
+            continue
+        parameters = inspect.signature(component).parameters
+        kwargs = {
+            prop: value
+            for prop, value in (
+                ("margin_top", 4),
+                ("aria_label", "label"),
+                ("UNSAFE_class_name", "row"),
+            )
+            if prop in parameters
+        }
+        for args in ((), ("child",)):
+            try:
+                if not isinstance(component(*args, **kwargs), BaseElement):
+                    break
+            except Exception:
+                continue
+            factories[
+                name
+            ] = lambda component=component, args=args, kwargs=kwargs: component(
+                *args, **kwargs
+            )
+            break
+    return factories
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=2000, help="Elements created per component"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest components shown")
+    args = parser.parse_args()
+
+    start_server()
+
+    factories = get_factories()
+    times = {
+        name: timeit.timeit(factory, number=args.repeat)
+        for name, factory in factories.items()
+    }
+    total = sum(times.values())
+    count = len(factories) * args.repeat
+
+    print(f"{len(factories)} components, {args.repeat} elements each")
+    for name, elapsed in sorted(times.items(), key=lambda item: -item[1])[: args.top]:
+        print(
+            f"{name:<24} {elapsed / args.repeat * 1e6:8.2f} us/element  {args.repeat / elapsed:10.0f} elements/s"
+        )
+    print(
+        f"{'all components':<24} {total / count * 1e6:8.2f} us/element  {count / total:10.0f} elements/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
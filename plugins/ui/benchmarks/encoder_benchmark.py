@@ -0,0 +1,119 @@
+"""
+Benchmark encoding large documents with the NodeEncoder.
+
+Compares the `json.JSONEncoder` based encoding, where every RenderedNode, callable and object goes through `default`,
+with `NodeEncoder.encode_node`, both for a new document and for a document where most nodes were reused from the
+last render.
+
+Run with `python benchmarks/encoder_benchmark.py [--nodes N] [--repeat N]` from the `plugins/ui` directory.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+
+def start_server() -> None:
+    from deephaven_server.server import Server
+
+    if Server.instance is None:
+        Server(port=11000, jvm_args=["-Xmx4g"]).start()
+
+
+class BenchmarkObject:
+    """
+    An object that is exported to the client.
+    """
+
+
+def make_row(index: int):
+    from deephaven.ui.renderer import RenderedNode
+
+    return RenderedNode(
+        "deephaven.ui.components.Flex",
+        {
+            "direction": "row",
+            "children": [
+                RenderedNode(
+                    "deephaven.ui.components.Text", {"children": f"Row {index}"}
+                ),
+                RenderedNode(
+                    "deephaven.ui.components.Button",
+                    {"children": "Press", "onPress": lambda e: None},
+                ),
+                RenderedNode(
+                    "deephaven.ui.components.Slider",
+                    {"value": index * 0.5, "minValue": 0, "maxValue": 100},
+                ),
+                BenchmarkObject(),
+            ],
+        },
+    )
+
+
+def make_document(rows: list):
+    from deephaven.ui.renderer import RenderedNode
+
+    return RenderedNode("deephaven.ui.components.Flex", {"children": rows})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=2000, help="Rows in the document")
+    parser.add_argument("--repeat", type=int, default=20, help="Encodes to time")
+    parser.add_argument(
+        "--changed", type=float, default=0.1, help="Fraction of rows changed per render"
+    )
+    args = parser.parse_args()
+
+    start_server()
+
+    from deephaven.ui.renderer import NodeEncoder
+
+    rows = [make_row(i) for i in range(args.nodes)]
+    changed = max(1, int(args.nodes * args.changed))
+    document = make_document(rows)
+
+    def next_document():
+        # Re-render a fraction of the rows, reusing the others as the renderer does for unchanged components
+        for i in range(changed):
+            rows[i] = make_row(i)
+        return make_document(list(rows))
+
+    size = len(NodeEncoder(separators=(",", ":")).encode_node(document)["encoded_node"])
+    print(
+        f"Document: {args.nodes} rows, {size} bytes, {changed} rows changed per render"
+    )
+
+    json_encoder = NodeEncoder(separators=(",", ":"))
+    json_time = timeit.timeit(
+        lambda: json.JSONEncoder.encode(json_encoder, document), number=args.repeat
+    )
+
+    cold_time = timeit.timeit(
+        lambda: NodeEncoder(separators=(",", ":")).encode_node(document),
+        number=args.repeat,
+    )
+
+    encoder = NodeEncoder(separators=(",", ":"))
+    encoder.encode_node(document)
+    documents = [next_document() for _ in range(args.repeat)]
+    documents_iter = iter(documents)
+    reuse_time = timeit.timeit(
+        lambda: encoder.encode_node(next(documents_iter)), number=args.repeat
+    )
+
+    for name, total in (
+        ("json.JSONEncoder default", json_time),
+        ("encode_node new document", cold_time),
+        ("encode_node reused nodes", reuse_time),
+    ):
+        per_encode = total / args.repeat
+        print(
+            f"{name:<26} {per_encode * 1000:8.2f} ms/encode  {size / per_encode / 1e6:8.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark the memory used by mounted components.
+
+Renders a list of components, with no hooks and with a few hooks, and reports the Python heap retained per mounted
+component, measured with `tracemalloc`. Includes the RenderContext of each component, its state and its rendered
+node.
+
+Run with `python benchmarks/render_context_memory_benchmark.py [--components N]` from the `plugins/ui` directory.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+
+def start_server() -> None:
+    from deephaven_server.server import Server
+
+    if Server.instance is None:
+        Server(port=11000, jvm_args=["-Xmx4g"]).start()
+
+
+def make_components():
+    from deephaven import ui
+
+    @ui.component
+    def leaf(index: int):
+        return ui.text(f"Row {index}")
+
+    @ui.component
+    def stateful(index: int):
+        value, set_value = ui.use_state(index)
+        ref = ui.use_ref(None)
+        on_press = ui.use_callback(lambda: set_value(value + 1), [value])
+        return ui.button(f"Row {value}", on_press=on_press)
+
+    return {"no hooks": leaf, "3 hooks": stateful}
+
+
+def measure(component, count: int) -> int:
+    """
+    Render a list of components and measure the memory retained.
+
+    Args:
+        component: The component to render in the list.
+        count: The number of components to render.
+
+    Returns:
+        The number of bytes retained by the rendered list.
+    """
+    from deephaven import ui
+    from deephaven.ui._internal import RenderContext
+    from deephaven.ui.renderer import Renderer
+
+    @ui.component
+    def root():
+        return ui.flex([component(i, key=str(i)) for i in range(count)])
+
+    element = root()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    context = RenderContext(lambda update: update(), lambda update: update())
+    renderer = Renderer(context)
+    node = renderer.render(element)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    context.unmount()
+    del node, renderer, context
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--components", type=int, default=10000, help="Components in the list"
+    )
+    args = parser.parse_args()
+
+    start_server()
+
+    print(f"{args.components} mounted components")
+    for name, component in make_components().items():
+        # Render once first so lazily created module state isn't counted
+        measure(component, 10)
+        retained = measure(component, args.components)
+        print(
+            f"{name:<10} {retained / args.components:8.0f} bytes/component  {retained / 1e6:8.1f} MB total"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,3 +8,34 @@ from .components import *
 from .elements import *
 from .hooks import *
 from .object_types import *
+from .renderer.RenderMetrics import (
+    Histogram,
+    RenderMetrics,
+    get_render_metrics,
+    render_metrics_table,
+)
+from .object_types.ReconnectCache import (
+    ReconnectCacheMetrics,
+    configure_reconnect_cache,
+    get_reconnect_cache_metrics,
+)
+from ._internal.RenderScheduler import (
+    RenderSchedulerMetrics,
+    configure_render_scheduler,
+    get_render_scheduler_metrics,
+)
+from ._internal.TempCallableRegistry import (
+    TempCallableMetrics,
+    configure_temp_callables,
+    get_temp_callable_metrics,
+)
+from ._internal.TableOpCache import (
+    TableOpCacheMetrics,
+    get_table_op_cache_metrics,
+)
+from ._internal.UpdateThrottle import (
+    UpdateThrottleMetrics,
+    get_default_max_update_rate,
+    get_update_throttle_metrics,
+    set_default_max_update_rate,
+)
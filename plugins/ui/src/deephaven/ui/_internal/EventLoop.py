@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import threading
+from typing import Any, Coroutine, Generator, TypeVar
+
+from deephaven.execution_context import ExecutionContext, get_exec_ctx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _ContextCoroutine:
+    """
+    Awaitable that runs each step of a coroutine in an ExecutionContext.
+    The event loop thread runs coroutines from many elements in turn, so the context can't be entered once for the
+    whole coroutine, only around each step between awaits.
+    """
+
+    def __init__(self, coro: Coroutine[Any, Any, T], exec_ctx: ExecutionContext):
+        """
+        Wrap a coroutine.
+
+        Args:
+            coro: The coroutine to run.
+            exec_ctx: The context to run each step in.
+        """
+        self._coro = coro
+        self._exec_ctx = exec_ctx
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            try:
+                with self._exec_ctx:
+                    if error is not None:
+                        yielded = self._coro.throw(error)
+                    else:
+                        yielded = self._coro.send(value)
+            except StopIteration as e:
+                return e.value
+            try:
+                value = yield yielded
+                error = None
+            except Exception as e:
+                # Thrown into the awaiting task, pass it on to the coroutine to handle
+                value = None
+                error = e
+            except asyncio.CancelledError as e:
+                # The task is cancelled. Let the coroutine clean up as it would when cancelled, but finish the task as
+                # cancelled even if the coroutine catches the error or awaits again.
+                with self._exec_ctx:
+                    try:
+                        self._coro.throw(e)
+                    except (StopIteration, asyncio.CancelledError):
+                        pass
+                    finally:
+                        self._coro.close()
+                raise
+            except BaseException:
+                # GeneratorExit when the awaiting task is closed, close the coroutine so its cleanup runs
+                with self._exec_ctx:
+                    self._coro.close()
+                raise
+
+
+class EventLoop:
+    """
+    An asyncio event loop owned by the plugin, running on its own daemon thread. Runs the coroutines returned by
+    `async def` event handlers and effects, so they can wait on I/O without blocking the render thread.
+    """
+
+    def __init__(self, name: str = "deephaven.ui-event-loop"):
+        """
+        Create an event loop. The thread is started when the first coroutine is run.
+
+        Args:
+            name: The name of the thread running the loop.
+        """
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the asyncio loop, starting its thread if it is not running yet.
+
+        Returns:
+            The asyncio loop.
+        """
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name=self._name, daemon=True
+                )
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def is_loop_thread(self) -> bool:
+        """
+        Check if the current thread is the thread running the loop.
+
+        Returns:
+            True if called from a coroutine or callback running on the loop.
+        """
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run_coroutine(
+        self, coro: Coroutine[Any, Any, T]
+    ) -> concurrent.futures.Future[T]:
+        """
+        Run a coroutine on the loop. Each step of the coroutine runs in the ExecutionContext of the caller.
+        Exceptions raised by the coroutine are logged, as well as set on the future returned.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            A future for the result of the coroutine, which can be cancelled.
+        """
+        exec_ctx = get_exec_ctx()
+
+        async def run() -> T:
+            return await _ContextCoroutine(coro, exec_ctx)
+
+        future = asyncio.run_coroutine_threadsafe(run(), self._get_loop())
+        future.add_done_callback(_log_exception)
+        return future
+
+
+def _log_exception(future: concurrent.futures.Future[Any]) -> None:
+    """
+    Log the exception raised by a coroutine, if any.
+
+    Args:
+        future: The future of the coroutine.
+    """
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(
+            "Error in async event handler or effect",
+            exc_info=future.exception(),
+        )
+
+
+def is_coroutine(value: Any) -> bool:
+    """
+    Check if a value is a coroutine, such as the result of calling an `async def` function.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        True if the value is a coroutine.
+    """
+    return inspect.iscoroutine(value)
+
+
+_event_loop = EventLoop()
+
+
+def get_event_loop() -> EventLoop:
+    """
+    Get the event loop that runs async event handlers and effects.
+
+    Returns:
+        The event loop.
+    """
+    return _event_loop
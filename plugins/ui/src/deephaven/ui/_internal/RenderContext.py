@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import threading
 import logging
+import weakref
 from typing import (
     Any,
     Callable,
@@ -10,13 +11,16 @@ from typing import (
     Optional,
     Tuple,
     TypeVar,
+    NamedTuple,
     Union,
     Generator,
     Generic,
     cast,
 )
 from functools import partial
+from types import MappingProxyType
 from deephaven import DHError
+from deephaven._wrapper import JObjectWrapper
 from deephaven.liveness_scope import LivenessScope
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -75,13 +79,56 @@ A function that performs an effect.
 class ValueWithLiveness(Generic[T]):
     """A value with an associated liveness scope, if any."""
 
+    __slots__ = ("value", "liveness_scope")
+
     value: T
     liveness_scope: Union[LivenessScope, None]
 
 
-ContextState = Dict[StateKey, ValueWithLiveness[Any]]
+class CachedRender(NamedTuple):
+    """The result of the last successful render of an element in a context."""
+
+    element: Any
+    """The element that was rendered."""
+
+    props: Any
+    """The props returned by the element before its children were rendered."""
+
+    result: Any
+    """The rendered result of the element."""
+
+
+ContextState = List[Any]
+"""
+The state for a context, indexed by the hook index. Each slot holds the value, a ValueWithLiveness if the value has
+a liveness scope, or _UNSET if the hook has no state.
+"""
+
+_UNSET: Any = object()
+"""
+Marker for a slot in the state of a context that is not initialized.
+"""
+
+_EMPTY_DICT: Any = MappingProxyType({})
+"""
+Shared read-only empty dict, used by contexts instead of allocating an empty dict for each collection they do not use.
+Replaced by a dict the first time something is added.
+"""
+
+_EMPTY_SET: Any = frozenset()
+"""
+Shared read-only empty set, used by contexts instead of allocating an empty set for each collection they do not use.
+"""
+
+_EMPTY_LIST: Any = ()
+"""
+Shared read-only empty list, used by contexts instead of allocating an empty list for each collection they do not
+use.
+"""
+
+_EMPTY_EXPORTED_STATE: ExportedRenderState = {}
 """
-The state for a context.
+Shared exported state of contexts with no state to export. Exported state must not be modified.
 """
 
 ExportedRenderState = Dict[str, Any]
@@ -90,38 +137,75 @@ The serializable state of a RenderContext. Used to serialize the state for the c
 """
 
 
-def _value_or_call(
-    value: T | None | Callable[[], T | None]
-) -> ValueWithLiveness[T | None]:
+def _value_or_call(value: T | None | Callable[[], T | None]) -> Any:
     """
-    Creates a wrapper around the value, or invokes a callable to hold the value and the liveness scope
-    creates while obtaining that value.
+    Gets the state slot for the value, or invokes a callable and wraps the value with the liveness scope
+    created while obtaining that value.
+    Values without a liveness scope are stored as is, so they do not need a wrapper.
 
     Args:
         value: a value, or callable that will produce a value
 
     Returns:
-        The resulting value, plus a liveness scope, if any.
+        The value, or the resulting value plus a liveness scope.
     """
     if callable(value):
         scope = LivenessScope()
         with scope.open():
             value = value()
         return ValueWithLiveness(value=value, liveness_scope=scope)
-    return ValueWithLiveness(value=value, liveness_scope=None)
+    return value
+
+
+def value_with_liveness(value: T) -> Any:
+    """
+    Gets the state slot for a value set with a state setter. If the value is a liveness referent, such as a table,
+    it is managed by a new liveness scope. The scope it was created in, e.g. the scope of an event handler, may be
+    released before the state update is applied and the next render manages the value.
+    Slots that already have a liveness scope are returned as is.
+
+    Args:
+        value: the value to set
+
+    Returns:
+        The value, or the value plus the liveness scope managing it.
+    """
+    if not isinstance(value, JObjectWrapper):
+        return value
+    scope = LivenessScope()
+    try:
+        scope.manage(value)
+    except DHError:
+        # Not a liveness referent, nothing to manage
+        scope.release()
+        return value
+    return ValueWithLiveness(value=value, liveness_scope=scope)
 
 
-def _should_retain_value(value: ValueWithLiveness[T | None]) -> bool:
+def _get_slot_value(slot: Any) -> Any:
     """
-    Determine if the given value should be retained by the current context.
+    Get the value held in a state slot.
 
     Args:
-        value: The value to check.
+        slot: The state slot.
+
+    Returns:
+        The value of the slot.
+    """
+    return slot.value if isinstance(slot, ValueWithLiveness) else slot
+
+
+def _should_retain_value(slot: Any) -> bool:
+    """
+    Determine if the value in the given state slot should be retained by the current context.
+
+    Args:
+        slot: The state slot to check.
 
     Returns:
         True if the value should be retained, False otherwise.
     """
-    return value.liveness_scope is None and isinstance(value.value, (str, int, float))
+    return isinstance(slot, (str, int, float))
 
 
 _local_data = threading.local()
@@ -162,7 +246,31 @@ class RenderContext:
     """
     Context for rendering a component. Keeps track of state and child contexts.
     Used by hooks to get and set state.
-    """
+
+    A context is created for every component mounted, so it is kept compact: attributes are slots, collections that
+    are not used share a read-only empty instance until something is added, and the state is a list indexed by hook.
+    """
+
+    __slots__ = (
+        "_hook_index",
+        "_hook_count",
+        "_state",
+        "_children_context",
+        "_on_change",
+        "_on_queue_render",
+        "_top_level_scope",
+        "_collected_scopes",
+        "_collected_effects",
+        "_collected_unmount_listeners",
+        "_collected_contexts",
+        "_is_mounted",
+        "_parent",
+        "_is_dirty",
+        "_has_dirty_descendant",
+        "_cached_render",
+        "_exported_state",
+        "__weakref__",
+    )
 
     _hook_index: int
     """
@@ -189,15 +297,21 @@ class RenderContext:
     The on_change callback to call when the context changes.
     """
 
+    _on_queue_render: OnChangeCallable
+    """
+    The callback to call when work is being requested for the render loop.
+    """
+
     _top_level_scope: LivenessScope | None
     """
     Liveness scope that captures objects directly created in the FunctionElement. Will only be non-None when the context manager is open.
     """
 
-    _collected_scopes: set[LivenessScope]
+    _collected_scopes: set[LivenessScope] | Tuple[LivenessScope, ...]
     """
     Liveness scopes currently owned by this RenderContext. If currently open and rendering, this will be a fresh set,
     representing the new rendered state.
+    Most contexts only own their top level scope, so it is a tuple until another scope is added.
     """
 
     _collected_effects: List[Tuple[RenderCleanup, RenderEffect]]
@@ -206,17 +320,19 @@ class RenderContext:
     When the current render cycle is complete, first it will call all the cleanup functions in the set, then it will call all the effect functions.
     """
 
-    _collected_unmount_listeners: List[Callable[[], None]]
+    _collected_unmount_listeners: Dict[Callable[[], None], None]
     """
     Unmount listeners currently owned by this RenderContext. If currently open and rendering, this will be a fresh set,
     representing the new rendered state.
     When the context is deleted or unmounted, it will call all the listeners in this set.
+    Stored as the keys of a dict, so checking if a listener is still used is constant time and the order is kept.
     """
 
-    _collected_contexts: List[ContextKey]
+    _collected_contexts: Dict[ContextKey, None]
     """
     Child contexts currently owned by this RenderContext. If currently open and rendering, this will be a fresh set,
     representing the new rendered state.
+    Stored as the keys of a dict, so checking if a child is still used is constant time and the order is kept.
     """
 
     _is_mounted: bool
@@ -224,32 +340,68 @@ class RenderContext:
     Flag to indicate if this context is mounted. It is unusable after being unmounted.
     """
 
-    def __init__(self, on_change: OnChangeCallable, on_queue_render: OnChangeCallable):
+    _parent: weakref.ref[RenderContext] | None
+    """
+    Weak reference to the parent context, or None if this is a root context.
+    """
+
+    _is_dirty: bool
+    """
+    Whether the state of this context has changed since it was last successfully rendered.
+    """
+
+    _has_dirty_descendant: bool
+    """
+    Whether the state of any descendant context has changed since this context was last successfully rendered.
+    """
+
+    _cached_render: CachedRender | None
+    """
+    The last successful render of an element in this context, if any.
+    """
+
+    _exported_state: ExportedRenderState | None
+    """
+    The exported state of this context and its descendants, or None if it has changed since it was last exported.
+    If it is None, it is also None for all ancestors.
+    """
+
+    def __init__(
+        self,
+        on_change: OnChangeCallable,
+        on_queue_render: OnChangeCallable,
+        parent: RenderContext | None = None,
+    ):
         """
         Create a new render context.
 
         Args:
             on_change: The callback to call when the state in the context has changes.
             on_queue_render: The callback to call when work is being requested for the render loop.
+            parent: The parent context, if this is a child context.
         """
 
         self._hook_index = _READY_TO_OPEN
         self._hook_count = -1
-        self._state = {}
-        self._children_context = {}
+        self._state = _EMPTY_LIST
+        self._children_context = _EMPTY_DICT
         self._on_change = on_change
         self._on_queue_render = on_queue_render
-        self._collected_scopes = set()
-        self._collected_effects = []
-        self._collected_unmount_listeners = []
-        self._collected_contexts = []
+        self._collected_scopes = _EMPTY_SET
+        self._collected_effects = _EMPTY_LIST
+        self._collected_unmount_listeners = _EMPTY_DICT
+        self._collected_contexts = _EMPTY_DICT
         self._top_level_scope = None
         self._is_mounted = True
+        self._parent = weakref.ref(parent) if parent is not None else None
+        self._is_dirty = False
+        self._has_dirty_descendant = False
+        self._cached_render = None
+        self._exported_state = _EMPTY_EXPORTED_STATE
 
     def __del__(self):
         logger.debug("Deleting context")
-        for scope in self._collected_scopes:
-            scope.release()
+        # Unmounting releases the liveness scopes of the last render
         if self._is_mounted:
             self.unmount()
 
@@ -284,18 +436,18 @@ class RenderContext:
         # Keep a reference to old liveness scopes, and make a collection to track our new ones
         old_liveness_scopes = self._collected_scopes
         self._top_level_scope = LivenessScope()
-        self._collected_scopes = {self._top_level_scope}
+        self._collected_scopes = (self._top_level_scope,)
 
         # Reset the after render listeners. No need to retain the old ones.
-        self._collected_effects = []
+        self._collected_effects = _EMPTY_LIST
 
         # Keep a reference to old unmount listeners, and make a collection to track our new ones
         old_unmount_listeners = self._collected_unmount_listeners
-        self._collected_unmount_listeners = []
+        self._collected_unmount_listeners = _EMPTY_DICT
 
         # Keep a reference to old child contexts, and make a collection to track our new ones
         old_contexts = self._collected_contexts
-        self._collected_contexts = []
+        self._collected_contexts = _EMPTY_DICT
 
         try:
             with self._top_level_scope.open():
@@ -322,19 +474,23 @@ class RenderContext:
             # Then, release all leftover scopes that are no longer referenced - we always release after creating new
             # ones, so that each reused object's refcount goes from 1 -> 2 -> 1, instead of 1 -> 0 -> 1 which would
             # release the object prematurely.
-            old_liveness_scopes -= self._collected_scopes
             for scope in old_liveness_scopes:
-                scope.release()
+                if scope not in self._collected_scopes:
+                    scope.release()
 
             # If this is the first time (and successful), record the hook count
             hook_count = self._hook_index + 1
             if self._hook_count < 0:
                 self._hook_count = hook_count
+
+            # Everything in this context and below has been rendered with the latest state
+            self._is_dirty = False
+            self._has_dirty_descendant = False
         except Exception as e:
             # An error occurred at some point when executing the FunctionElement - we don't know what parts of the
             # function were successful, so also keep around old liveness scopes, they'll be cleared after the next
             # successful render.
-            self._collected_scopes |= old_liveness_scopes
+            self._collected_scopes = {*self._collected_scopes, *old_liveness_scopes}
 
             # re-raise the exception
             raise e
@@ -351,7 +507,7 @@ class RenderContext:
             self._top_level_scope = None
 
             # Reset the after render listeners. No need to retain the old ones.
-            self._collected_effects = []
+            self._collected_effects = _EMPTY_LIST
 
         if self._hook_count != hook_count:
             # It isn't ideal to throw this anywhere - but this speaks to a malformed component, and there is no
@@ -385,41 +541,58 @@ class RenderContext:
         """
         Check if the given key is in the state.
         """
-        return key in self._state
+        return key < len(self._state) and self._state[key] is not _UNSET
 
     def get_state(self, key: StateKey) -> Any:
         """
         Get the state for the given key.
         """
         self._assert_active()
-        wrapper = self._state[key]
+        if not self.has_state(key):
+            raise KeyError(key)
+        slot = self._state[key]
 
         # This value (and any objects created when this value was created) must be retained by the current context,
         # and will be released when no longer used.
-        if wrapper.liveness_scope:
-            self.manage(wrapper.liveness_scope)
+        if isinstance(slot, ValueWithLiveness) and slot.liveness_scope:
+            self.manage(slot.liveness_scope)
         else:
             try:
                 if self._top_level_scope is None:
                     raise RuntimeError(
                         "RenderContext.get_state() called when RenderContext not opened"
                     )
-                self._top_level_scope.manage(wrapper.value)
+                self._top_level_scope.manage(_get_slot_value(slot))
             except DHError:
                 # Ignore, we just won't manage this instance
                 pass
 
-        return wrapper.value
+        return _get_slot_value(slot)
+
+    def _set_slot(self, key: StateKey, slot: Any) -> None:
+        """
+        Set the state slot for the given key, growing the state if needed.
+
+        Args:
+            key: The key to set the slot for.
+            slot: The slot to set.
+        """
+        if self._state is _EMPTY_LIST:
+            self._state = []
+        if key >= len(self._state):
+            self._state.extend([_UNSET] * (key + 1 - len(self._state)))
+        self._state[key] = slot
 
     def init_state(self, key: StateKey, value: T | InitializerFunction[T]) -> None:
         """
         Set the initial state for the given key. Will throw if the key has already been set.
         """
-        if key in self._state:
+        if self.has_state(key):
             raise KeyError(f"Key {key} is already initialized")
 
         # Just set the key value, we don't need to trigger an on_change or anything special on initialization
-        self._state[key] = _value_or_call(value)
+        self._set_slot(key, _value_or_call(value))
+        self._invalidate_exported_state()
 
     def set_state(self, key: StateKey, value: T | UpdaterFunction[T]) -> None:
         """
@@ -427,39 +600,71 @@ class RenderContext:
 
         Args:
             key: The key to set the state for.
-            value: The value to set the state to. Can be a callable that takes the old value and returns the new value.
+            value: The value to set the state to. Can be a callable that takes the old value and returns the new value,
+                or a slot from `value_with_liveness`.
         """
-        if key not in self._state:
+        if not self.has_state(key):
             raise KeyError(f"Key {key} not initialized")
 
+        # Manage the value right away, the scope it was created in may be released before the update is applied
+        slot = value if callable(value) else value_with_liveness(value)
+
         # We queue up the state change in a callable that will get called from the render loop
         def update_state():
-            if callable(value):
-                old_value = self._state[key].value
-                new_value = _value_or_call(partial(value, old_value))
+            old_slot = self._state[key]
+            if callable(slot):
+                new_value = _value_or_call(partial(slot, _get_slot_value(old_slot)))
             else:
-                new_value = _value_or_call(value)
+                new_value = slot
+            self._release_unrendered(old_slot)
             logger.debug("Setting state %s to %s in %s", key, new_value, self)
             self._state[key] = new_value
+            self._mark_dirty()
+            self._invalidate_exported_state()
 
         # This is not the initial state, queue up the state change on the render loop
         self._on_change(update_state)
 
+    def _release_unrendered(self, slot: Any) -> None:
+        """
+        Release the liveness scope of a state slot being replaced, if no render has managed it yet.
+        Scopes managed by the last render are released after the next render instead.
+
+        Args:
+            slot: The state slot being replaced.
+        """
+        if (
+            isinstance(slot, ValueWithLiveness)
+            and slot.liveness_scope is not None
+            and slot.liveness_scope.j_scope not in self._collected_scopes
+        ):
+            slot.liveness_scope.release()
+
     def get_child_context(self, key: ContextKey) -> "RenderContext":
         """
         Get the child context for the given key.
         """
         logger.debug("Getting child context for key %s", key)
         if key not in self._children_context:
-            child_context = RenderContext(self._on_change, self._on_queue_render)
+            child_context = RenderContext(self._on_change, self._on_queue_render, self)
             logger.debug(
                 "Created new child context %s for key %s in %s",
                 child_context,
                 key,
                 self,
             )
+            if self._children_context is _EMPTY_DICT:
+                self._children_context = {}
             self._children_context[key] = child_context
-        self._collected_contexts.append(key)
+        elif key in self._collected_contexts:
+            logger.warning(
+                "Duplicate key %s in %s, children with the same key share the same state",
+                key,
+                self,
+            )
+        if self._collected_contexts is _EMPTY_DICT:
+            self._collected_contexts = {}
+        self._collected_contexts[key] = None
         return self._children_context[key]
 
     def delete_child_context(self, key: ContextKey) -> None:
@@ -468,6 +673,113 @@ class RenderContext:
         """
         self._children_context[key].unmount()
         del self._children_context[key]
+        self._invalidate_exported_state()
+
+    def set_callbacks(
+        self, on_change: OnChangeCallable, on_queue_render: OnChangeCallable
+    ) -> None:
+        """
+        Replace the callbacks of this context and all its descendants, e.g. to move the context to another render loop.
+
+        Args:
+            on_change: The callback to call when the state in the context has changes.
+            on_queue_render: The callback to call when work is being requested for the render loop.
+        """
+        self._on_change = on_change
+        self._on_queue_render = on_queue_render
+        for context in self._children_context.values():
+            context.set_callbacks(on_change, on_queue_render)
+
+    def _mark_dirty(self) -> None:
+        """
+        Mark this context as dirty, and all its ancestors as having a dirty descendant.
+        """
+        self._is_dirty = True
+        parent = self._parent() if self._parent is not None else None
+        while parent is not None and not parent._has_dirty_descendant:
+            parent._has_dirty_descendant = True
+            parent = parent._parent() if parent._parent is not None else None
+
+    def _invalidate_exported_state(self) -> None:
+        """
+        Clear the exported state of this context and all its ancestors, so it is exported again on the next export.
+        """
+        context: RenderContext | None = self
+        while context is not None and context._exported_state is not None:
+            context._exported_state = None
+            context = context._parent() if context._parent is not None else None
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether the state of this context has changed since it was last rendered.
+        """
+        return self._is_dirty
+
+    @property
+    def has_dirty_descendant(self) -> bool:
+        """
+        Whether the state of any descendant of this context has changed since it was last rendered.
+        """
+        return self._has_dirty_descendant
+
+    def get_cached_render(self) -> CachedRender | None:
+        """
+        Get the last successful render of an element in this context.
+
+        Returns:
+            The element, its props and the rendered result, or None if nothing has been rendered yet.
+        """
+        return self._cached_render
+
+    def set_cached_render(self, element: Any, props: Any, result: Any) -> None:
+        """
+        Store the element rendered in this context and the result of rendering it, so it can be reused if the
+        element is rendered again and no state in this context or its descendants has changed.
+
+        Args:
+            element: The element that was rendered.
+            props: The props returned by the element, before its children were rendered.
+            result: The result of rendering the element.
+        """
+        self._cached_render = CachedRender(element, props, result)
+
+    @contextmanager
+    def open_children(self) -> Generator[RenderContext, None, None]:
+        """
+        Opens this context to render its child contexts again without rendering this context itself.
+        The hooks, liveness scopes, effects and unmount listeners from the last render are kept as is.
+        Used when the state of this context has not changed, but the state of a descendant has.
+
+        This is not reentrant and not safe across threads, and cannot be used while the context is open.
+
+        Returns:
+            A context manager to manage RenderContext resources.
+        """
+        self._assert_mounted()
+
+        if self._hook_index != _READY_TO_OPEN or self._top_level_scope is not None:
+            raise RuntimeError(
+                "RenderContext.open_children() called while RenderContext is open"
+            )
+
+        # Keep a reference to old child contexts, and make a collection to track our new ones
+        old_contexts = self._collected_contexts
+        self._collected_contexts = _EMPTY_DICT
+
+        try:
+            yield self
+
+            # Release all child contexts that are no longer referenced
+            for context_key in old_contexts:
+                if context_key not in self._collected_contexts:
+                    self.delete_child_context(context_key)
+
+            self._has_dirty_descendant = False
+        except Exception as e:
+            # Keep the old child contexts around, they'll be cleaned up after the next successful render
+            self._collected_contexts = old_contexts
+            raise e
 
     def next_hook_index(self) -> int:
         """
@@ -493,8 +805,21 @@ class RenderContext:
             liveness_scope: the new LivenessScope to track
         """
         self._assert_active()
+        if not isinstance(self._collected_scopes, set):
+            self._collected_scopes = set(self._collected_scopes)
         self._collected_scopes.add(cast(LivenessScope, liveness_scope.j_scope))
 
+    def retain(self, j_referent: Any) -> None:
+        """
+        Hold a reference to a Java liveness referent shared with other contexts until the end of the next
+        successful open() call. Unlike `manage`, the referent itself is not released by this context, only the
+        reference held by the liveness scope of this render. This RenderContext must be open to call this method.
+        Args:
+            j_referent: the Java liveness referent to hold, e.g. the Java object of a LivenessScope
+        """
+        self._assert_active()
+        cast(LivenessScope, self._top_level_scope).manage(j_referent)
+
     def add_effect(self, cleanup: RenderCleanup, effect: RenderEffect) -> None:
         """
         Add an effect for after this context is rendered.
@@ -504,6 +829,8 @@ class RenderContext:
             effect: the new effect to run.
         """
         self._assert_active()
+        if self._collected_effects is _EMPTY_LIST:
+            self._collected_effects = []
         self._collected_effects.append((cleanup, effect))
 
     def add_unmount_listener(self, listener: Callable[[], None]) -> None:
@@ -514,22 +841,29 @@ class RenderContext:
             listener: the new listener to track
         """
         self._assert_active()
-        self._collected_unmount_listeners.append(listener)
+        if self._collected_unmount_listeners is _EMPTY_DICT:
+            self._collected_unmount_listeners = {}
+        self._collected_unmount_listeners[listener] = None
 
     def export_state(self) -> ExportedRenderState:
         """
         Export the state of this context. This is used to serialize the state for the client.
+        The export is cached until the state of this context or a descendant changes, so unchanged contexts return
+        the same instance they did on the last export. The returned state must not be modified.
 
         Returns:
             The exported serializable state of this context.
         """
+        if self._exported_state is not None:
+            return self._exported_state
+
         exported_state: ExportedRenderState = {}
 
         # We need to iterate through all of our state and export anything that doesn't have a LivenessScope right now (anything serializable)
         def retained_values(state: ContextState):
-            for key, value in state.items():
-                if _should_retain_value(value):
-                    yield key, value.value
+            for key, slot in enumerate(state):
+                if _should_retain_value(slot):
+                    yield key, slot
 
         if len(state := dict(retained_values(self._state))) > 0:
             exported_state["state"] = state
@@ -543,7 +877,10 @@ class RenderContext:
         if len(children_state := dict(retained_children(self._children_context))) > 0:
             exported_state["children"] = children_state
 
-        return exported_state
+        self._exported_state = (
+            exported_state if len(exported_state) > 0 else _EMPTY_EXPORTED_STATE
+        )
+        return self._exported_state
 
     def import_state(self, state: dict[str, Any]) -> None:
         """
@@ -552,14 +889,14 @@ class RenderContext:
         Args:
             state: The state to import.
         """
-        self._state.clear()
-        self._children_context.clear()
+        self._state = _EMPTY_LIST
+        self._children_context = _EMPTY_DICT
+        self._cached_render = None
+        self._invalidate_exported_state()
         if "state" in state:
             for key, value in state["state"].items():
                 # When python dict is converted to JSON, all keys are converted to strings. We convert them back to int here.
-                self._state[int(key)] = ValueWithLiveness(
-                    value=value, liveness_scope=None
-                )
+                self._set_slot(int(key), value)
         if "children" in state:
             for key, child_state in state["children"].items():
                 self.get_child_context(key).import_state(child_state)
@@ -579,12 +916,17 @@ class RenderContext:
         for listener in self._collected_unmount_listeners:
             listener()
 
+        # Release the liveness scopes of the last render, so the objects they hold are released with this context
+        for scope in self._collected_scopes:
+            scope.release()
+
         # Clear all our children states so we don't hold a reference to anything.
         self._hook_index = _READY_TO_OPEN
         self._hook_count = -1
-        self._state.clear()
-        self._children_context.clear()
-        self._collected_scopes.clear()
-        self._collected_effects.clear()
-        self._collected_unmount_listeners.clear()
-        self._collected_contexts.clear()
+        self._state = _EMPTY_LIST
+        self._children_context = _EMPTY_DICT
+        self._collected_scopes = _EMPTY_SET
+        self._collected_effects = _EMPTY_LIST
+        self._collected_unmount_listeners = _EMPTY_DICT
+        self._collected_contexts = _EMPTY_DICT
+        self._cached_render = None
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Deque, Dict, Hashable, NamedTuple
+
+from deephaven.server.executors import submit_task
+
+from ..renderer.RenderMetrics import COUNT_BOUNDS, DURATION_BOUNDS, Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class RenderPriority(IntEnum):
+    """
+    The priority of a scheduled render. Lower values are run first.
+    """
+
+    INTERACTIVE = 0
+    """
+    Handling a message from the client, such as an event handler the user triggered.
+    """
+
+    BACKGROUND = 1
+    """
+    Work not triggered by the client, such as re-rendering after a table update.
+    """
+
+
+@dataclass
+class RenderSchedulerMetrics:
+    """
+    Counters, queue depths and latencies of the render scheduler.
+    """
+
+    tasks_scheduled: int = 0
+    """
+    Number of tasks scheduled. A task scheduled again while it is still queued is not counted.
+    """
+
+    tasks_promoted: int = 0
+    """
+    Number of queued tasks moved to a higher priority queue, e.g. a client message arrived for a stream queued to
+    render a table update.
+    """
+
+    tasks_run: int = 0
+    """
+    Number of tasks run.
+    """
+
+    tasks_failed: int = 0
+    """
+    Number of tasks that raised an exception.
+    """
+
+    queue_depth: int = 0
+    """
+    Number of tasks currently queued.
+    """
+
+    active_workers: int = 0
+    """
+    Number of tasks currently submitted to the executor or running.
+    """
+
+    queue_depth_histogram: Histogram = field(
+        default_factory=lambda: Histogram(COUNT_BOUNDS)
+    )
+    """
+    Number of tasks queued, recorded each time a task is scheduled.
+    """
+
+    queue_latency: Dict[str, Histogram] = field(
+        default_factory=lambda: {
+            priority.name: Histogram(DURATION_BOUNDS) for priority in RenderPriority
+        }
+    )
+    """
+    Time in seconds tasks waited in the queue before running, by the name of their priority.
+    """
+
+    def copy(self) -> RenderSchedulerMetrics:
+        """
+        Copy the metrics.
+
+        Returns:
+            A new instance with the same values.
+        """
+        return RenderSchedulerMetrics(
+            tasks_scheduled=self.tasks_scheduled,
+            tasks_promoted=self.tasks_promoted,
+            tasks_run=self.tasks_run,
+            tasks_failed=self.tasks_failed,
+            queue_depth=self.queue_depth,
+            active_workers=self.active_workers,
+            queue_depth_histogram=self.queue_depth_histogram.copy(),
+            queue_latency={
+                name: histogram.copy() for name, histogram in self.queue_latency.items()
+            },
+        )
+
+
+class _QueuedTask(NamedTuple):
+    """
+    A task waiting in the queue of the scheduler.
+    """
+
+    task: Callable[[], None]
+    priority: RenderPriority
+    queued_time: float
+
+
+def _submit_concurrent(task: Callable[[], None]) -> None:
+    """
+    Submit a task to the concurrent executor of the server.
+
+    Args:
+        task: The task to submit.
+    """
+    submit_task("concurrent", task)
+
+
+class RenderScheduler:
+    """
+    Runs the render loops of all the elements opened by clients on a bounded number of executor threads, so many open
+    elements can't take every thread of the executor and starve other work, such as processing table updates.
+
+    Tasks are keyed, usually by the message stream they render, and a key is queued at most once. Each task runs once
+    per submission to the executor, and a stream with more work schedules itself again at the back of the queue,
+    so busy streams take turns with the others. Interactive tasks run before background tasks, but a background task
+    runs after every `interactive_burst` interactive tasks so background work is not starved.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue_depth: int = 256,
+        backlog_update_interval: float = 1.0,
+        interactive_burst: int = 8,
+        submit: Callable[[Callable[[], None]], None] = _submit_concurrent,
+    ):
+        """
+        Create a render scheduler.
+
+        Args:
+            max_workers: The maximum number of tasks submitted to the executor at once.
+            max_queue_depth: The number of queued tasks above which the scheduler is backlogged. While backlogged,
+                table hooks update at most once every `backlog_update_interval` seconds.
+            backlog_update_interval: The minimum time in seconds between table hook updates while backlogged.
+            interactive_burst: The number of interactive tasks to run in a row before running a waiting background
+                task.
+            submit: The function used to submit tasks to the executor. Defaults to the concurrent executor.
+        """
+        self._lock = threading.Lock()
+        self._submit = submit
+        self._max_workers = max_workers
+        self._max_queue_depth = max_queue_depth
+        self._backlog_update_interval = backlog_update_interval
+        self._interactive_burst = interactive_burst
+        self._queues: Dict[RenderPriority, Deque[Hashable]] = {
+            priority: deque() for priority in RenderPriority
+        }
+        self._queued: Dict[Hashable, _QueuedTask] = {}
+        self._interactive_run_count = 0
+        self._metrics = RenderSchedulerMetrics()
+        self.configure(max_workers, max_queue_depth, backlog_update_interval)
+
+    def configure(
+        self,
+        max_workers: int | None = None,
+        max_queue_depth: int | None = None,
+        backlog_update_interval: float | None = None,
+    ) -> None:
+        """
+        Change the limits of the scheduler. Limits that are None are left unchanged.
+
+        Args:
+            max_workers: The maximum number of tasks submitted to the executor at once.
+            max_queue_depth: The number of queued tasks above which the scheduler is backlogged.
+            backlog_update_interval: The minimum time in seconds between table hook updates while backlogged.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if max_queue_depth is not None and max_queue_depth < 0:
+            raise ValueError(
+                f"max_queue_depth must not be negative, got {max_queue_depth}"
+            )
+        if backlog_update_interval is not None and backlog_update_interval < 0:
+            raise ValueError(
+                f"backlog_update_interval must not be negative, got {backlog_update_interval}"
+            )
+        with self._lock:
+            if max_workers is not None:
+                self._max_workers = max_workers
+            if max_queue_depth is not None:
+                self._max_queue_depth = max_queue_depth
+            if backlog_update_interval is not None:
+                self._backlog_update_interval = backlog_update_interval
+            submit_count = self._reserve_workers()
+        self._submit_workers(submit_count)
+
+    @property
+    def metrics(self) -> RenderSchedulerMetrics:
+        """
+        A copy of the metrics of the scheduler.
+        """
+        with self._lock:
+            return self._metrics.copy()
+
+    @property
+    def is_backlogged(self) -> bool:
+        """
+        Whether more tasks are queued than the max queue depth.
+        """
+        return len(self._queued) > self._max_queue_depth
+
+    @property
+    def backlog_update_interval(self) -> float:
+        """
+        The minimum time in seconds between table hook updates while the scheduler is backlogged.
+        """
+        return self._backlog_update_interval
+
+    def schedule(
+        self,
+        key: Hashable,
+        task: Callable[[], None],
+        priority: RenderPriority = RenderPriority.BACKGROUND,
+    ) -> None:
+        """
+        Schedule a task to run on the executor. If a task with the same key is already queued, it is only moved to
+        the queue of the new priority if that is higher.
+
+        Args:
+            key: The key of the task, e.g. the message stream the task renders.
+            task: The task to run.
+            priority: The priority of the task.
+        """
+        with self._lock:
+            queued = self._queued.get(key)
+            if queued is not None:
+                if priority < queued.priority:
+                    self._queues[queued.priority].remove(key)
+                    self._queues[priority].append(key)
+                    self._queued[key] = queued._replace(priority=priority)
+                    self._metrics.tasks_promoted += 1
+                return
+            self._queued[key] = _QueuedTask(task, priority, time.monotonic())
+            self._queues[priority].append(key)
+            self._metrics.tasks_scheduled += 1
+            self._metrics.queue_depth = len(self._queued)
+            self._metrics.queue_depth_histogram.record(len(self._queued))
+            submit_count = self._reserve_workers()
+        self._submit_workers(submit_count)
+
+    def cancel(self, key: Hashable) -> None:
+        """
+        Remove a queued task. Does nothing if the task is not queued, including if it is already running.
+
+        Args:
+            key: The key of the task.
+        """
+        with self._lock:
+            queued = self._queued.pop(key, None)
+            if queued is not None:
+                self._queues[queued.priority].remove(key)
+                self._metrics.queue_depth = len(self._queued)
+
+    def _reserve_workers(self) -> int:
+        """
+        Reserve workers for the queued tasks, up to the max workers. Must be called with the lock held.
+
+        Returns:
+            The number of workers to submit to the executor.
+        """
+        count = max(
+            0,
+            min(len(self._queued), self._max_workers) - self._metrics.active_workers,
+        )
+        self._metrics.active_workers += count
+        return count
+
+    def _submit_workers(self, count: int) -> None:
+        """
+        Submit workers to the executor. Must be called without the lock held.
+
+        Args:
+            count: The number of workers to submit.
+        """
+        for _ in range(count):
+            self._submit(self._run_next)
+
+    def _next_key(self) -> Hashable | None:
+        """
+        Take the key of the next task to run off its queue. Must be called with the lock held.
+
+        Returns:
+            The key of the next task, or None if no task is queued.
+        """
+        interactive = self._queues[RenderPriority.INTERACTIVE]
+        background = self._queues[RenderPriority.BACKGROUND]
+        if len(interactive) > 0 and (
+            len(background) == 0
+            or self._interactive_run_count < self._interactive_burst
+        ):
+            self._interactive_run_count += 1
+            return interactive.popleft()
+        self._interactive_run_count = 0
+        if len(background) > 0:
+            return background.popleft()
+        return None
+
+    def _run_next(self) -> None:
+        """
+        Run the next queued task, then submit this worker again if there are more tasks than running workers.
+        """
+        with self._lock:
+            key = self._next_key()
+            if key is None:
+                self._metrics.active_workers -= 1
+                return
+            queued = self._queued.pop(key)
+            self._metrics.queue_depth = len(self._queued)
+            self._metrics.queue_latency[queued.priority.name].record(
+                time.monotonic() - queued.queued_time
+            )
+
+        try:
+            queued.task()
+        except Exception as e:
+            logger.exception("Error running render task: %s", e)
+            with self._lock:
+                self._metrics.tasks_failed += 1
+
+        with self._lock:
+            self._metrics.tasks_run += 1
+            self._metrics.active_workers -= 1
+            submit_count = self._reserve_workers()
+        # Return the thread to the executor between tasks, so other work submitted to it can run
+        self._submit_workers(submit_count)
+
+
+_render_scheduler = RenderScheduler()
+
+
+def get_render_scheduler() -> RenderScheduler:
+    """
+    Get the scheduler that runs the render loops of all elements.
+
+    Returns:
+        The render scheduler.
+    """
+    return _render_scheduler
+
+
+def configure_render_scheduler(
+    max_workers: int | None = None,
+    max_queue_depth: int | None = None,
+    backlog_update_interval: float | None = None,
+) -> None:
+    """
+    Configure the scheduler that runs the render loops of all elements opened by clients.
+    Limits that are None are left unchanged.
+
+    Args:
+        max_workers: The maximum number of elements rendering at once. Defaults to 4.
+        max_queue_depth: The number of elements waiting to render above which the scheduler is backlogged.
+            Defaults to 256.
+        backlog_update_interval: The minimum time in seconds between updates of each table hook while the
+            scheduler is backlogged. Defaults to 1.
+    """
+    _render_scheduler.configure(max_workers, max_queue_depth, backlog_update_interval)
+
+
+def get_render_scheduler_metrics() -> RenderSchedulerMetrics:
+    """
+    Get the counters, queue depths and latencies of the scheduler that runs the render loops of all elements.
+
+    Returns:
+        A copy of the metrics.
+    """
+    return _render_scheduler.metrics
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, Sequence
+
+import numpy as np
+
+_MIN_CAPACITY = 16
+
+_FIXED_WIDTH_KINDS = "biufcmM"
+"""
+Kinds of numpy dtypes whose values all have the same size, so a column keeps the dtype of the first values added.
+"""
+
+
+def _buffer_dtype(dtype: np.dtype) -> np.dtype:
+    """
+    Get the dtype to store a column in. Strings are read as fixed width arrays as wide as the longest value read,
+    so they are stored as objects, otherwise longer values added later would be truncated.
+
+    Args:
+        dtype: The dtype of the values read for the column.
+
+    Returns:
+        The dtype of the column in the buffer.
+    """
+    return dtype if dtype.kind in _FIXED_WIDTH_KINDS else np.dtype(object)
+
+
+class TableDeltaBuffer:
+    """
+    Column arrays of a table kept in row key order, that can be updated with the rows added, removed,
+    modified and shifted in a table update instead of reading the entire table again.
+    Appending rows after the last row key is amortized O(rows appended). Other operations are vectorized,
+    but may need to copy the arrays.
+
+    All methods are thread safe, so the buffer can be updated from a table listener while data is read from another
+    thread. Arrays returned from `data` are views of the buffer. Rows are appended and modified in place,
+    so the values of previously returned arrays may change. Removing, inserting or growing the buffer
+    allocates new arrays, leaving previously returned arrays untouched.
+    """
+
+    def __init__(self):
+        self._keys = np.empty(0, dtype=np.int64)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of rows in the buffer.
+        """
+        return self._size
+
+    @property
+    def row_keys(self) -> np.ndarray:
+        """
+        The row keys of the rows in the buffer, in ascending order.
+        """
+        return self._keys[: self._size]
+
+    def data(self) -> Dict[str, np.ndarray]:
+        """
+        Get the column arrays of the buffer.
+
+        Returns:
+            A dict of column name to an array of the values in row key order.
+        """
+        with self._lock:
+            return {name: array[: self._size] for name, array in self._columns.items()}
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Get the positions of row keys that are in the buffer.
+
+        Args:
+            keys: The row keys, in ascending order.
+
+        Returns:
+            The positions of the row keys.
+        """
+        return np.searchsorted(self._keys[: self._size], keys)
+
+    def _reserve(self, capacity: int) -> None:
+        """
+        Grow the arrays to hold at least `capacity` rows.
+
+        Args:
+            capacity: The number of rows the arrays must hold.
+        """
+        if capacity <= len(self._keys):
+            return
+        new_capacity = max(capacity, 2 * len(self._keys), _MIN_CAPACITY)
+
+        def grow(array: np.ndarray) -> np.ndarray:
+            grown = np.empty(new_capacity, dtype=array.dtype)
+            grown[: self._size] = array[: self._size]
+            return grown
+
+        self._keys = grow(self._keys)
+        self._columns = {name: grow(array) for name, array in self._columns.items()}
+
+    def clear(self) -> None:
+        """
+        Remove all rows from the buffer.
+        """
+        with self._lock:
+            self._keys = np.empty(0, dtype=np.int64)
+            self._columns = {}
+            self._size = 0
+
+    def remove(self, keys: np.ndarray) -> None:
+        """
+        Remove rows from the buffer.
+
+        Args:
+            keys: The row keys of the rows to remove, in ascending order.
+        """
+        with self._lock:
+            if len(keys) == 0:
+                return
+            positions = self._positions(keys)
+            self._keys = np.delete(self._keys[: self._size], positions)
+            self._columns = {
+                name: np.delete(array[: self._size], positions)
+                for name, array in self._columns.items()
+            }
+            self._size = len(self._keys)
+
+    def shift(
+        self, begins: Sequence[int], ends: Sequence[int], deltas: Sequence[int]
+    ) -> None:
+        """
+        Shift the row keys of the buffer. The ranges are in the key space before the shift and must not overlap.
+        The order of the rows is not changed by a shift.
+
+        Args:
+            begins: The first row key of each range to shift.
+            ends: The last row key, inclusive, of each range to shift.
+            deltas: The amount to shift each range by.
+        """
+        with self._lock:
+            if len(begins) == 0:
+                return
+            keys = self._keys[: self._size]
+            # Find all the ranges before shifting, so a shifted key is never matched by a later range
+            starts = np.searchsorted(keys, begins, side="left")
+            stops = np.searchsorted(keys, ends, side="right")
+            for start, stop, delta in zip(starts, stops, deltas):
+                keys[start:stop] += delta
+
+    def add(self, keys: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Add rows to the buffer.
+
+        Args:
+            keys: The row keys of the rows to add, in ascending order. Must not already be in the buffer.
+            columns: The values of the rows to add for each column, in the same order as the keys.
+        """
+        with self._lock:
+            count = len(keys)
+            if count == 0:
+                return
+            if not self._columns and self._size == 0:
+                self._columns = {
+                    name: np.empty(0, dtype=_buffer_dtype(values.dtype))
+                    for name, values in columns.items()
+                }
+
+            if self._size == 0 or keys[0] > self._keys[self._size - 1]:
+                self._reserve(self._size + count)
+                end = self._size + count
+                self._keys[self._size : end] = keys
+                for name, array in self._columns.items():
+                    array[self._size : end] = columns[name]
+                self._size = end
+                return
+
+            positions = self._positions(keys)
+            self._keys = np.insert(self._keys[: self._size], positions, keys)
+            self._columns = {
+                name: np.insert(array[: self._size], positions, columns[name])
+                for name, array in self._columns.items()
+            }
+            self._size = len(self._keys)
+
+    def modify(self, keys: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Set the values of rows in the buffer.
+
+        Args:
+            keys: The row keys of the rows to modify, in ascending order.
+            columns: The new values for each modified column, in the same order as the keys.
+        """
+        with self._lock:
+            if len(keys) == 0:
+                return
+            positions = self._positions(keys)
+            for name, values in columns.items():
+                if name in self._columns:
+                    self._columns[name][positions] = values
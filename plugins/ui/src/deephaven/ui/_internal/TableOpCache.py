@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from deephaven.execution_context import get_exec_ctx
+from deephaven.liveness_scope import LivenessScope
+from deephaven.table import Table
+
+TableOpKey = Tuple[Any, Any, str, Hashable, Hashable]
+"""
+The key of a table operation: the query scope formulas are evaluated in, the source Java table, the name of the
+operation, and its positional and keyword arguments.
+"""
+
+
+@dataclass
+class TableOpCacheMetrics:
+    """
+    Counters for the table operations requested from the table operation cache.
+    """
+
+    hits: int = 0
+    """
+    Number of operations reused from the cache.
+    """
+
+    misses: int = 0
+    """
+    Number of operations computed because they were not in the cache.
+    """
+
+    evictions: int = 0
+    """
+    Number of cached operations removed because no liveness scope held them anymore.
+    """
+
+    size: int = 0
+    """
+    Number of operations currently in the cache.
+    """
+
+
+class TableOpCacheEntry:
+    """
+    The result of a table operation in the cache. The result is kept alive by its own liveness scope, which is held
+    by the liveness scopes using the result, and is released when the last of them is released.
+    """
+
+    def __init__(self, key: TableOpKey):
+        """
+        Create a cache entry for an operation that is being computed.
+
+        Args:
+            key: The key of the operation.
+        """
+        self.key = key
+        self.table: Table | None = None
+        self.j_scope: Any = None
+        """
+        The Java liveness scope keeping the result alive, or None until the result is computed.
+        """
+        self.error: Exception | None = None
+        self._computed = threading.Event()
+
+    def set_result(self, table: Table, j_scope: Any) -> None:
+        """
+        Set the result of the operation, and wake up the threads waiting for it.
+
+        Args:
+            table: The result of the operation.
+            j_scope: The Java liveness scope keeping the result alive.
+        """
+        self.table = table
+        self.j_scope = j_scope
+        self._computed.set()
+
+    def set_error(self, error: Exception) -> None:
+        """
+        Set the error computing the operation, and wake up the threads waiting for it.
+
+        Args:
+            error: The error raised computing the operation.
+        """
+        self.error = error
+        self._computed.set()
+
+    def wait(self) -> None:
+        """
+        Wait until the operation is computed or failed.
+        """
+        self._computed.wait()
+
+    def try_retain(self) -> bool:
+        """
+        Retain a reference to the liveness scope of the result, if it is computed and has not been released yet.
+        The reference must be dropped with `drop`.
+
+        Returns:
+            True if a reference was retained.
+        """
+        return self.j_scope is not None and self.j_scope.tryRetainReference()
+
+    def drop(self) -> None:
+        """
+        Drop a reference retained with `try_retain`.
+        """
+        self.j_scope.dropReference()
+
+    def is_alive(self) -> bool:
+        """
+        Check if the result is computed and still held by a liveness scope.
+
+        Returns:
+            True if the result can be used.
+        """
+        if not self.try_retain():
+            return False
+        self.drop()
+        return True
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert an argument of a table operation to a hashable value. Lists and dicts are converted to tuples, and
+    tables are keyed by their Java table.
+
+    Args:
+        value: The argument to convert.
+
+    Returns:
+        A hashable value equal for equal arguments.
+    """
+    if isinstance(value, Table):
+        return (Table, value.j_table)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    hash(value)
+    return value
+
+
+def make_table_op_key(
+    table: Table, op: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> TableOpKey | None:
+    """
+    Make the key of a table operation. Formulas can use variables from the query scope of the current execution
+    context, so operations are only shared between components rendered with the same query scope.
+
+    Args:
+        table: The source table.
+        op: The name of the method of the table to call.
+        args: The positional arguments of the method.
+        kwargs: The keyword arguments of the method.
+
+    Returns:
+        The key, or None if an argument can't be hashed and the operation can't be cached.
+    """
+    try:
+        return (
+            get_exec_ctx().j_exec_ctx.getQueryScope(),
+            table.j_table,
+            op,
+            _freeze(args),
+            tuple(sorted((key, _freeze(value)) for key, value in kwargs.items())),
+        )
+    except TypeError:
+        return None
+
+
+class TableOpCache:
+    """
+    Tables derived from other tables with the same operation and arguments, shared across components and client
+    sessions. Each result has its own liveness scope, which is held by the liveness scopes of the renders using it,
+    so the result is released with the last of them and identical derived tables are computed and updated once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[TableOpKey, TableOpCacheEntry] = {}
+        self._metrics = TableOpCacheMetrics()
+
+    @property
+    def metrics(self) -> TableOpCacheMetrics:
+        """
+        A copy of the counters of this cache.
+        """
+        with self._lock:
+            self._remove_released()
+            return dataclasses.replace(self._metrics, size=len(self._entries))
+
+    def _remove_released(self) -> None:
+        """
+        Remove the entries whose result has been released. Must be called with the lock held.
+        """
+        released = [
+            key
+            for key, entry in self._entries.items()
+            if entry.j_scope is not None and not entry.is_alive()
+        ]
+        for key in released:
+            del self._entries[key]
+        self._metrics.evictions += len(released)
+
+    def acquire(
+        self,
+        key: TableOpKey,
+        compute: Callable[[], Table],
+        retain: Callable[[Any], None],
+    ) -> TableOpCacheEntry:
+        """
+        Get the result of a table operation, computing it if it is not cached.
+        The operation is computed without holding the lock of the cache, and concurrent requests for the same
+        operation wait for the first one to compute it.
+
+        Args:
+            key: The key of the operation.
+            compute: The function computing the result.
+            retain: Called with the Java liveness scope of the result, to hold it while the result is used,
+                e.g. `RenderContext.retain`.
+
+        Returns:
+            The cache entry of the operation.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._remove_released()
+                    entry = self._entries[key] = TableOpCacheEntry(key)
+                    self._metrics.misses += 1
+                    break
+
+            entry.wait()
+            if entry.try_retain():
+                try:
+                    retain(entry.j_scope)
+                finally:
+                    entry.drop()
+                with self._lock:
+                    self._metrics.hits += 1
+                return entry
+
+            # The computation failed, or the result was released by the last scope holding it, so compute it again
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    if entry.error is None:
+                        self._metrics.evictions += 1
+
+        liveness_scope = LivenessScope()
+        try:
+            with liveness_scope.open():
+                table = compute()
+        except Exception as e:
+            with self._lock:
+                del self._entries[key]
+            entry.set_error(e)
+            liveness_scope.release()
+            raise
+
+        # Hold the result before releasing the reference of the scope it was created in
+        j_scope = liveness_scope.j_scope
+        try:
+            retain(j_scope)
+        finally:
+            entry.set_result(table, j_scope)
+            liveness_scope.release()
+        return entry
+
+
+_table_op_cache = TableOpCache()
+
+
+def get_table_op_cache() -> TableOpCache:
+    """
+    Get the table operation cache shared by all components.
+
+    Returns:
+        The table operation cache.
+    """
+    return _table_op_cache
+
+
+def get_table_op_cache_metrics() -> TableOpCacheMetrics:
+    """
+    Get the counters for the table operations shared between components with `use_table_op`.
+
+    Returns:
+        A copy of the counters.
+    """
+    return _table_op_cache.metrics
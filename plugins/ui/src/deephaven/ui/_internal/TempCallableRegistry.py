@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Union
+
+from deephaven.liveness_scope import LivenessScope
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TempCallableMetrics:
+    """
+    Counters for the temporary callables registered when callables return callables to the client.
+    """
+
+    registered: int = 0
+    """
+    Number of temporary callables registered.
+    """
+
+    closed: int = 0
+    """
+    Number of temporary callables closed by the client, or when the client disconnected.
+    """
+
+    evicted: int = 0
+    """
+    Number of temporary callables evicted because they expired or too many were registered.
+    """
+
+    live: int = 0
+    """
+    Number of temporary callables currently registered.
+    """
+
+
+_default_max_size: int = 1024
+_default_ttl: float = 3600
+_global_metrics = TempCallableMetrics()
+_global_metrics_lock = threading.Lock()
+
+
+def configure_temp_callables(
+    max_size: int | None = None, ttl: float | None = None
+) -> None:
+    """
+    Configure the limits of the temporary callables each client can have, for registries created after this call.
+    Temporary callables are registered when a callable called by the client returns callables. The least recently
+    used are evicted when there are too many, or when they have not been used for longer than the TTL, so closures
+    and the objects they hold are released even if the client never closes them. Limits that are None are left
+    unchanged.
+
+    Args:
+        max_size: The maximum number of temporary callables for each client. Defaults to 1024.
+        ttl: The number of seconds a temporary callable is kept after it was last used, or 0 to keep it until it is
+            closed or evicted to stay under `max_size`. Defaults to 3600.
+    """
+    global _default_max_size, _default_ttl
+    _validate_limits(max_size, ttl)
+    if max_size is not None:
+        _default_max_size = max_size
+    if ttl is not None:
+        _default_ttl = ttl
+
+
+def get_temp_callable_metrics() -> TempCallableMetrics:
+    """
+    Get the counters for the temporary callables of all clients.
+
+    Returns:
+        A copy of the counters.
+    """
+    with _global_metrics_lock:
+        return dataclasses.replace(_global_metrics)
+
+
+def _validate_limits(max_size: int | None, ttl: float | None) -> None:
+    """
+    Check that the limits of a registry are valid.
+
+    Args:
+        max_size: The max size to check.
+        ttl: The TTL to check.
+    """
+    if max_size is not None and max_size <= 0:
+        raise ValueError(f"max_size must be a positive number, got {max_size}")
+    if ttl is not None and ttl < 0:
+        raise ValueError(f"ttl must not be negative, got {ttl}")
+
+
+class SharedLivenessScope:
+    """
+    A liveness scope shared by the temporary callables returned from one call, released when the caller and all the
+    callables have released it.
+    """
+
+    def __init__(self, liveness_scope: LivenessScope):
+        """
+        Share a liveness scope. The caller holds the first reference.
+
+        Args:
+            liveness_scope: The scope holding the objects created by the call.
+        """
+        self._liveness_scope = liveness_scope
+        self._ref_count = 1
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Add a reference to the scope.
+        """
+        with self._lock:
+            self._ref_count += 1
+
+    def release(self) -> None:
+        """
+        Release a reference to the scope, releasing the scope when no references are left.
+        """
+        with self._lock:
+            self._ref_count -= 1
+            if self._ref_count > 0:
+                return
+        self._liveness_scope.release()
+
+
+class _TempCallableEntry:
+    """
+    A temporary callable in a registry.
+    """
+
+    def __init__(
+        self,
+        callable: Callable,
+        liveness_scope: SharedLivenessScope | None,
+        last_used: float,
+    ):
+        self.callable = callable
+        self.liveness_scope = liveness_scope
+        self.last_used = last_used
+
+
+class TempCallableRegistry:
+    """
+    The temporary callables of a client, by ID. Bounded by an LRU max size and a TTL since each callable was last used.
+    Evicted and closed callables release the liveness scope of the call that returned them.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Create a registry.
+
+        Args:
+            max_size: The maximum number of callables. Defaults to the size set with `configure_temp_callables`.
+            ttl: The number of seconds a callable is kept after it was last used, or 0 for no expiry.
+                Defaults to the TTL set with `configure_temp_callables`.
+            clock: The clock used to expire callables.
+        """
+        _validate_limits(max_size, ttl)
+        self._max_size = max_size if max_size is not None else _default_max_size
+        self._ttl = ttl if ttl is not None else _default_ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, _TempCallableEntry] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._metrics = TempCallableMetrics()
+
+    @property
+    def metrics(self) -> TempCallableMetrics:
+        """
+        The counters for the callables of this registry.
+        """
+        with self._lock:
+            return dataclasses.replace(self._metrics)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count(self, field: str, amount: int = 1) -> None:
+        """
+        Add to a counter of this registry and the global counter, and update the live count. Must be called with the
+        lock held.
+
+        Args:
+            field: The name of the counter.
+            amount: The amount to add.
+        """
+        live = amount if field == "registered" else -amount
+        with _global_metrics_lock:
+            for metrics in (self._metrics, _global_metrics):
+                setattr(metrics, field, getattr(metrics, field) + amount)
+                metrics.live += live
+
+    def register(
+        self, callable: Callable, liveness_scope: SharedLivenessScope | None = None
+    ) -> str:
+        """
+        Register a callable, evicting the least recently used callables if the registry is full.
+
+        Args:
+            callable: The callable to register.
+            liveness_scope: The scope holding the objects the callable uses, acquired until the callable is removed.
+
+        Returns:
+            The ID of the callable.
+        """
+        if liveness_scope is not None:
+            liveness_scope.acquire()
+        with self._lock:
+            callable_id = f"tempCb{self._next_id}"
+            self._next_id += 1
+            now = self._clock()
+            self._entries[callable_id] = _TempCallableEntry(
+                callable, liveness_scope, now
+            )
+            self._count("registered")
+            evicted = self._evict(now)
+        self._release(evicted)
+        return callable_id
+
+    def get(self, callable_id: str) -> Union[Callable, None]:
+        """
+        Get a callable, marking it as used.
+
+        Args:
+            callable_id: The ID of the callable.
+
+        Returns:
+            The callable, or None if there is none with the ID, or it was evicted.
+        """
+        with self._lock:
+            now = self._clock()
+            evicted = self._evict(now)
+            entry = self._entries.get(callable_id)
+            if entry is not None:
+                entry.last_used = now
+                self._entries.move_to_end(callable_id)
+        self._release(evicted)
+        return entry.callable if entry is not None else None
+
+    def close(self, callable_id: str) -> None:
+        """
+        Remove a callable closed by the client.
+
+        Args:
+            callable_id: The ID of the callable.
+        """
+        with self._lock:
+            entry = self._entries.pop(callable_id, None)
+            if entry is None:
+                return
+            self._count("closed")
+        self._release([entry])
+
+    def clear(self) -> None:
+        """
+        Remove all the callables, e.g. when the client disconnects.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._count("closed", len(entries))
+        self._release(entries)
+
+    def _evict(self, now: float) -> list[_TempCallableEntry]:
+        """
+        Remove the expired callables and the least recently used callables over the max size. Must be called with the
+        lock held.
+
+        Args:
+            now: The current time of the clock.
+
+        Returns:
+            The entries removed, to release without the lock held.
+        """
+        evicted = []
+        while len(self._entries) > 0:
+            callable_id, entry = next(iter(self._entries.items()))
+            is_expired = self._ttl > 0 and now - entry.last_used > self._ttl
+            if not is_expired and len(self._entries) <= self._max_size:
+                break
+            logger.debug("Evicting temporary callable %s", callable_id)
+            del self._entries[callable_id]
+            evicted.append(entry)
+        if len(evicted) > 0:
+            self._count("evicted", len(evicted))
+        return evicted
+
+    def _release(self, entries: list[_TempCallableEntry]) -> None:
+        """
+        Release the liveness scopes of removed callables.
+
+        Args:
+            entries: The entries removed.
+        """
+        for entry in entries:
+            if entry.liveness_scope is not None:
+                entry.liveness_scope.release()
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import dataclasses
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Union
+
+from .RenderScheduler import get_render_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UpdateThrottleMetrics:
+    """
+    Counters for the updates passed through update throttles.
+    """
+
+    updates_received: int = 0
+    """
+    Number of updates received, e.g. table ticks.
+    """
+
+    updates_coalesced: int = 0
+    """
+    Number of updates dropped because an update was already pending. The pending update reads the latest data.
+    """
+
+    updates_delayed: int = 0
+    """
+    Number of updates delayed to stay under the max update rate.
+    """
+
+    updates_applied: int = 0
+    """
+    Number of updates actually applied, e.g. table snapshots taken.
+    """
+
+
+_default_max_update_rate: Union[float, None] = None
+_global_metrics = UpdateThrottleMetrics()
+_global_metrics_lock = threading.Lock()
+
+
+def _validate_rate(max_update_rate: float | None) -> None:
+    """
+    Check that a max update rate is valid.
+
+    Args:
+        max_update_rate: The rate to check.
+    """
+    if max_update_rate is not None and max_update_rate <= 0:
+        raise ValueError(
+            f"max_update_rate must be a positive number or None, got {max_update_rate}"
+        )
+
+
+def set_default_max_update_rate(max_update_rate: float | None) -> None:
+    """
+    Set the maximum number of times per second a table hook updates its component, for hooks that do not set their own
+    `max_update_rate`. Table updates arriving faster are coalesced into a single update with the latest data.
+
+    Args:
+        max_update_rate: The maximum updates per second, or None for no limit.
+    """
+    global _default_max_update_rate
+    _validate_rate(max_update_rate)
+    _default_max_update_rate = max_update_rate
+
+
+def get_default_max_update_rate() -> float | None:
+    """
+    Get the maximum number of times per second a table hook updates its component by default.
+
+    Returns:
+        The maximum updates per second, or None if there is no limit.
+    """
+    return _default_max_update_rate
+
+
+def get_update_throttle_metrics() -> UpdateThrottleMetrics:
+    """
+    Get the counters for all the table updates received by table hooks.
+
+    Returns:
+        A copy of the counters.
+    """
+    with _global_metrics_lock:
+        return dataclasses.replace(_global_metrics)
+
+
+def _count(field: str) -> None:
+    """
+    Increment a global counter.
+
+    Args:
+        field: The name of the counter to increment.
+    """
+    with _global_metrics_lock:
+        setattr(_global_metrics, field, getattr(_global_metrics, field) + 1)
+
+
+class _DelayedCall:
+    """
+    A function to call after a delay, that can be cancelled until it is called.
+    """
+
+    def __init__(self, func: Callable[[], None]):
+        self.func = func
+        self.is_cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Cancel the call, if it has not been made yet.
+        """
+        self.is_cancelled = True
+
+
+class _DelayQueue:
+    """
+    Calls functions after a delay on a single daemon thread shared by all the update throttles, instead of starting a
+    timer thread for each delayed update.
+    """
+
+    def __init__(self, name: str = "deephaven.ui-update-throttle"):
+        """
+        Create a delay queue. The thread is started when the first call is queued.
+
+        Args:
+            name: The name of the thread making the calls.
+        """
+        self._name = name
+        self._condition = threading.Condition()
+        self._calls: list[tuple[float, int, _DelayedCall]] = []
+        self._sequence = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def call_later(self, delay: float, func: Callable[[], None]) -> _DelayedCall:
+        """
+        Call a function after a delay.
+
+        Args:
+            delay: The delay in seconds.
+            func: The function to call.
+
+        Returns:
+            The call, which can be cancelled.
+        """
+        call = _DelayedCall(func)
+        with self._condition:
+            heapq.heappush(
+                self._calls, (time.monotonic() + delay, next(self._sequence), call)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return call
+
+    def _run(self) -> None:
+        """
+        Make the calls as they become due.
+        """
+        while True:
+            with self._condition:
+                while True:
+                    timeout = (
+                        self._calls[0][0] - time.monotonic() if self._calls else None
+                    )
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                _, _, call = heapq.heappop(self._calls)
+            if call.is_cancelled:
+                continue
+            try:
+                call.func()
+            except Exception as e:
+                logger.exception("Error applying delayed update: %s", e)
+
+
+_delay_queue = _DelayQueue()
+
+
+class UpdateThrottle:
+    """
+    Coalesces updates so there is at most one pending at a time, and limits how often they are applied.
+    Used for updates that read the latest data when applied, so dropping an update while another is pending
+    loses nothing. Updates are applied one at a time, so an update notified while another is being applied is applied
+    after it, and the last update applied always has the latest data.
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[], None],
+        submit: Callable[[Callable[[], None]], None] = lambda func: func(),
+        max_update_rate: float | None = None,
+    ):
+        """
+        Create an update throttle.
+
+        Args:
+            apply: The function that applies the latest update.
+            submit: The function used to run `apply`, e.g. to submit it to an executor. Called from the thread
+                that notified, the thread that applied the previous update, or a timer thread shared by all throttles
+                if the update is delayed. Defaults to calling it directly.
+            max_update_rate: The maximum number of times per second to apply updates.
+                Defaults to None, which uses the default set with `set_default_max_update_rate`.
+        """
+        _validate_rate(max_update_rate)
+        self._apply = apply
+        self._submit = submit
+        self._max_update_rate = max_update_rate
+        self._lock = threading.Lock()
+        self._is_pending = False
+        self._is_running = False
+        self._is_cancelled = False
+        self._last_applied: float | None = None
+        self._timer: _DelayedCall | None = None
+        self._metrics = UpdateThrottleMetrics()
+
+    @property
+    def metrics(self) -> UpdateThrottleMetrics:
+        """
+        The counters for the updates passed through this throttle.
+        """
+        with self._lock:
+            return dataclasses.replace(self._metrics)
+
+    def _count(self, field: str) -> None:
+        """
+        Increment a counter of this throttle and the global counter. Must be called with the lock held.
+
+        Args:
+            field: The name of the counter to increment.
+        """
+        setattr(self._metrics, field, getattr(self._metrics, field) + 1)
+        _count(field)
+
+    def _get_delay(self) -> float:
+        """
+        Get how long to wait before applying the next update. Must be called with the lock held.
+        While the render scheduler is backlogged, updates are spaced by at least its backlog update interval.
+
+        Returns:
+            The delay in seconds.
+        """
+        max_update_rate = (
+            self._max_update_rate
+            if self._max_update_rate is not None
+            else _default_max_update_rate
+        )
+        interval = 1 / max_update_rate if max_update_rate is not None else 0
+        scheduler = get_render_scheduler()
+        if scheduler.is_backlogged:
+            interval = max(interval, scheduler.backlog_update_interval)
+        if interval == 0 or self._last_applied is None:
+            return 0
+        next_update = self._last_applied + interval
+        return max(0, next_update - time.monotonic())
+
+    def notify(self) -> None:
+        """
+        Notify the throttle there is a new update. The update is applied right away if no update is pending or being
+        applied and the max update rate allows it, delayed if not, or dropped if an update is already pending.
+        """
+        with self._lock:
+            if self._is_cancelled:
+                return
+            self._count("updates_received")
+            if self._is_pending:
+                self._count("updates_coalesced")
+                return
+            self._is_pending = True
+            if self._is_running:
+                # Applied when the update being applied finishes
+                return
+            self._is_running = True
+            is_delayed = self._schedule()
+
+        if not is_delayed:
+            self._submit(self._run)
+
+    def _schedule(self) -> bool:
+        """
+        Schedule the pending update to be applied after the delay required by the max update rate, if any.
+        Must be called with the lock held.
+
+        Returns:
+            True if the update is delayed, False if it should be submitted right away.
+        """
+        delay = self._get_delay()
+        if delay <= 0:
+            return False
+        self._count("updates_delayed")
+        self._timer = _delay_queue.call_later(delay, partial(self._submit, self._run))
+        return True
+
+    def _run(self) -> None:
+        """
+        Apply the pending update, then schedule the next update if one was notified while applying.
+        """
+        with self._lock:
+            if self._is_cancelled:
+                self._is_running = False
+                return
+            # Clear pending first, so updates arriving while applying are applied after
+            self._is_pending = False
+            self._timer = None
+            self._last_applied = time.monotonic()
+            self._count("updates_applied")
+
+        try:
+            self._apply()
+        finally:
+            with self._lock:
+                is_next = self._is_pending and not self._is_cancelled
+                self._is_running = is_next
+                is_delayed = is_next and self._schedule()
+
+            if is_next and not is_delayed:
+                self._submit(self._run)
+
+    def cancel(self) -> None:
+        """
+        Cancel any pending update and ignore all further updates.
+        """
+        with self._lock:
+            self._is_cancelled = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
@@ -8,6 +8,7 @@ from .RenderContext import (
     get_context,
     NoContextException,
     ValueWithLiveness,
+    value_with_liveness,
     ExportedRenderState,
 )
 from .utils import (
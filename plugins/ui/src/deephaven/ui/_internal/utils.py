@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Set, cast, Sequence, TypeVar
+from typing import Any, Callable, Set, Tuple, cast, Sequence, TypeVar, Union
 from inspect import signature
 import sys
 from functools import partial
+from weakref import WeakKeyDictionary
 from deephaven.time import to_j_instant, to_j_zdt, to_j_local_date, to_j_local_time
 from deephaven.dtypes import ZonedDateTime, Instant
 
@@ -23,6 +24,19 @@ _UNSAFE_PREFIX = "UNSAFE_"
 _ARIA_PREFIX = "aria_"
 _ARIA_PREFIX_REPLACEMENT = "aria-"
 
+# The max positional args and set of kwargs a callable accepts, None if it accepts any
+_ArgsFilter = Tuple[Union[int, None], Union[Set[str], None]]
+
+# Args filters of callables already wrapped, so a callable passed on every render only has its signature read once
+_args_filter_cache: WeakKeyDictionary[Callable, _ArgsFilter] = WeakKeyDictionary()
+
+# React prop names of the snake_case names already converted. Components use a fixed set of prop names, so each name
+# is only converted once instead of on every element created
+_react_prop_name_cache: dict[str, str] = {}
+
+# Max names kept in the cache, in case props are created from arbitrary names such as data keys
+_REACT_PROP_NAME_CACHE_SIZE = 4096
+
 _DATE_CONVERTERS = {
     "java.time.Instant": to_j_instant,
     "java.time.ZonedDateTime": to_j_zdt,
@@ -101,6 +115,24 @@ def to_react_prop_case(snake_case_text: str) -> str:
     return to_camel_case(snake_case_text)
 
 
+def _to_cached_react_prop_case(snake_case_text: str) -> str:
+    """
+    Convert a snake_case string to a React prop name like `to_react_prop_case`, caching the result.
+
+    Args:
+        snake_case_text: The snake_case string to convert.
+
+    Returns:
+        The React prop name.
+    """
+    prop_name = _react_prop_name_cache.get(snake_case_text)
+    if prop_name is None:
+        prop_name = to_react_prop_case(snake_case_text)
+        if len(_react_prop_name_cache) < _REACT_PROP_NAME_CACHE_SIZE:
+            _react_prop_name_cache[snake_case_text] = prop_name
+    return prop_name
+
+
 def convert_dict_keys(
     dict: dict[str, Any], convert_key: Callable[[str], str]
 ) -> dict[str, Any]:
@@ -144,7 +176,13 @@ def dict_to_react_props(dict: dict[str, Any]) -> dict[str, Any]:
     Returns:
         The React props dict.
     """
-    return convert_dict_keys(remove_empty_keys(dict), to_react_prop_case)
+    # Convert and remove empty keys in one pass, as this runs for every element created
+    cache = _react_prop_name_cache
+    return {
+        cache.get(k) or _to_cached_react_prop_case(k): v
+        for k, v in dict.items()
+        if v is not None
+    }
 
 
 def remove_empty_keys(dict: dict[str, Any]) -> dict[str, Any]:
@@ -191,9 +229,71 @@ def _wrapped_callable(
     return func(*args, **kwargs)
 
 
+def _get_args_filter(func: Callable) -> _ArgsFilter:
+    """
+    Get the max positional args and set of kwargs the function accepts from its signature.
+
+    Args:
+        func: The callable to get the args filter of
+
+    Returns:
+        The max positional args and set of kwargs, None if the function accepts any
+    """
+    if sys.version_info.major == 3 and sys.version_info.minor >= 10:
+        sig = signature(func, eval_str=True)  # type: ignore
+    else:
+        sig = signature(func)
+
+    max_args: int | None = 0
+    kwargs_set: Set | None = set()
+
+    for param in sig.parameters.values():
+        if param.kind == param.POSITIONAL_ONLY:
+            max_args = cast(int, max_args)
+            max_args += 1
+        elif param.kind == param.POSITIONAL_OR_KEYWORD:
+            # Don't know until runtime whether this will be passed as a positional or keyword arg
+            max_args = cast(int, max_args)
+            kwargs_set = cast(Set, kwargs_set)
+            max_args += 1
+            kwargs_set.add(param.name)
+        elif param.kind == param.VAR_POSITIONAL:
+            max_args = None
+        elif param.kind == param.KEYWORD_ONLY:
+            kwargs_set = cast(Set, kwargs_set)
+            kwargs_set.add(param.name)
+        elif param.kind == param.VAR_KEYWORD:
+            kwargs_set = None
+
+    return max_args, kwargs_set
+
+
+def _get_cached_args_filter(func: Callable) -> _ArgsFilter:
+    """
+    Get the args filter of the function, reading its signature only the first time the function is wrapped.
+    Callables that can't be weakly referenced or hashed are not cached.
+
+    Args:
+        func: The callable to get the args filter of
+
+    Returns:
+        The max positional args and set of kwargs, None if the function accepts any
+    """
+    try:
+        args_filter = _args_filter_cache.get(func)
+    except TypeError:
+        return _get_args_filter(func)
+
+    if args_filter is None:
+        args_filter = _get_args_filter(func)
+        _args_filter_cache[func] = args_filter
+    return args_filter
+
+
 def wrap_callable(func: Callable) -> Callable:
     """
     Wrap the function so args are dropped if they are not in the signature.
+    The signature of each callable is only read once while the callable is alive.
 
     Args:
         func: The callable to wrap
@@ -202,32 +302,7 @@ def wrap_callable(func: Callable) -> Callable:
         The wrapped callable
     """
     try:
-        if sys.version_info.major == 3 and sys.version_info.minor >= 10:
-            sig = signature(func, eval_str=True)  # type: ignore
-        else:
-            sig = signature(func)
-
-        max_args: int | None = 0
-        kwargs_set: Set | None = set()
-
-        for param in sig.parameters.values():
-            if param.kind == param.POSITIONAL_ONLY:
-                max_args = cast(int, max_args)
-                max_args += 1
-            elif param.kind == param.POSITIONAL_OR_KEYWORD:
-                # Don't know until runtime whether this will be passed as a positional or keyword arg
-                max_args = cast(int, max_args)
-                kwargs_set = cast(Set, kwargs_set)
-                max_args += 1
-                kwargs_set.add(param.name)
-            elif param.kind == param.VAR_POSITIONAL:
-                max_args = None
-            elif param.kind == param.KEYWORD_ONLY:
-                kwargs_set = cast(Set, kwargs_set)
-                kwargs_set.add(param.name)
-            elif param.kind == param.VAR_KEYWORD:
-                kwargs_set = None
-
+        max_args, kwargs_set = _get_cached_args_filter(func)
         return partial(_wrapped_callable, max_args, kwargs_set, func)
     except ValueError or TypeError:
         # This function has no signature, so we can't wrap it
@@ -31,6 +31,7 @@ from .list_action_group import list_action_group
 from .list_action_menu import list_action_menu
 from .list_view import list_view
 from .make_component import make_component as component
+from .memo import memo
 from .number_field import number_field
 from .panel import panel
 from .picker import picker
@@ -93,6 +94,7 @@ __all__ = [
     "list_action_group",
     "list_action_menu",
     "html",
+    "memo",
     "number_field",
     "panel",
     "picker",
@@ -9,4 +9,22 @@ def component_element(name: str, /, *children: Any, **props: Any) -> BaseElement
     All names are automatically prefixed with "deephaven.ui.components.", and
     all props are automatically camelCased.
     """
-    return BaseElement(f"deephaven.ui.components.{name}", *children, **props)
+    return BaseElement.from_props(f"deephaven.ui.components.{name}", children, props)
+
+
+def component_element_from_props(
+    name: str, children: tuple[Any, ...], props: dict[str, Any]
+) -> BaseElement:
+    """
+    Create a UI element from a dict of props, such as from `create_props`, without unpacking them into keyword
+    arguments. The name is prefixed with "deephaven.ui.components.".
+
+    Args:
+        name: The name of the component.
+        children: The children of the element.
+        props: The props of the element, with snake_case names. Used as is, so must not be used after.
+
+    Returns:
+        The element.
+    """
+    return BaseElement.from_props(f"deephaven.ui.components.{name}", children, props)
@@ -16,7 +16,7 @@ from .types import (
 from ..elements import Element
 from .._internal.utils import create_props, convert_date_props, wrap_local_date_callable
 from ..types import Date, LocalDateConvertible
-from .basic import component_element
+from .basic import component_element_from_props
 from .make_component import make_component
 from deephaven.time import dh_now
 
@@ -213,4 +213,4 @@ def calendar(
 
     _convert_calendar_props(props)
 
-    return component_element("Calendar", **props)
+    return component_element_from_props("Calendar", (), props)
@@ -30,7 +30,7 @@ from .item_table_source import ItemTableSource
 from ..elements import BaseElement, Element
 from .._internal.utils import create_props, unpack_item_table_source
 from ..types import Key
-from .basic import component_element
+from .basic import component_element_from_props
 
 ComboBoxElement = BaseElement
 
@@ -241,4 +241,4 @@ def combo_box(
 
     children, props = unpack_item_table_source(children, props, SUPPORTED_SOURCE_ARGS)
 
-    return component_element("ComboBox", *children, **props)
+    return component_element_from_props("ComboBox", children, props)
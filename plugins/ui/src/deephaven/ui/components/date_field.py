@@ -26,7 +26,7 @@ from .._internal.utils import (
     convert_date_props,
 )
 from ..types import Date, Granularity
-from .basic import component_element
+from .basic import component_element_from_props
 from .make_component import make_component
 from deephaven.time import dh_now
 
@@ -261,4 +261,4 @@ def date_field(
 
     _convert_date_field_props(props)
 
-    return component_element("DateField", **props)
+    return component_element_from_props("DateField", (), props)
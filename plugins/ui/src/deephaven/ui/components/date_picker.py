@@ -29,7 +29,7 @@ from .._internal.utils import (
     convert_list_prop,
 )
 from ..types import Date, Granularity
-from .basic import component_element
+from .basic import component_element_from_props
 from .make_component import make_component
 from deephaven.time import dh_now
 
@@ -280,4 +280,4 @@ def date_picker(
     #     [unavailable_values],
     # )
 
-    return component_element("DatePicker", **props)
+    return component_element_from_props("DatePicker", (), props)
@@ -29,7 +29,7 @@ from .._internal.utils import (
     convert_list_prop,
 )
 from ..types import Date, Granularity, DateRange
-from .basic import component_element
+from .basic import component_element_from_props
 from .make_component import make_component
 from deephaven.time import dh_now
 
@@ -278,4 +278,4 @@ def date_range_picker(
 
     _convert_date_range_picker_props(props)
 
-    return component_element("DateRangePicker", **props)
+    return component_element_from_props("DateRangePicker", (), props)
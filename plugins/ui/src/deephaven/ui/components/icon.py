@@ -127,4 +127,6 @@ def icon(
 
     children, props = create_props(locals())
     normalized_name = IconMapping[name]
-    return BaseElement(f"deephaven.ui.icons.{normalized_name}", *children, **props)
+    return BaseElement.from_props(
+        f"deephaven.ui.icons.{normalized_name}", children, props
+    )
@@ -4,7 +4,7 @@ from typing import Any, Union, List
 from ..elements import BaseElement
 from ..types import Stringable
 from .._internal.utils import create_props
-from .basic import component_element
+from .basic import component_element_from_props
 
 ItemElement = BaseElement
 Item = Union[Stringable, ItemElement]
@@ -31,4 +31,4 @@ def item(
         **props: Any other Item prop.
     """
     children, props = create_props(locals())
-    return component_element("Item", *children, **props)
+    return component_element_from_props("Item", children, props)
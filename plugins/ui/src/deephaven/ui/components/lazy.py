@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from typing import Any, Callable, List, Set
+
+from ..elements import BaseElement, Element
+from ..hooks import use_ref, use_state
+from ..types import Key
+from .make_component import make_component
+
+TAB_NAME = "deephaven.ui.components.Tab"
+TAB_PANELS_NAME = "deephaven.ui.components.TabPanels"
+PANEL_NAME = "deephaven.ui.components.Panel"
+
+
+def _get_children(element: BaseElement) -> List[Any]:
+    """
+    Get the children of an element as a list.
+
+    Args:
+        element: The element to get the children of.
+
+    Returns:
+        The children of the element.
+    """
+    children = element.props.get("children")
+    if children is None:
+        return []
+    if isinstance(children, list):
+        return children
+    return [children]
+
+
+def _with_children(element: BaseElement, children: List[Any]) -> BaseElement:
+    """
+    Copy an element with different children.
+
+    Args:
+        element: The element to copy.
+        children: The children of the copy.
+
+    Returns:
+        The copy of the element.
+    """
+    props = dict(element.props)
+    props.pop("children", None)
+    if len(children) > 1:
+        props["children"] = children
+    elif len(children) == 1:
+        props["children"] = children[0]
+    return element.with_props(props)
+
+
+def _get_tab_key(element: Any) -> Key | None:
+    """
+    Get the key of a tab, which defaults to its title.
+
+    Args:
+        element: The tab element, or the item in the tab panels.
+
+    Returns:
+        The key of the tab.
+    """
+    if not isinstance(element, BaseElement):
+        return None
+    if element.key is not None:
+        return element.key
+    return element.props.get("title")
+
+
+def _get_tab_keys(children: List[Any]) -> List[Key | None]:
+    """
+    Get the keys of the tabs declared by the children of a tabs element.
+
+    Args:
+        children: The children of the tabs element.
+
+    Returns:
+        The keys of the tabs.
+    """
+    keys: List[Key | None] = []
+    for child in children:
+        if isinstance(child, BaseElement) and child.name == TAB_NAME:
+            keys.append(_get_tab_key(child))
+        elif isinstance(child, BaseElement) and child.name == TAB_PANELS_NAME:
+            keys.extend(_get_tab_key(item) for item in _get_children(child))
+    return keys
+
+
+def _hide_tabs(children: List[Any], visible_keys: Set[Key | None]) -> List[Any]:
+    """
+    Remove the content of the tabs that are not visible.
+
+    Args:
+        children: The children of the tabs element.
+        visible_keys: The keys of the tabs to keep the content of.
+
+    Returns:
+        The children with the content of the other tabs removed.
+    """
+
+    def hide(child: Any) -> Any:
+        if isinstance(child, BaseElement) and _get_tab_key(child) not in visible_keys:
+            return _with_children(child, [])
+        return child
+
+    result = []
+    for child in children:
+        if isinstance(child, BaseElement) and child.name == TAB_NAME:
+            result.append(hide(child))
+        elif isinstance(child, BaseElement) and child.name == TAB_PANELS_NAME:
+            result.append(
+                _with_children(child, [hide(item) for item in _get_children(child)])
+            )
+        else:
+            result.append(child)
+    return result
+
+
+def _get_visible(selected: Any, visited_ref: Any, unmount_hidden: bool) -> Set[Any]:
+    """
+    Get the keys or indices of the children to render, and record the selected one as visited.
+
+    Args:
+        selected: The key or index of the selected child.
+        visited_ref: Ref to the set of children that have been selected before.
+        unmount_hidden: Whether to only render the selected child.
+
+    Returns:
+        The keys or indices of the children to render.
+    """
+    if unmount_hidden:
+        return {selected}
+    visited_ref.current.add(selected)
+    return visited_ref.current
+
+
+def _call_handlers(*handlers: Callable[[Any], None] | None) -> Callable[[Any], None]:
+    """
+    Combine selection handlers into one.
+
+    Args:
+        *handlers: The handlers to call, None for no handler.
+
+    Returns:
+        A handler calling all the handlers.
+    """
+
+    def handle(value: Any) -> None:
+        for handler in handlers:
+            if handler is not None:
+                handler(value)
+
+    return handle
+
+
+@make_component
+def lazy_tabs(tabs_element: BaseElement, unmount_hidden: bool) -> Element:
+    """
+    Render only the content of the selected tab, and the tabs selected before unless `unmount_hidden` is set.
+
+    Args:
+        tabs_element: The tabs element to render lazily.
+        unmount_hidden: Whether to unmount the content of tabs when they are hidden.
+
+    Returns:
+        The tabs element with the content of the hidden tabs removed.
+    """
+    props = tabs_element.props
+    children = _get_children(tabs_element)
+    keys = _get_tab_keys(children)
+    default_key = props.get("defaultSelectedKey")
+    selected_state, set_selected_state = use_state(
+        default_key if default_key is not None else next(iter(keys), None)
+    )
+    visited_ref = use_ref(set())
+
+    controlled_key = props.get("selectedKey")
+    selected = controlled_key if controlled_key is not None else selected_state
+    visible = _get_visible(selected, visited_ref, unmount_hidden)
+
+    new_props = dict(props)
+    new_props.pop("onChange", None)
+    new_props.pop("defaultSelectedKey", None)
+    new_props["selectedKey"] = selected
+    new_props["onSelectionChange"] = _call_handlers(
+        set_selected_state, props.get("onSelectionChange"), props.get("onChange")
+    )
+    return _with_children(
+        tabs_element.with_props(new_props), _hide_tabs(children, visible)
+    )
+
+
+@make_component
+def lazy_stack(stack_element: BaseElement, unmount_hidden: bool) -> Element:
+    """
+    Render only the content of the active panel in a stack, and the panels active before unless `unmount_hidden` is
+    set. Only `ui.panel` children of the stack are rendered lazily.
+
+    Args:
+        stack_element: The stack element to render lazily.
+        unmount_hidden: Whether to unmount the content of panels when they are hidden.
+
+    Returns:
+        The stack element with the content of the hidden panels removed.
+    """
+    props = stack_element.props
+    children = _get_children(stack_element)
+    active_state, set_active_state = use_state(0)
+    visited_ref = use_ref(set())
+
+    controlled_index = props.get("activeItemIndex")
+    active_index = controlled_index if controlled_index is not None else active_state
+    visible = _get_visible(active_index, visited_ref, unmount_hidden)
+
+    new_children = [
+        _with_children(child, [])
+        if index not in visible
+        and isinstance(child, BaseElement)
+        and child.name == PANEL_NAME
+        else child
+        for index, child in enumerate(children)
+    ]
+    new_props = dict(props)
+    new_props["onActiveItemChange"] = _call_handlers(
+        set_active_state, props.get("onActiveItemChange")
+    )
+    return _with_children(stack_element.with_props(new_props), new_children)
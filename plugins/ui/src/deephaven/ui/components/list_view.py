@@ -7,7 +7,7 @@ from deephaven.table import Table
 from .item_table_source import ItemTableSource
 from ..elements import Element
 from .._internal.utils import create_props, unpack_item_table_source
-from .basic import component_element
+from .basic import component_element_from_props
 from .item import Item
 from ..types import (
     ListViewDensity,
@@ -181,4 +181,4 @@ def list_view(
 
     children, props = unpack_item_table_source(children, props, SUPPORTED_SOURCE_ARGS)
 
-    return component_element("ListView", *children, **props)
+    return component_element_from_props("ListView", children, props)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+import functools
+import logging
+from typing import Any, Callable
+from .._internal import get_component_qualname
+from ..elements import FunctionElement
+from ..elements.FunctionElement import ComponentProps, MemoOptions, PropsEqualFunction
+
+logger = logging.getLogger(__name__)
+
+
+def _make_memo_component(
+    func: Callable[..., Any], are_props_equal: PropsEqualFunction | None
+) -> Callable[..., FunctionElement]:
+    """
+    Create a memoized FunctionalElement factory from the passed in function.
+
+    Args:
+        func: The function to create a FunctionalElement from.
+        are_props_equal: The function used to compare the props, or None to use the default comparison.
+    """
+
+    @functools.wraps(func)
+    def make_memo_component_node(*args: Any, key: str | None = None, **kwargs: Any):
+        component_type = get_component_qualname(func)
+        props = ComponentProps(args, kwargs)
+        memo = (
+            MemoOptions(func, props)
+            if are_props_equal is None
+            else MemoOptions(func, props, are_props_equal)
+        )
+        return FunctionElement(
+            component_type, lambda: func(*args, **kwargs), key=key, memo=memo
+        )
+
+    return make_memo_component_node
+
+
+def memo(
+    func: Callable[..., Any] | None = None,
+    *,
+    are_props_equal: PropsEqualFunction | None = None,
+):
+    """
+    Create a memoized component from the passed in function. Works like `ui.component`, except the component
+    skips re-rendering when it is called with the same arguments as the previous render and none of its state
+    has changed. Use it for components that are expensive to render and are often re-rendered by their parent
+    with the same arguments.
+
+    Can be used directly as a decorator, `@ui.memo`, or with a custom comparison, `@ui.memo(are_props_equal=fn)`.
+
+    Args:
+        func: The function to create a memoized component from. Runs when the component is being rendered.
+        are_props_equal: A function that takes the previous and next props and returns True if they are equal.
+            Each props object has the positional `args` and keyword `kwargs` the component was called with.
+            By default, the args and kwargs are compared with `==`.
+    """
+    if func is None:
+        return functools.partial(memo, are_props_equal=are_props_equal)
+
+    return _make_memo_component(func, are_props_equal)
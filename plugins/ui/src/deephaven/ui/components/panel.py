@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import Any
-from .basic import component_element
+from .basic import component_element_from_props
 from .._internal.utils import create_props
 from .types import (
     Direction,
@@ -65,8 +65,4 @@ def panel(
     """
 
     children, props = create_props(locals())
-    return component_element(
-        "Panel",
-        *children,
-        **props,
-    )
+    return component_element_from_props("Panel", children, props)
@@ -10,7 +10,7 @@ from .types import (
     Position,
     KeyboardEventCallable,
 )
-from .basic import component_element
+from .basic import component_element_from_props
 from ..elements import Element
 from .._internal.utils import create_props
 
@@ -134,4 +134,4 @@ def radio(
 
     children, props = create_props(locals())
 
-    return component_element(f"Radio", *children, **props)
+    return component_element_from_props("Radio", children, props)
@@ -17,7 +17,7 @@ from .types import (
     Orientation,
     ValidationBehavior,
 )
-from .basic import component_element
+from .basic import component_element_from_props
 from ..elements import Element
 from .._internal.utils import create_props
 
@@ -174,4 +174,4 @@ def radio_group(
 
     children, props = create_props(locals())
 
-    return component_element(f"RadioGroup", *children, **props)
+    return component_element_from_props("RadioGroup", children, props)
@@ -16,7 +16,7 @@ from .types import (
 from ..elements import Element
 from .._internal.utils import create_props, convert_date_props, wrap_local_date_callable
 from ..types import Date, LocalDateConvertible, DateRange
-from .basic import component_element
+from .basic import component_element_from_props
 from .make_component import make_component
 from deephaven.time import dh_now
 
@@ -211,4 +211,4 @@ def range_calendar(
 
     _convert_range_calendar_props(props)
 
-    return component_element("RangeCalendar", **props)
+    return component_element_from_props("RangeCalendar", (), props)
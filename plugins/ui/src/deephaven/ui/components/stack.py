@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 from .basic import component_element
+from .lazy import lazy_stack
 from ..elements import Element
 
 
@@ -10,6 +11,9 @@ def stack(
     height: float | None = None,
     width: float | None = None,
     active_item_index: int | None = None,
+    on_active_item_change: Callable[[int], None] | None = None,
+    lazy: bool = False,
+    unmount_hidden: bool = False,
     key: str | None = None,
 ) -> Element:
     """
@@ -21,16 +25,27 @@ def stack(
         height: The percent height of the stack relative to other children of its parent. If not provided, the stack will be sized automatically.
         width: The percent width of the stack relative to other children of its parent. If not provided, the stack will be sized automatically.
         active_item_index: The index of the active item in the stack.
+        on_active_item_change: Handler that is called with the index of the active item when the user selects another
+            item in the stack.
+        lazy: Whether to only render the content of a `ui.panel` child once it is the active item, so hidden panels
+            don't run their hooks, listen to tables, or add to the document sent to the client. Panels active before
+            are kept rendered.
+        unmount_hidden: With `lazy`, whether to also unmount the content of a panel when another item is active.
+            Hidden panels stop listening to tables, but lose their state.
         key: A unique identifier used by React to render elements in a list.
 
     Returns:
         The rendered stack element.
     """
-    return component_element(
+    element = component_element(
         "Stack",
         *children,
         height=height,
         width=width,
         active_item_index=active_item_index,
+        on_active_item_change=on_active_item_change,
         key=key,
     )
+    if lazy:
+        return lazy_stack(element, unmount_hidden, key=key)
+    return element
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Any, Callable, Iterable, Union
 
 from .basic import component_element
+from .lazy import lazy_tabs
 
 from .types import (
     KeyboardActivationType,
@@ -31,6 +32,8 @@ def tabs(
     default_selected_key: Key | None = None,
     on_selection_change: Callable[[Key], None] | None = None,
     on_change: Callable[[Key], None] | None = None,
+    lazy: bool = False,
+    unmount_hidden: bool = False,
     flex: LayoutFlex | None = None,
     flex_grow: float | None = 1,
     flex_shrink: float | None = None,
@@ -97,6 +100,10 @@ def tabs(
         on_selection_change: Callback for when the selected key changes.
         on_change:
             Alias of `on_selection_change`. Handler that is called when the selection changes.
+        lazy: Whether to only render the content of a tab once it is selected, so hidden tabs don't run their hooks,
+            listen to tables, or add to the document sent to the client. Tabs selected before are kept rendered.
+        unmount_hidden: With `lazy`, whether to also unmount the content of a tab when another tab is selected.
+            Hidden tabs stop listening to tables, but lose their state.
         flex: When used in a flex layout, specifies how the element will grow or shrink to fit the space available.
         flex_grow: When used in a flex layout, specifies how the element will grow to fit the space available.
         flex_shrink: When used in a flex layout, specifies how the element will shrink to fit the space available.
@@ -159,7 +166,7 @@ def tabs(
     if tab_children and (tab_list_children and tab_panels_children):
         raise TypeError("Tabs cannot have both Tab and TabList or TabPanels children.")
 
-    return component_element(
+    element = component_element(
         "Tabs",
         *children,
         disabled_keys=disabled_keys,
@@ -219,3 +226,6 @@ def tabs(
         UNSAFE_style=UNSAFE_style,
         key=key,
     )
+    if lazy:
+        return lazy_tabs(element, unmount_hidden, key=key)
+    return element
@@ -26,7 +26,7 @@ from .._internal.utils import (
     convert_time_props,
 )
 from ..types import Time, TimeGranularity
-from .basic import component_element
+from .basic import component_element_from_props
 from .make_component import make_component
 
 TimeFieldElement = Element
@@ -245,4 +245,4 @@ def time_field(
 
     _convert_time_field_props(props)
 
-    return component_element("TimeField", **props)
+    return component_element_from_props("TimeField", (), props)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from typing import Any
 from .Element import Element
 from .._internal import dict_to_react_props, RenderContext
@@ -14,6 +15,45 @@ class BaseElement(Element):
     def __init__(
         self, name: str, /, *children: Any, key: str | None = None, **props: Any
     ):
+        self._init(name, children, key, props)
+
+    @classmethod
+    def from_props(
+        cls, name: str, children: tuple[Any, ...], props: dict[str, Any]
+    ) -> BaseElement:
+        """
+        Create an element from a dict of props, instead of keyword arguments. Used by components with many props, so
+        the props are not unpacked into keyword arguments and packed into a dict again.
+
+        Args:
+            name: The name of the element.
+            children: The children of the element.
+            props: The props of the element, with snake_case names and the key. Used as is, so must not be used
+                after.
+
+        Returns:
+            The element.
+        """
+        element = cls.__new__(cls)
+        element._init(name, children, props.pop("key", None), props)
+        return element
+
+    def _init(
+        self,
+        name: str,
+        children: tuple[Any, ...],
+        key: str | None,
+        props: dict[str, Any],
+    ) -> None:
+        """
+        Initialize the element.
+
+        Args:
+            name: The name of the element.
+            children: The children of the element.
+            key: The key of the element.
+            props: The props of the element, with snake_case names.
+        """
         self._name = name
         self._key = key
         props["key"] = key
@@ -37,5 +77,26 @@ class BaseElement(Element):
     def key(self) -> str | None:
         return self._key
 
+    @property
+    def props(self) -> dict[str, Any]:
+        """
+        Get the props of the element, with the names camelCased as they are sent to the client.
+        """
+        return self._props
+
+    def with_props(self, props: dict[str, Any]) -> BaseElement:
+        """
+        Copy the element with different props.
+
+        Args:
+            props: The props of the copy, with the names camelCased as they are sent to the client.
+
+        Returns:
+            A copy of the element with the props given.
+        """
+        element = copy.copy(self)
+        element._props = props
+        return element
+
     def render(self, context: RenderContext) -> dict[str, Any]:
         return self._props
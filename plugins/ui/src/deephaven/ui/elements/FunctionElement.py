@@ -1,15 +1,76 @@
 from __future__ import annotations
 import logging
-from typing import Callable
+from typing import Any, Callable, NamedTuple
 from .Element import Element, PropsType
 from .._internal import RenderContext
 
 logger = logging.getLogger(__name__)
 
 
+class ComponentProps(NamedTuple):
+    """
+    The arguments a component function was called with.
+    """
+
+    args: tuple[Any, ...]
+    """
+    The positional arguments passed to the component.
+    """
+
+    kwargs: dict[str, Any]
+    """
+    The keyword arguments passed to the component.
+    """
+
+
+PropsEqualFunction = Callable[[ComponentProps, ComponentProps], bool]
+"""
+A function that takes the previous and next props of a memoized component and returns True if they are equal.
+"""
+
+
+def _default_props_equal(prev: ComponentProps, next: ComponentProps) -> bool:
+    """
+    Compare the props of a memoized component the same way `use_memo` compares dependencies.
+
+    Args:
+        prev: The props the component was previously rendered with.
+        next: The props the component is being rendered with.
+
+    Returns:
+        True if the props are equal.
+    """
+    return prev == next
+
+
+class MemoOptions(NamedTuple):
+    """
+    Options for a memoized component element.
+    """
+
+    component: Callable[..., Any]
+    """
+    The component function. Renders are only reused for elements of the same function.
+    """
+
+    props: ComponentProps
+    """
+    The arguments the component was called with.
+    """
+
+    are_props_equal: PropsEqualFunction = _default_props_equal
+    """
+    The function used to compare the props with the props of the previous render.
+    """
+
+
 class FunctionElement(Element):
     def __init__(
-        self, name: str, render: Callable[[], list[Element]], key: str | None = None
+        self,
+        name: str,
+        render: Callable[[], list[Element]],
+        key: str | None = None,
+        memo: MemoOptions | None = None,
     ):
         """
         Create an element that takes a function to render.
@@ -17,10 +78,14 @@ class FunctionElement(Element):
         Args:
             name: Name of the component. Typically, the module joined with the name of the function.
             render: The render function to call when the component needs to be rendered.
+            key: The key of the element.
+            memo: Options if the component is memoized. A memoized component is not re-rendered if its props are
+                equal to the props of the previous render and no state in it has changed.
         """
         self._name = name
         self._render = render
         self._key = key
+        self._memo = memo
 
     @property
     def name(self):
@@ -30,6 +95,32 @@ class FunctionElement(Element):
     def key(self) -> str | None:
         return self._key
 
+    @property
+    def memo(self) -> MemoOptions | None:
+        """
+        The memoization options of this element, or None if it is not memoized.
+        """
+        return self._memo
+
+    def is_memo_equal(self, other: Element) -> bool:
+        """
+        Check if this element is memoized and can reuse the render of another element.
+
+        Args:
+            other: The element previously rendered in the same position.
+
+        Returns:
+            True if both are elements of the same memoized component and the props are equal.
+        """
+        if (
+            self._memo is None
+            or not isinstance(other, FunctionElement)
+            or other._memo is None
+            or other._memo.component is not self._memo.component
+        ):
+            return False
+        return self._memo.are_props_equal(other._memo.props, self._memo.props)
+
     def render(self, context: RenderContext) -> PropsType:
         """
         Render the component. Should only be called when actually rendering the component, e.g. exporting it to the client.
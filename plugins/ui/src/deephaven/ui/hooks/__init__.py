@@ -6,6 +6,9 @@ from .use_ref import use_ref
 from .use_render_queue import use_render_queue
 from .use_table_listener import use_table_listener
 from .use_table_data import use_table_data
+from .use_table_arrays import use_table_arrays
+from .use_table_delta import use_table_delta
+from .use_table_op import use_table_op
 from .use_column_data import use_column_data
 from .use_row_data import use_row_data
 from .use_row_list import use_row_list
@@ -23,6 +26,9 @@ __all__ = [
     "use_render_queue",
     "use_table_listener",
     "use_table_data",
+    "use_table_arrays",
+    "use_table_delta",
+    "use_table_op",
     "use_column_data",
     "use_row_data",
     "use_row_list",
@@ -1,14 +1,64 @@
 from __future__ import annotations
 
-from typing import Callable, Any, cast, Sequence, Union
+import threading
+from concurrent.futures import Future
+from typing import Callable, Any, Coroutine, cast, Sequence, Union
 from .use_callback import use_callback
 from .use_ref import use_ref, Ref
 from deephaven.liveness_scope import LivenessScope
 from .._internal import get_context
+from .._internal.EventLoop import get_event_loop, is_coroutine
 from ..types import Dependencies
 
 CleanupFunction = Callable[[], None]
-EffectFunction = Callable[[], Union[CleanupFunction, None]]
+EffectFunction = Callable[
+    [],
+    Union[CleanupFunction, None, Coroutine[Any, Any, Union[CleanupFunction, None]]],
+]
+
+
+def _run_async_effect(
+    coro: Coroutine[Any, Any, Union[CleanupFunction, None]]
+) -> CleanupFunction:
+    """
+    Run the coroutine of an `async def` effect on the event loop of the plugin.
+
+    Args:
+        coro: The coroutine returned by the effect.
+
+    Returns:
+        A cleanup function that cancels the coroutine if it is still running. The cleanup function returned by the
+        coroutine is called once both the coroutine has finished and the cleanup has been requested.
+    """
+    lock = threading.Lock()
+    is_finished = False
+    is_cleaned_up = False
+    result_cleanup: Union[CleanupFunction, None] = None
+
+    async def run_effect() -> None:
+        nonlocal is_finished, result_cleanup
+        result = await coro
+        with lock:
+            is_finished = True
+            result_cleanup = result
+            should_cleanup = is_cleaned_up
+        if should_cleanup and result is not None:
+            # The cleanup was requested while the coroutine was finishing
+            result()
+
+    future: Future[None] = get_event_loop().run_coroutine(run_effect())
+
+    def cleanup() -> None:
+        nonlocal is_cleaned_up
+        with lock:
+            is_cleaned_up = True
+            should_cleanup = is_finished
+        if not should_cleanup:
+            future.cancel()
+        elif result_cleanup is not None:
+            result_cleanup()
+
+    return cleanup
 
 
 def use_effect(
@@ -18,6 +68,10 @@ def use_effect(
     Call a function when the dependencies change. Optionally return a cleanup function to be called when dependencies change again or component is unmounted.
     If no dependencies are passed in, the effect will be called on every render.
     If an empty list is passed in, the effect will only be called once when the component mounts.
+    The function can be an `async def` function, which runs on the event loop of the plugin without blocking the
+    render thread. It is cancelled if it is still running when the dependencies change or the component unmounts,
+    and the cleanup function it returns is called if it finished. Table operations after the first `await` are not
+    kept alive by the effect.
 
     Args:
         func: The function to call when the dependencies change.
@@ -44,6 +98,8 @@ def use_effect(
 
         with liveness_scope.open():
             effect_result = func()
+            if is_coroutine(effect_result):
+                effect_result = _run_async_effect(effect_result)
             cleanup_ref.current = effect_result
 
         scope_ref.current = liveness_scope
@@ -1,7 +1,12 @@
 from __future__ import annotations
 import logging
 from typing import Any, Callable, TypeVar, overload
-from .._internal import InitializerFunction, UpdaterFunction, get_context
+from .._internal import (
+    InitializerFunction,
+    UpdaterFunction,
+    get_context,
+    value_with_liveness,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,8 @@ def use_state(
     def set_value(new_value: T | UpdaterFunction[T]):
         # Set the value in the context state and trigger a re-render
         logger.debug("use_state set_value called with %s", new_value)
-        context.queue_render(lambda: context.set_state(hook_index, new_value))
+        # Manage the value now, the scope it was created in may be released before the state is set
+        slot = new_value if callable(new_value) else value_with_liveness(new_value)
+        context.queue_render(lambda: context.set_state(hook_index, slot))
 
     return value, set_value
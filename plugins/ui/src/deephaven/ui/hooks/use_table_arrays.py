@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sys
+from functools import partial
+from typing import Any, Callable, Sequence
+
+from deephaven.table import Table
+from deephaven.numpy import to_numpy
+
+from .use_callback import use_callback
+from .use_memo import use_memo
+from .use_table_data import _use_table_data
+from ..types import ColumnArrays, ColumnName, Sentinel
+
+
+def _get_array_data(
+    columns: Sequence[ColumnName] | None, table: Table
+) -> tuple[ColumnArrays, bool]:
+    """
+    Read the columns of the table into numpy arrays.
+    A refreshing table is snapshotted once so all the arrays are from the same point in time.
+
+    Args:
+        columns: The columns to read. If None, all columns are read.
+        table: The table to read.
+
+    Returns:
+        The arrays keyed by column name and whether the table is empty.
+    """
+    snapshot = table.snapshot() if table.is_refreshing else table
+    column_names = columns or [column.name for column in snapshot.columns]
+    arrays = {name: to_numpy(snapshot, [name])[:, 0] for name in column_names}
+    return arrays, snapshot.size == 0
+
+
+def _column_arrays(
+    data: ColumnArrays | Sentinel | None, is_sentinel: bool
+) -> ColumnArrays | Sentinel | None:
+    """
+    Return the column arrays as is.
+
+    Args:
+        data: The column arrays.
+        is_sentinel: Whether the sentinel value was returned.
+
+    Returns:
+        The column arrays, the sentinel value or None.
+    """
+    return data
+
+
+def _view_table(
+    table: Table | None,
+    columns: Sequence[ColumnName] | None,
+    first_row: int,
+    row_limit: int | None,
+) -> Table | None:
+    """
+    Restrict the table to the columns and rows requested.
+
+    Args:
+        table: The table to restrict.
+        columns: The columns to keep. If None, all columns are kept.
+        first_row: The position of the first row to keep.
+        row_limit: The maximum number of rows to keep. If None, all rows after first_row are kept.
+
+    Returns:
+        The restricted table, or None if the table is None.
+    """
+    if table is None:
+        return None
+    if columns:
+        table = table.view(list(columns))
+    if row_limit is not None:
+        table = table.slice(first_row, first_row + row_limit)
+    elif first_row > 0:
+        table = table.slice(first_row, sys.maxsize)
+    return table
+
+
+def use_table_arrays(
+    table: Table | None,
+    columns: Sequence[ColumnName] | None = None,
+    sentinel: Sentinel = (),
+    first_row: int = 0,
+    row_limit: int | None = None,
+    max_update_rate: float | None = None,
+) -> ColumnArrays | Sentinel | None:
+    """
+    Returns a dictionary of numpy arrays with the contents of the table, keyed by column name.
+    Component will redraw if the table changes, resulting in updated arrays.
+    Unlike `use_table_data`, the table is not converted to a pandas DataFrame and values are not boxed into Python
+    objects, and only the columns and rows requested are read.
+    Null values are not converted, they are the Deephaven null sentinel of the column type, e.g. `NULL_INT`.
+
+    Args:
+        table: The table to listen to. If None, None will be returned, not the sentinel value.
+        columns: The columns to read. Defaults to None, which reads all columns.
+        sentinel: The sentinel value to return if the table is ticking but empty. Defaults to an empty tuple.
+        first_row: The position of the first row to read. Defaults to 0.
+        row_limit: The maximum number of rows to read, starting at first_row. Defaults to None, which reads all rows.
+        max_update_rate: The maximum number of times per second to read the table and redraw. Updates arriving
+            faster are coalesced, and the table is read once with the latest data. Defaults to None, which uses
+            the default set with `set_default_max_update_rate`.
+
+    Returns:
+        The column arrays or the sentinel value.
+    """
+    columns = tuple(columns) if columns is not None else None
+    view = use_memo(
+        lambda: _view_table(table, columns, first_row, row_limit),
+        [table, columns, first_row, row_limit],
+    )
+    get_data: Callable[[Table], tuple[Any, bool]] = use_callback(
+        partial(_get_array_data, columns), [columns]
+    )
+
+    return _use_table_data(view, sentinel, _column_arrays, get_data, max_update_rate)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import Callable
+from typing import Any, Callable, Tuple
 import pandas as pd
 
 from deephaven.table import Table
@@ -14,11 +14,18 @@ from deephaven.update_graph import has_exclusive_lock
 
 from .use_callback import use_callback
 from .use_effect import use_effect
+from .use_memo import use_memo
 from .use_state import use_state
 from .use_table_listener import use_table_listener
 
+from .._internal.UpdateThrottle import UpdateThrottle
 from ..types import Sentinel, TableData, TransformedData
 
+TableDataGetter = Callable[[Table], Tuple[Any, bool]]
+"""
+A function that reads the data from a table. Returns the data and whether the table was empty.
+"""
+
 
 def _deferred_update(ctx: ExecutionContext, func: Callable[[], None]) -> None:
     """
@@ -33,28 +40,41 @@ def _deferred_update(ctx: ExecutionContext, func: Callable[[], None]) -> None:
 
 
 def _on_update(
-    ctx: ExecutionContext,
-    func: Callable[[], None],
-    executor_name: str,
+    throttle: UpdateThrottle,
     update: TableUpdate,
     is_replay: bool,
 ) -> None:
     """
-    Call the function within an execution context, deferring the call to a thread pool.
+    Notify the throttle of the update, which defers reading the table to a thread pool.
+    Updates arriving while a read is pending are coalesced into that read.
 
     Args:
-        ctx: The execution context to use.
-        func: The function to call.
-        executor_name: The name of the executor to use.
+        throttle: The throttle to notify.
         update: The update to pass to the function.
         is_replay: True if the update is a replay, False otherwise.
     """
-    submit_task(executor_name, partial(_deferred_update, ctx, func))
+    throttle.notify()
+
+
+def _get_pandas_data(table: Table) -> tuple[pd.DataFrame, bool]:
+    """
+    Read the table into a pandas DataFrame.
+
+    Args:
+        table: The table to read.
+
+    Returns:
+        The dataframe and whether it is empty.
+    """
+    data = to_pandas(table)
+    return data, data.empty
 
 
 def _get_data_values(
-    table: Table | None, sentinel: Sentinel
-) -> tuple[pd.DataFrame | None, bool]:
+    table: Table | None,
+    sentinel: Sentinel,
+    get_data: TableDataGetter = _get_pandas_data,
+) -> tuple[Any, bool]:
     """
     Called to get the new data and is_sentinel values when the table updates.
     None is returned if the table is None.
@@ -64,15 +84,16 @@ def _get_data_values(
     Args:
         table: The table that updated.
         sentinel: The sentinel value to return if the table is empty and refreshing.
+        get_data: The function to read the data from the table.
 
     Returns:
         The table data and whether the sentinel value was returned.
     """
     if table is None:
         return None, False
-    data = to_pandas(table)
+    data, is_empty = get_data(table)
     if table.is_refreshing:
-        if data.empty:
+        if is_empty:
             return sentinel, True
         else:
             return data, False
@@ -83,8 +104,9 @@ def _get_data_values(
 def _set_new_data(
     table: Table | None,
     sentinel: Sentinel,
-    set_data: Callable[[pd.DataFrame | Sentinel], None],
+    set_data: Callable[[Any], None],
     set_is_sentinel: Callable[[bool], None],
+    get_data: TableDataGetter = _get_pandas_data,
 ) -> None:
     """
     Called to set the new data and is_sentinel values when the table updates.
@@ -94,8 +116,9 @@ def _set_new_data(
         sentinel: The sentinel value to return if the table is empty.
         set_data: The function to call to set the new data.
         set_is_sentinel: The function to call to set the is_sentinel value.
+        get_data: The function to read the data from the table.
     """
-    new_data, new_is_sentinel = _get_data_values(table, sentinel)
+    new_data, new_is_sentinel = _get_data_values(table, sentinel, get_data)
     set_data(new_data)
     set_is_sentinel(new_is_sentinel)
 
@@ -116,34 +139,32 @@ def _table_data(
     return data if is_sentinel or data is None else data.to_dict(orient="list")
 
 
-def use_table_data(
+def _use_table_data(
     table: Table | None,
-    sentinel: Sentinel = (),
-    transform: Callable[
-        [pd.DataFrame | Sentinel | None, bool], TransformedData | Sentinel
-    ]
-    | None = None,
-) -> TableData | Sentinel | TransformedData:
+    sentinel: Sentinel,
+    transform: Callable[[Any, bool], TransformedData | Sentinel],
+    get_data: TableDataGetter,
+    max_update_rate: float | None = None,
+) -> TransformedData | Sentinel:
     """
-    Returns a dictionary with the contents of the table. Component will redraw if the table
-    changes, resulting in an updated frame.
+    Read the data of a table with the function provided, and read it again whenever the table updates.
 
     Args:
         table: The table to listen to. If None, None will be returned, not the sentinel value.
-        sentinel: The sentinel value to return if the table is ticking but empty. Defaults to an empty tuple.
-        transform: A function to transform the table data and is_sentinel values. Defaults to None, which will
-            return the data as TableData.
+        sentinel: The sentinel value to return if the table is ticking but empty.
+        transform: A function to transform the table data and is_sentinel values.
+        get_data: The function to read the data from the table. Should be memoized by the caller, as the
+            table listener is recreated when it changes.
+        max_update_rate: The maximum number of times per second to read the table. If None, the default
+            set with `set_default_max_update_rate` is used.
 
     Returns:
-        The table data or the sentinel value.
+        The transformed table data or the sentinel value.
     """
-    initial_data, initial_is_sentinel = _get_data_values(table, sentinel)
+    initial_data, initial_is_sentinel = _get_data_values(table, sentinel, get_data)
     data, set_data = use_state(initial_data)
     is_sentinel, set_is_sentinel = use_state(initial_is_sentinel)
 
-    if not transform:
-        transform = _table_data
-
     ctx = get_exec_ctx()
 
     # Decide which executor to submit callbacks to now, while we hold any locks from the caller
@@ -154,18 +175,55 @@ def use_table_data(
 
     # memoize table_updated (and listener) so that they don't cause a start and stop of the listener
     table_updated = use_callback(
-        lambda: _set_new_data(table, sentinel, set_data, set_is_sentinel),
-        [table, sentinel],
+        lambda: _set_new_data(table, sentinel, set_data, set_is_sentinel, get_data),
+        [table, sentinel, get_data],
     )
 
     # call table_updated in the case of new table or sentinel
-    use_effect(table_updated, [table, sentinel])
-    listener = use_callback(
-        partial(_on_update, ctx, table_updated, executor_name),
-        [table_updated, executor_name, ctx],
+    use_effect(table_updated, [table, sentinel, get_data])
+    throttle = use_memo(
+        lambda: UpdateThrottle(
+            partial(_deferred_update, ctx, table_updated),
+            partial(submit_task, executor_name),
+            max_update_rate,
+        ),
+        [table_updated, executor_name, ctx, max_update_rate],
     )
+    # stop any delayed read when the throttle is replaced or the component unmounts
+    use_effect(lambda: throttle.cancel, [throttle])
+    listener = use_callback(partial(_on_update, throttle), [throttle])
 
     # call table_updated every time the table updates
     use_table_listener(table, listener, [])
 
     return transform(data, is_sentinel)
+
+
+def use_table_data(
+    table: Table | None,
+    sentinel: Sentinel = (),
+    transform: Callable[
+        [pd.DataFrame | Sentinel | None, bool], TransformedData | Sentinel
+    ]
+    | None = None,
+    max_update_rate: float | None = None,
+) -> TableData | Sentinel | TransformedData:
+    """
+    Returns a dictionary with the contents of the table. Component will redraw if the table
+    changes, resulting in an updated frame.
+
+    Args:
+        table: The table to listen to. If None, None will be returned, not the sentinel value.
+        sentinel: The sentinel value to return if the table is ticking but empty. Defaults to an empty tuple.
+        transform: A function to transform the table data and is_sentinel values. Defaults to None, which will
+            return the data as TableData.
+        max_update_rate: The maximum number of times per second to read the table and redraw. Updates arriving
+            faster are coalesced, and the table is read once with the latest data. Defaults to None, which uses
+            the default set with `set_default_max_update_rate`.
+
+    Returns:
+        The table data or the sentinel value.
+    """
+    return _use_table_data(
+        table, sentinel, transform or _table_data, _get_pandas_data, max_update_rate
+    )
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Sequence, Tuple, Union, cast
+
+import jpy
+import numpy as np
+
+from deephaven.table import Table
+from deephaven.table_listener import TableUpdate
+
+from .use_callback import use_callback
+from .use_effect import use_effect
+from .use_memo import use_memo
+from .use_state import use_state
+from .use_table_arrays import _get_array_data
+from .use_table_listener import use_table_listener
+from .._internal.TableDeltaBuffer import TableDeltaBuffer
+from .._internal.UpdateThrottle import UpdateThrottle
+from ..types import ColumnArrays, ColumnName, Sentinel
+
+BufferData = Tuple[TableDeltaBuffer, ColumnArrays]
+"""
+The buffer the data was read from, and the data.
+"""
+
+
+def _row_keys(row_set) -> np.ndarray:
+    """
+    Get the row keys of a Java RowSet as a numpy array.
+
+    Args:
+        row_set: The RowSet to get the keys of.
+
+    Returns:
+        The row keys, in ascending order.
+    """
+    keys = jpy.array("long", row_set.intSize())
+    row_set.toRowKeyArray(keys)
+    return np.frombuffer(keys, dtype=np.int64)
+
+
+def _apply_update(
+    buffer: TableDeltaBuffer,
+    columns: Sequence[ColumnName] | None,
+    update: TableUpdate,
+) -> None:
+    """
+    Apply the rows removed, shifted, added and modified in a table update to the buffer, in that order.
+
+    Args:
+        buffer: The buffer to update.
+        columns: The columns to read. If None, all columns are read.
+        update: The table update.
+    """
+    cols = list(columns) if columns else None
+    j_update = update.j_table_update
+
+    removed = j_update.removed()
+    if removed is not None and removed.isNonempty():
+        buffer.remove(_row_keys(removed))
+
+    shifted = j_update.shifted()
+    if shifted is not None and shifted.nonempty():
+        ranges = range(shifted.size())
+        buffer.shift(
+            [shifted.getBeginRange(i) for i in ranges],
+            [shifted.getEndRange(i) for i in ranges],
+            [shifted.getShiftDelta(i) for i in ranges],
+        )
+
+    added = j_update.added()
+    if added is not None and added.isNonempty():
+        buffer.add(_row_keys(added), update.added(cols))
+
+    modified = j_update.modified()
+    if modified is not None and modified.isNonempty():
+        modified_columns = [
+            name for name in update.modified_columns if cols is None or name in cols
+        ]
+        if modified_columns:
+            buffer.modify(_row_keys(modified), update.modified(modified_columns))
+
+
+def _set_buffer_data(
+    buffer: TableDeltaBuffer, set_data: Callable[[BufferData], None]
+) -> None:
+    """
+    Set the data to the current contents of the buffer.
+
+    Args:
+        buffer: The buffer to read.
+        set_data: The function to call to set the new data.
+    """
+    set_data((buffer, buffer.data()))
+
+
+def _on_update(
+    buffer: TableDeltaBuffer,
+    columns: Sequence[ColumnName] | None,
+    throttle: UpdateThrottle,
+    update: TableUpdate,
+    is_replay: bool,
+) -> None:
+    """
+    Apply a table update to the buffer and notify the throttle to set the new data.
+    The update must be read while the listener is called, so it is not deferred to a thread pool.
+
+    Args:
+        buffer: The buffer to update.
+        columns: The columns to read. If None, all columns are read.
+        throttle: The throttle to notify, which sets the new data.
+        update: The table update.
+        is_replay: True if the update is a replay of the initial table contents.
+    """
+    if is_replay:
+        # the replay is the entire table, rows already in the buffer would be added again
+        buffer.clear()
+    _apply_update(buffer, columns, update)
+    throttle.notify()
+
+
+def use_table_delta(
+    table: Table | None,
+    columns: Sequence[ColumnName] | None = None,
+    sentinel: Sentinel = (),
+    max_update_rate: float | None = None,
+) -> ColumnArrays | Sentinel | None:
+    """
+    Returns a dictionary of numpy arrays with the contents of the table, keyed by column name.
+    Component will redraw if the table changes, resulting in updated arrays.
+    Unlike `use_table_data` and `use_table_arrays`, a ticking table is not read again when it updates. Only the rows
+    added, removed, modified and shifted in each update are applied to a buffer kept by the hook, so appending
+    rows to a large table costs time proportional to the rows appended.
+    The arrays are views of that buffer, so appended and modified values may show up in arrays from a previous render.
+    Copy the arrays if they need to be kept across renders.
+    Null values are not converted, they are the Deephaven null sentinel of the column type, e.g. `NULL_INT`.
+
+    Args:
+        table: The table to listen to. If None, None will be returned, not the sentinel value.
+        columns: The columns to read. Defaults to None, which reads all columns.
+        sentinel: The sentinel value to return if the table is ticking but empty, or has not been read yet.
+            Defaults to an empty tuple.
+        max_update_rate: The maximum number of times per second to redraw. Every update is still applied to the
+            buffer, but the redraws are coalesced. Defaults to None, which uses the default set with
+            `set_default_max_update_rate`.
+
+    Returns:
+        The column arrays or the sentinel value.
+    """
+    columns = tuple(columns) if columns is not None else None
+    view = use_memo(
+        lambda: table.view(list(columns)) if table is not None and columns else table,
+        [table, columns],
+    )
+    buffer = use_memo(lambda: TableDeltaBuffer(), [view])
+    static_data = use_memo(
+        lambda: _get_array_data(columns, view)[0]
+        if view is not None and not view.is_refreshing
+        else None,
+        [view, columns],
+    )
+    data, set_data = use_state(cast(Union[BufferData, None], None))
+
+    throttle = use_memo(
+        lambda: UpdateThrottle(
+            partial(_set_buffer_data, buffer, set_data),
+            max_update_rate=max_update_rate,
+        ),
+        [buffer, max_update_rate],
+    )
+    # stop any delayed redraw when the throttle is replaced or the component unmounts
+    use_effect(lambda: throttle.cancel, [throttle])
+    listener = use_callback(
+        partial(_on_update, buffer, columns, throttle),
+        [buffer, columns, throttle],
+    )
+    # replay the initial contents of the table so the buffer starts with the same row keys the updates use
+    use_table_listener(view, listener, [], do_replay=True)
+
+    if view is None:
+        return None
+    if static_data is not None:
+        return static_data
+    if data is None or data[0] is not buffer or data[0].size == 0:
+        return sentinel
+    return data[1]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, Union
+
+from deephaven.table import Table
+
+from .use_ref import use_ref, Ref
+from .._internal import get_context
+from .._internal.TableOpCache import (
+    TableOpCacheEntry,
+    get_table_op_cache,
+    make_table_op_key,
+)
+
+
+def use_table_op(
+    table: Table | None, op: str, /, *args: Any, **kwargs: Any
+) -> Table | None:
+    """
+    Derive a table with a table operation, sharing the result with all components and client sessions that derive
+    the same table. The operation is computed once for each query scope, source table, operation and arguments, and
+    the result is held by the liveness scopes of the renders using it, so it is released when no component uses it
+    anymore.
+    Use it instead of `use_memo` for tables derived the same way by many components, e.g.
+    `use_table_op(t, "where", "Sym = `AAPL`")` instead of `use_memo(lambda: t.where("Sym = `AAPL`"), [t])`.
+
+    Args:
+        table: The source table. If None, None is returned.
+        op: The name of the method of the table to call, e.g. "where" or "agg_by".
+        *args: The positional arguments to pass to the method. Must be hashable, or lists, tuples or dicts of
+            hashable values or tables.
+        **kwargs: The keyword arguments to pass to the method.
+
+    Returns:
+        The derived table, or None if the source table is None.
+    """
+    entry_ref: Ref[Union[TableOpCacheEntry, None]] = use_ref(None)
+
+    if table is None:
+        entry_ref.current = None
+        return None
+
+    key = make_table_op_key(table, op, args, kwargs)
+    if key is None:
+        raise TypeError(
+            f"Arguments of table operation '{op}' must be hashable to share the result"
+        )
+
+    context = get_context()
+    entry = entry_ref.current
+    if entry is not None and entry.key == key:
+        # The liveness scope of the last render still holds the result, hold it for this render as well
+        context.retain(entry.j_scope)
+    else:
+        # The old result is released with the liveness scope of the last render, after this render completes
+        method = getattr(table, op)
+        entry = entry_ref.current = get_table_op_cache().acquire(
+            key, lambda: method(*args, **kwargs), context.retain
+        )
+
+    return entry.table
@@ -1,30 +1,50 @@
 from __future__ import annotations
 
 import io
+import jpy
 import json
 import sys
 
+from dataclasses import dataclass
 from jsonrpc import JSONRPCResponseManager, Dispatcher
 import logging
 import threading
 import traceback
 from enum import Enum
+from functools import partial
 from queue import Queue
 from typing import Any, Callable
 from deephaven.plugin.object_type import MessageStream
-from deephaven.server.executors import submit_task
 from deephaven.execution_context import ExecutionContext, get_exec_ctx
-from deephaven.liveness_scope import liveness_scope
+from deephaven.liveness_scope import LivenessScope, liveness_scope
 
 from .._internal import wrap_callable
+from .._internal.EventLoop import get_event_loop, is_coroutine
+from .._internal.TempCallableRegistry import (
+    SharedLivenessScope,
+    TempCallableRegistry,
+)
+from .._internal.RenderScheduler import (
+    RenderPriority,
+    RenderScheduler,
+    get_render_scheduler,
+)
 from ..elements import Element
-from ..renderer import NodeEncoder, Renderer, RenderedNode
+from ..renderer import NodeEncoder, Renderer, RenderedNode, RenderMetrics
 from ..renderer.NodeEncoder import CALLABLE_KEY
+from ..renderer.DocumentDiff import (
+    diff_document,
+    diff_rendered_document,
+    encode_document_patch,
+)
 from .._internal import RenderContext, StateUpdateCallable, ExportedRenderState
 from .ErrorCode import ErrorCode
+from .ReconnectCache import ReconnectCache, get_reconnect_cache
 
 logger = logging.getLogger(__name__)
 
+_JLivenessScopeStack = jpy.get_type("io.deephaven.engine.liveness.LivenessScopeStack")
+
 
 class _RenderState(Enum):
     """
@@ -47,7 +67,51 @@ class _RenderState(Enum):
     """
 
 
+@dataclass
+class DocumentPayloadMetrics:
+    """
+    Counters for the document payloads sent to the client by an ElementMessageStream.
+    """
+
+    full_update_count: int = 0
+    """
+    Number of `documentUpdated` messages sent with the entire document.
+    """
+
+    patch_update_count: int = 0
+    """
+    Number of `documentPatched` messages sent with only the changes to the document.
+    """
+
+    bytes_sent: int = 0
+    """
+    Total number of bytes sent in document payloads.
+    """
+
+    bytes_saved: int = 0
+    """
+    Total number of bytes saved by sending patches instead of the entire document.
+    """
+
+    last_payload_size: int = 0
+    """
+    Size in bytes of the most recently sent document payload.
+    """
+
+
 class ElementMessageStream(MessageStream):
+    _patch_size_ratio: float = 0.5
+    """
+    Send a patch instead of the entire document only if the encoded patch is smaller than this ratio of the
+    encoded document. Large patches are slower for the client to apply than just parsing the whole document.
+    """
+
+    _is_reconnect_cacheable: bool = True
+    """
+    Whether the rendered element is kept in the reconnect cache when the stream closes, so a client reconnecting
+    with the same state can resume it.
+    """
+
     _manager: JSONRPCResponseManager
     """
     Handle incoming requests from the client.
@@ -101,22 +165,18 @@ class ElementMessageStream(MessageStream):
 
     _callable_dict: dict[str, Callable]
     """
-    Dict of callable IDs to callables.
-    This is intended to be used by the renderer and can be replaced on each render.
+    Dict of callable IDs to wrapped callables.
+    This is intended to be used by the renderer and can be replaced on each render. The wrappers of callables that are
+    still alive are carried over to the next render.
     """
 
-    _temp_callable_dict: dict[str, Callable]
+    _temp_callables: TempCallableRegistry
     """
-    Dict of callable IDs to callables returned from other callables.
-    These are not generated by the renderer and can be removed by the client.
+    Registry of callables returned from other callables.
+    These are not generated by the renderer and can be removed by the client, or evicted if they are not used.
     This should not be cleaned out on each render like _callable_dict.
     """
 
-    _next_temp_callable_id: int
-    """
-    The next ID to use for temporary callables.
-    """
-
     _render_lock: threading.Lock
     """
     Lock to ensure only one thread is rendering at a time.
@@ -132,11 +192,53 @@ class ElementMessageStream(MessageStream):
     The thread the render loop is running on.
     """
 
+    _render_priority: RenderPriority
+    """
+    The priority of the next run of the render loop. Interactive if a message from the client is waiting.
+    """
+
+    _scheduler: RenderScheduler
+    """
+    The scheduler that runs the render loop.
+    """
+
     _is_dirty: bool
     """
     Whether or not the element needs a re-render.
     """
 
+    _last_root: RenderedNode | None
+    """
+    The root node of the last document sent to the client, used to compute the next patch.
+    None if the next update needs to send the entire document.
+    """
+
+    _last_state: ExportedRenderState | None
+    """
+    The last state sent to the client, used to compute the next state patch.
+    The context caches the exported state, so it is the same instance if the state has not changed.
+    """
+
+    _last_render: tuple[RenderedNode, ExportedRenderState] | None
+    """
+    The last document rendered and its state, kept in the reconnect cache when the stream closes.
+    """
+
+    _reconnect_cache: ReconnectCache
+    """
+    The cache the rendered element is kept in when the stream closes, and resumed from when the client connects.
+    """
+
+    _payload_metrics: DocumentPayloadMetrics
+    """
+    Counters for the document payloads sent to the client.
+    """
+
+    _render_metrics: RenderMetrics
+    """
+    Timings and sizes of the render loop.
+    """
+
     _exec_context: ExecutionContext
     """
     Captured ExecutionContext for this stream, to wrap all user code.
@@ -162,32 +264,51 @@ class ElementMessageStream(MessageStream):
         self._manager = JSONRPCResponseManager()
         self._dispatcher = self._make_dispatcher()
         self._encoder = NodeEncoder(separators=(",", ":"))
-        self._context = RenderContext(self._queue_state_update, self._queue_callable)
-        self._renderer = Renderer(self._context)
+        self._init_renderer()
         self._update_queue = Queue()
         self._callable_queue = Queue()
         self._callable_dict = {}
-        self._temp_callable_dict = {}
-        self._next_temp_callable_id = 0
+        self._temp_callables = TempCallableRegistry()
         self._render_lock = threading.Lock()
         self._is_dirty = False
         self._render_state = _RenderState.IDLE
+        self._render_thread = None
+        self._render_priority = RenderPriority.BACKGROUND
+        self._scheduler = get_render_scheduler()
+        self._last_root = None
+        self._last_state = None
+        self._last_render = None
+        self._reconnect_cache = get_reconnect_cache()
+        self._payload_metrics = DocumentPayloadMetrics()
         self._exec_context = get_exec_ctx()
         self._is_closed = False
 
+    def _init_renderer(self) -> None:
+        """
+        Create the render context, metrics and renderer the element is rendered with.
+        """
+        self._context = RenderContext(self._queue_state_update, self._queue_callable)
+        self._render_metrics = RenderMetrics(self._element.name)
+        self._renderer = Renderer(self._context, self._render_metrics)
+
     def _render(self) -> None:
         logger.debug("ElementMessageStream._render")
 
         # Resolve any pending state updates first
+        state_update_count = 0
         while not self._update_queue.empty():
             state_update = self._update_queue.get()
             state_update()
+            state_update_count += 1
 
         self._is_dirty = False
+        self._render_metrics.record_render(state_update_count)
 
         try:
-            node = self._renderer.render(self._element)
-            state = self._context.export_state()
+            with self._render_metrics.time_phase("render"):
+                node = self._renderer.render(self._element)
+            with self._render_metrics.time_phase("export_state"):
+                state = self._context.export_state()
             self._send_document_update(node, state)
         except Exception as e:
             # Send the error to the client for displaying to the user
@@ -207,14 +328,19 @@ class ElementMessageStream(MessageStream):
                 with self._render_lock:
                     self._render_thread = threading.current_thread()
                     self._render_state = _RenderState.RENDERING
-
-                while not self._callable_queue.empty():
-                    item = self._callable_queue.get()
-                    with liveness_scope():
-                        try:
-                            item()
-                        except Exception as e:
-                            logger.exception(e)
+                    self._render_priority = RenderPriority.BACKGROUND
+
+                self._render_metrics.record_callable_queue_depth(
+                    self._callable_queue.qsize()
+                )
+                with self._render_metrics.time_phase("process_callables"):
+                    while not self._callable_queue.empty():
+                        item = self._callable_queue.get()
+                        with liveness_scope():
+                            try:
+                                item()
+                            except Exception as e:
+                                logger.exception(e)
 
                 if self._is_dirty:
                     self._render()
@@ -224,13 +350,13 @@ class ElementMessageStream(MessageStream):
                     if not self._callable_queue.empty() or self._is_dirty:
                         # There are still callables to process, so queue up another render
                         self._render_state = _RenderState.QUEUED
-                        submit_task("concurrent", self._process_callable_queue)
+                        self._schedule_render()
                     else:
                         self._render_state = _RenderState.IDLE
         except Exception as e:
             # Something catastrophic happened, log it and close the connection
             # We're just being safe to make sure there is an error logged if something unexpected does occur,
-            # as `submit_task` does not log any uncaught exceptions currently: https://github.com/deephaven/deephaven-core/issues/5192
+            # as the executor does not log any uncaught exceptions currently: https://github.com/deephaven/deephaven-core/issues/5192
             logger.exception(e)
             self._connection.on_close()
 
@@ -243,11 +369,31 @@ class ElementMessageStream(MessageStream):
         self._is_dirty = True
         self._queue_render()
 
-    def _queue_render(self) -> None:
+    def _queue_render(
+        self, priority: RenderPriority = RenderPriority.BACKGROUND
+    ) -> None:
+        """
+        Queue up a run of the render loop, if it is not already queued or running.
+
+        Args:
+            priority: The priority of the run. Raises the priority of a run that is already queued.
+        """
         with self._render_lock:
+            self._render_priority = min(self._render_priority, priority)
             if self._render_state is _RenderState.IDLE:
                 self._render_state = _RenderState.QUEUED
-                submit_task("concurrent", self._process_callable_queue)
+                self._schedule_render()
+            elif self._render_state is _RenderState.QUEUED:
+                # Promote the queued run if it is a lower priority
+                self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        """
+        Schedule the render loop with the scheduler. Must be called with the render lock held.
+        """
+        self._scheduler.schedule(
+            self, self._process_callable_queue, self._render_priority
+        )
 
     def _queue_state_update(self, state_update: StateUpdateCallable) -> None:
         """
@@ -256,6 +402,13 @@ class ElementMessageStream(MessageStream):
         Args:
             state_update: The state update to queue
         """
+        if get_event_loop().is_loop_thread():
+            # Set from an async event handler or effect, marshal it back to the render thread
+            self._queue_callable(
+                partial(self._queue_state_update, state_update),
+                RenderPriority.INTERACTIVE,
+            )
+            return
         current_thread = threading.current_thread()
         if current_thread is not self._render_thread:
             raise ValueError(
@@ -264,15 +417,20 @@ class ElementMessageStream(MessageStream):
         self._update_queue.put(state_update)
         self._mark_dirty()
 
-    def _queue_callable(self, callable: Callable[[], None]) -> None:
+    def _queue_callable(
+        self,
+        callable: Callable[[], None],
+        priority: RenderPriority = RenderPriority.BACKGROUND,
+    ) -> None:
         """
         Queue a callable to put on the render queue.
 
         Args:
             callable: The callable to queue
+            priority: The priority of the render loop run that calls it
         """
         self._callable_queue.put(callable)
-        self._queue_render()
+        self._queue_render(priority)
 
     def start(self) -> None:
         """
@@ -286,11 +444,35 @@ class ElementMessageStream(MessageStream):
         logger.debug("Closing ElementMessageStream")
 
         # The connection is closed, so this component will not update anymore
-        # delete the context so the objects in the collected scope are released
-        self._context.unmount()
+        # delete the context so the objects in the collected scope are released,
+        # unless it is kept for the client to resume if it reconnects
+        self._scheduler.cancel(self)
+        self._temp_callables.clear()
+        if self._can_park():
+            assert self._last_render is not None
+            self._reconnect_cache.park(self._element, self._context, *self._last_render)
+        else:
+            self._context.unmount()
         del self._context
+        self._render_metrics.close()
         self._is_closed = True
 
+    def _can_park(self) -> bool:
+        """
+        Check if the rendered element can be kept in the reconnect cache when the stream closes.
+        Only an element whose last render was sent and that has no work pending can be resumed as is.
+
+        Returns:
+            True if the element can be kept.
+        """
+        return (
+            self._is_reconnect_cacheable
+            and self._reconnect_cache.is_enabled
+            and self._last_render is not None
+            and not self._is_dirty
+            and self._callable_queue.empty()
+        )
+
     def on_data(self, payload: bytes, references: list[Any]) -> None:
         """
         Handle incoming data from the client. Dispatches commands on the render thread.
@@ -312,8 +494,9 @@ class ElementMessageStream(MessageStream):
             logger.debug("Response: %s, %s", type(response_payload), response_payload)
             self._connection.on_data(response_payload.encode(), [])
 
-        # Queue up handling of all incoming messages from the client onto the render thread
-        self._queue_callable(handle_message)
+        # Queue up handling of all incoming messages from the client onto the render thread,
+        # ahead of renders from background work such as table updates
+        self._queue_callable(handle_message, RenderPriority.INTERACTIVE)
 
     def _get_next_message_id(self) -> int:
         """
@@ -369,34 +552,82 @@ class ElementMessageStream(MessageStream):
             state: The state to set
         """
         logger.debug("Setting state: %s", state)
+        # The client is starting fresh, so it needs the entire document and state on the next update
+        self._last_root = None
+        self._last_state = None
+        if self._last_render is None and self._resume(state):
+            return
         self._context.import_state(state)
         self._mark_dirty()
 
+    def _resume(self, state: ExportedRenderState) -> bool:
+        """
+        Resume the element kept in the reconnect cache with the same state, if any. Sends the last document rendered
+        right away instead of rendering the element again. Work queued while the element was kept is run next.
+
+        Args:
+            state: The state sent by the client
+
+        Returns:
+            True if the element was resumed.
+        """
+        parked = self._reconnect_cache.resume(self._element, state)
+        if parked is None:
+            return False
+        logger.debug("Resuming parked render of %s", self._element.name)
+        self._context.unmount()
+        self._context = parked.context
+        self._context.set_callbacks(self._queue_state_update, self._queue_callable)
+        self._renderer = Renderer(self._context, self._render_metrics)
+        self._send_document_update(parked.root, parked.state)
+        while not parked.update_queue.empty():
+            self._update_queue.put(parked.update_queue.get())
+            self._mark_dirty()
+        while not parked.callable_queue.empty():
+            self._queue_callable(parked.callable_queue.get())
+        return True
+
     def _call_callable(self, callable_id: str, args: Any) -> Any:
         """
         Call a callable by its ID.
-        If the result is a callable, it is registered as a temporary callable.
+        If the result is a callable, it is registered as a temporary callable. Objects created by the call are kept
+        alive until the temporary callables returned are closed or evicted. If no callables are returned, they are
+        kept alive as if the call was made without a liveness scope.
+        If the callable is an `async def` function, the coroutine is run on the event loop of the plugin and None is
+        returned without waiting for it, so it does not block the render thread.
 
         Args:
             callable_id: The ID of the callable to call
             args: The array of arguments to pass to the callable. These will be spread as positional args to the callable.
         """
         logger.debug("Calling callable %s with %s", callable_id, args)
-        fn = self._callable_dict.get(callable_id) or self._temp_callable_dict.get(
+        fn = self._callable_dict.get(callable_id) or self._temp_callables.get(
             callable_id
         )
         if fn is None:
             logger.error("Callable not found: %s", callable_id)
             return
-        result = fn(*args)
+        scope = LivenessScope()
+        try:
+            with scope.open():
+                result = fn(*args)
+        except Exception:
+            scope.release()
+            raise
+        if is_coroutine(result):
+            get_event_loop().run_coroutine(result)
+            result = None
+
+        # Shared by the temporary callables returned, released once they have all been removed
+        shared_scope: SharedLivenessScope | None = None
 
         def serialize_callables(node: Any) -> Any:
+            nonlocal shared_scope
             if callable(node):
-                new_id = f"tempCb{self._next_temp_callable_id}"
-                self._next_temp_callable_id += 1
-                self._temp_callable_dict[new_id] = node
+                if shared_scope is None:
+                    shared_scope = SharedLivenessScope(scope)
                 return {
-                    CALLABLE_KEY: new_id,
+                    CALLABLE_KEY: self._temp_callables.register(node, shared_scope),
                 }
             raise TypeError(
                 f"A Deephaven UI callback returned a non-serializable value. Object of type {type(node).__name__} is not JSON serializable"
@@ -412,6 +643,14 @@ class ElementMessageStream(MessageStream):
             return {
                 "serialization_error": f"Cannot serialize callable {callable_id} result"
             }
+        finally:
+            if shared_scope is not None:
+                shared_scope.release()
+            else:
+                # No callables hold the objects created by the call, hand them to the enclosing scope as if no
+                # scope was opened, instead of releasing them before anything else can manage them
+                scope.j_scope.transferTo(_JLivenessScopeStack.peek())
+                scope.release()
 
     def _close_callable(self, callable_id: str) -> None:
         """
@@ -422,13 +661,29 @@ class ElementMessageStream(MessageStream):
         """
         logger.debug("Closing callable %s", callable_id)
         self._callable_dict.pop(callable_id, None)
-        self._temp_callable_dict.pop(callable_id, None)
+        self._temp_callables.close(callable_id)
+
+    @property
+    def render_metrics(self) -> RenderMetrics:
+        """
+        Get the timings and sizes of the render loop.
+        """
+        return self._render_metrics
+
+    @property
+    def payload_metrics(self) -> DocumentPayloadMetrics:
+        """
+        Get the counters for the document payloads sent to the client.
+        """
+        return self._payload_metrics
 
     def _send_document_update(
         self, root: RenderedNode, state: ExportedRenderState
     ) -> None:
         """
-        Send a document update to the client. Currently just sends the entire document for each update.
+        Send a document update to the client. Sends only the changes since the last document sent if they are
+        sufficiently smaller than the entire document, otherwise sends the entire document.
+        With a document patch, the state is only sent if it changed, as a patch of the last state sent.
 
         Args:
             root: The root node of the document to send
@@ -438,27 +693,89 @@ class ElementMessageStream(MessageStream):
             logger.error("Stream is closed, cannot render document")
             sys.exit()
 
-        # TODO(#67): Send a diff of the document instead of the entire document.
-        encoder_result = self._encoder.encode_node(root)
+        metrics = self._render_metrics
+        with metrics.time_phase("encode"):
+            encoder_result = self._encoder.encode_node(root)
         encoded_document = encoder_result["encoded_node"]
         new_objects = encoder_result["new_objects"]
         callable_id_dict = encoder_result["callable_id_dict"]
 
         logger.debug("Exported state: %s", state)
-        encoded_state = json.dumps(state)
 
-        request = self._make_notification(
-            "documentUpdated", encoded_document, encoded_state
+        with metrics.time_phase("diff"):
+            encoded_patch = (
+                encode_document_patch(
+                    diff_rendered_document(self._last_root, root),
+                    self._encoder.encode_value,
+                )
+                if self._last_root is not None
+                else None
+            )
+        is_patch = (
+            encoded_patch is not None
+            and len(encoded_patch) < len(encoded_document) * self._patch_size_ratio
         )
-        payload = json.dumps(request)
+        with metrics.time_phase("encode_state"):
+            state_params = (
+                self._encode_state_patch(state) if is_patch else [json.dumps(state)]
+            )
+        if is_patch:
+            request = self._make_notification(
+                "documentPatched", encoded_patch, *state_params
+            )
+            self._payload_metrics.patch_update_count += 1
+            self._payload_metrics.bytes_saved += len(encoded_document) - len(
+                encoded_patch
+            )
+        else:
+            request = self._make_notification(
+                "documentUpdated", encoded_document, *state_params
+            )
+            self._payload_metrics.full_update_count += 1
+        self._last_root = root
+        self._last_state = state
+        self._last_render = (root, state)
+
+        with metrics.time_phase("serialize"):
+            payload = json.dumps(request)
         logger.debug(f"Sending payload: {payload}")
 
+        # The encoder assigns an ID to each callable while it is alive and never reuses it, so the wrapper of a callable
+        # ID from the last render is reused instead of wrapping the callable again
+        wrapped_callables = self._callable_dict
         callable_dict = {}
         for callable, callable_id in callable_id_dict.items():
-            logger.debug("Registering callable %s", callable_id)
-            callable_dict[callable_id] = wrap_callable(callable)
+            wrapped = wrapped_callables.get(callable_id)
+            if wrapped is None:
+                logger.debug("Registering callable %s", callable_id)
+                wrapped = wrap_callable(callable)
+            callable_dict[callable_id] = wrapped
         self._callable_dict = callable_dict
-        self._connection.on_data(payload.encode(), new_objects)
+
+        encoded_payload = payload.encode()
+        self._payload_metrics.bytes_sent += len(encoded_payload)
+        self._payload_metrics.last_payload_size = len(encoded_payload)
+        metrics.record_document_size(len(encoded_document), len(encoded_payload))
+        with metrics.time_phase("send"):
+            self._connection.on_data(encoded_payload, new_objects)
+
+    def _encode_state_patch(self, state: ExportedRenderState) -> list[str | None]:
+        """
+        Encode the params of the state for a `documentPatched` message. No params if the state has not changed since
+        the last state sent, otherwise no full state and a patch of the last state sent.
+
+        Args:
+            state: The state to send
+
+        Returns:
+            The state params of the message.
+        """
+        if state is self._last_state:
+            return []
+        state_patch = diff_document(self._last_state, state)
+        if len(state_patch) == 0:
+            return []
+        return [None, json.dumps(state_patch, separators=(",", ":"))]
 
     def _send_document_error(self, error: Exception, stack_trace: str) -> None:
         """
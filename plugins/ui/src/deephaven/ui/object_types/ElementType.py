@@ -3,6 +3,7 @@ from typing import Any
 from deephaven.plugin.object_type import BidirectionalObjectType, MessageStream
 from ..elements import Element
 from .ElementMessageStream import ElementMessageStream
+from .SharedElementMessageStream import connect_shared_client, is_shared
 
 
 class ElementType(BidirectionalObjectType):
@@ -22,6 +23,11 @@ class ElementType(BidirectionalObjectType):
     ) -> MessageStream:
         if not isinstance(obj, Element):
             raise TypeError(f"Expected Element, got {type(obj)}")
-        client_connection = ElementMessageStream(obj, connection)
+        if is_shared(obj):
+            client_connection: ElementMessageStream = connect_shared_client(
+                obj, connection
+            )
+        else:
+            client_connection = ElementMessageStream(obj, connection)
         client_connection.start()
         return client_connection
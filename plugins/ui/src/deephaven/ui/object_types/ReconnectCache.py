@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from queue import Queue
+from typing import Callable, Tuple
+
+from .._internal import RenderContext, StateUpdateCallable, ExportedRenderState
+from ..elements import Element
+from ..renderer import RenderedNode
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconnectCacheMetrics:
+    """
+    Counters for the rendered elements kept for clients reconnecting.
+    """
+
+    parked: int = 0
+    """
+    Number of rendered elements kept after their client disconnected.
+    """
+
+    hits: int = 0
+    """
+    Number of clients that resumed a kept element instead of rendering it again.
+    """
+
+    misses: int = 0
+    """
+    Number of clients that found a kept element for the same element, but with different state.
+    """
+
+    evictions: int = 0
+    """
+    Number of kept elements unmounted because they expired or the cache was full.
+    """
+
+
+def _normalize_state(state: ExportedRenderState) -> str:
+    """
+    Encode state to compare state exported by the server with state sent by the client, which went through a JSON
+    round trip that turned the keys into strings.
+
+    Args:
+        state: The state to encode.
+
+    Returns:
+        The state as JSON with sorted keys.
+    """
+    return json.dumps(json.loads(json.dumps(state)), sort_keys=True)
+
+
+class ParkedRender:
+    """
+    The live context and last render of an element whose client disconnected. The context keeps running while
+    parked, and state updates and callables it queues are kept to run when a client resumes it.
+    """
+
+    def __init__(
+        self,
+        element: Element,
+        context: RenderContext,
+        root: RenderedNode,
+        state: ExportedRenderState,
+    ):
+        """
+        Park a context.
+
+        Args:
+            element: The element rendered.
+            context: The context of the element, which is moved to this parked render.
+            root: The last document rendered.
+            state: The state exported with the last document.
+        """
+        self.element = element
+        self.context = context
+        self.root = root
+        self.state = state
+        self.normalized_state = _normalize_state(state)
+        self.update_queue: Queue[StateUpdateCallable] = Queue()
+        self.callable_queue: Queue[Callable[[], None]] = Queue()
+        self.timer: threading.Timer | None = None
+        context.set_callbacks(self.update_queue.put, self.callable_queue.put)
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether the state changed or work was queued while parked, so the element needs to render again.
+        """
+        return not self.update_queue.empty() or not self.callable_queue.empty()
+
+
+class ReconnectCache:
+    """
+    Keeps the context and last render of elements after their client disconnects, so a client reconnecting with the
+    same state is sent the last document right away instead of rebuilding the contexts and rendering again.
+    Entries are evicted after `ttl` seconds, or when more than `max_entries` are kept, and their context unmounted.
+    """
+
+    def __init__(self, max_entries: int = 16, ttl: float = 60):
+        """
+        Create a reconnect cache.
+
+        Args:
+            max_entries: The maximum number of elements to keep. 0 disables the cache.
+            ttl: The number of seconds to keep an element after its client disconnects.
+        """
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Tuple[int, int], ParkedRender] = OrderedDict()
+        self._metrics = ReconnectCacheMetrics()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._next_id = 0
+
+    def configure(self, max_entries: int | None = None, ttl: float | None = None):
+        """
+        Change the limits of the cache. Limits that are None are left unchanged.
+
+        Args:
+            max_entries: The maximum number of elements to keep. 0 disables the cache.
+            ttl: The number of seconds to keep an element after its client disconnects.
+        """
+        if max_entries is not None and max_entries < 0:
+            raise ValueError(f"max_entries must not be negative, got {max_entries}")
+        if ttl is not None and ttl < 0:
+            raise ValueError(f"ttl must not be negative, got {ttl}")
+        with self._lock:
+            if max_entries is not None:
+                self._max_entries = max_entries
+            if ttl is not None:
+                self._ttl = ttl
+            evicted = self._evict_over_limit()
+        for entry in evicted:
+            self._unmount(entry)
+
+    @property
+    def metrics(self) -> ReconnectCacheMetrics:
+        """
+        A copy of the counters of this cache.
+        """
+        with self._lock:
+            return dataclasses.replace(self._metrics)
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Whether elements are kept after their client disconnects.
+        """
+        return self._max_entries > 0 and self._ttl > 0
+
+    def park(
+        self,
+        element: Element,
+        context: RenderContext,
+        root: RenderedNode,
+        state: ExportedRenderState,
+    ) -> None:
+        """
+        Keep the context and last render of an element after its client disconnected.
+
+        Args:
+            element: The element rendered.
+            context: The context of the element.
+            root: The last document rendered.
+            state: The state exported with the last document.
+        """
+        entry = ParkedRender(element, context, root, state)
+        with self._lock:
+            key = (id(element), self._next_id)
+            self._next_id += 1
+            self._entries[key] = entry
+            self._metrics.parked += 1
+            entry.timer = threading.Timer(self._ttl, self._expire, [key])
+            entry.timer.daemon = True
+            entry.timer.start()
+            evicted = self._evict_over_limit()
+        for evicted_entry in evicted:
+            self._unmount(evicted_entry)
+
+    def resume(
+        self, element: Element, state: ExportedRenderState
+    ) -> ParkedRender | None:
+        """
+        Take the parked render of an element with the state given, if any.
+        The context is removed from the cache, and its callbacks must be set by the caller.
+
+        Args:
+            element: The element the client is opening.
+            state: The state sent by the client.
+
+        Returns:
+            The parked render, or None if there is none for the element with the same state.
+        """
+        normalized_state: str | None = None
+        with self._lock:
+            for key, entry in reversed(self._entries.items()):
+                if entry.element is not element:
+                    continue
+                if normalized_state is None:
+                    normalized_state = _normalize_state(state)
+                if entry.normalized_state == normalized_state:
+                    del self._entries[key]
+                    self._metrics.hits += 1
+                    break
+            else:
+                if normalized_state is not None:
+                    self._metrics.misses += 1
+                return None
+        if entry.timer is not None:
+            entry.timer.cancel()
+        return entry
+
+    def _expire(self, key: Tuple[int, int]) -> None:
+        """
+        Evict an entry when it expires.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return
+            self._metrics.evictions += 1
+        self._unmount(entry)
+
+    def _evict_over_limit(self) -> list[ParkedRender]:
+        """
+        Remove the oldest entries over the max entries. Must be called with the lock held.
+
+        Returns:
+            The entries removed, to unmount without the lock held.
+        """
+        evicted = []
+        while len(self._entries) > self._max_entries:
+            _, entry = self._entries.popitem(last=False)
+            if entry.timer is not None:
+                entry.timer.cancel()
+            evicted.append(entry)
+            self._metrics.evictions += 1
+        return evicted
+
+    def _unmount(self, entry: ParkedRender) -> None:
+        """
+        Unmount the context of an evicted entry, so it releases its objects and stops listening to tables.
+
+        Args:
+            entry: The entry evicted.
+        """
+        logger.debug("Evicting parked render of %s", entry.element.name)
+        try:
+            entry.context.unmount()
+        except Exception as e:
+            logger.exception("Error unmounting parked render: %s", e)
+
+
+_reconnect_cache = ReconnectCache()
+
+
+def get_reconnect_cache() -> ReconnectCache:
+    """
+    Get the cache of elements kept for clients reconnecting.
+
+    Returns:
+        The reconnect cache.
+    """
+    return _reconnect_cache
+
+
+def configure_reconnect_cache(
+    max_entries: int | None = None, ttl: float | None = None
+) -> None:
+    """
+    Configure how rendered elements are kept after their client disconnects, so a client reconnecting with the same
+    state, e.g. after a network blip, is sent the last document right away instead of rendering the element again.
+    Kept elements keep running, e.g. listening to tables, until they expire. Limits that are None are left unchanged.
+
+    Args:
+        max_entries: The maximum number of elements to keep. 0 disables the cache. Defaults to 16.
+        ttl: The number of seconds to keep an element after its client disconnects. Defaults to 60.
+    """
+    _reconnect_cache.configure(max_entries, ttl)
+
+
+def get_reconnect_cache_metrics() -> ReconnectCacheMetrics:
+    """
+    Get the counters for the rendered elements kept for clients reconnecting.
+
+    Returns:
+        A copy of the counters.
+    """
+    return _reconnect_cache.metrics
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from typing import Any, TypeVar
+
+from deephaven.plugin.object_type import MessageStream
+
+from .._internal import ExportedRenderState
+from .._internal.RenderScheduler import RenderPriority
+from ..elements import Element
+from ..renderer import RenderedNode
+from .ElementMessageStream import ElementMessageStream
+
+logger = logging.getLogger(__name__)
+
+E = TypeVar("E", bound=Element)
+
+_shared_elements: weakref.WeakSet[Element] = weakref.WeakSet()
+"""
+Elements that are rendered once for all the clients connected to them.
+"""
+
+_shared_hosts: dict[Element, SharedElementHost] = {}
+"""
+The host rendering each shared element that has clients connected.
+"""
+
+_shared_hosts_lock = threading.Lock()
+
+
+def shared(element: E) -> E:
+    """
+    Render an element once for all the clients that open it, instead of once for each client.
+    Every client sees the same document, and state changes made by one client, such as from an event handler,
+    are seen by all clients. Hooks like `use_table_data` only listen to the table once for all clients.
+    Use it for dashboards and components opened by many users that don't have state specific to each user.
+
+    There is no state kept per client. All hook state, such as from `use_state`, is kept in one context for all clients,
+    so state set by one user, such as a filter they type, is shown to every other user, including users that
+    shouldn't see it. Don't share elements whose state is private to a user or differs between clients.
+
+    Args:
+        element: The element to share.
+
+    Returns:
+        The same element, marked as shared.
+    """
+    _shared_elements.add(element)
+    return element
+
+
+def is_shared(element: Element) -> bool:
+    """
+    Check if an element is rendered once for all the clients that open it.
+
+    Args:
+        element: The element to check.
+
+    Returns:
+        True if the element was marked with `shared`.
+    """
+    return element in _shared_elements
+
+
+def connect_shared_client(
+    element: Element, connection: MessageStream
+) -> SharedElementMessageStream:
+    """
+    Connect a client to the host rendering a shared element, creating the host if no other client is connected.
+
+    Args:
+        element: The shared element to connect to.
+        connection: The connection to the client.
+
+    Returns:
+        The message stream for the client.
+    """
+    with _shared_hosts_lock:
+        host = _shared_hosts.get(element)
+        if host is None:
+            host = _shared_hosts[element] = SharedElementHost(element)
+        return host.add_client(connection)
+
+
+class _BroadcastConnection(MessageStream):
+    """
+    Connection of a host that sends the data to all the clients connected to the host.
+    """
+
+    def __init__(self, host: SharedElementHost):
+        self._host = weakref.ref(host)
+
+    def on_data(self, payload: bytes, references: list[Any]) -> None:
+        host = self._host()
+        if host is not None:
+            for client in host.clients:
+                client._connection.on_data(payload, references)
+
+    def on_close(self) -> None:
+        host = self._host()
+        if host is not None:
+            for client in host.clients:
+                client._connection.on_close()
+
+
+class SharedElementHost(ElementMessageStream):
+    """
+    Renders a shared element once for all the clients connected to it. Each render is encoded and sent by each
+    client, as the objects exported and callables registered are specific to each connection.
+    """
+
+    _is_reconnect_cacheable = False
+    """
+    The host closes when its last client disconnects, and a reconnecting client starts a new host, so there is nothing
+    to resume it from.
+    """
+
+    _clients: list[SharedElementMessageStream]
+    """
+    The clients connected to this host.
+    """
+
+    _clients_lock: threading.Lock
+    """
+    Lock for the list of clients, which is changed from the connection threads.
+    """
+
+    _last_render: tuple[RenderedNode, ExportedRenderState] | None
+    """
+    The last document rendered and its state, sent to clients when they connect.
+    """
+
+    _is_state_imported: bool
+    """
+    Whether the state has been imported from a client. Only the state of the first client is imported.
+    """
+
+    def __init__(self, element: Element):
+        """
+        Create a host for a shared element.
+
+        Args:
+            element: The element to render.
+        """
+        super().__init__(element, _BroadcastConnection(self))
+        self._clients = []
+        self._clients_lock = threading.Lock()
+        self._last_render = None
+        self._is_state_imported = False
+
+    @property
+    def clients(self) -> list[SharedElementMessageStream]:
+        """
+        A copy of the list of clients connected to this host.
+        """
+        with self._clients_lock:
+            return list(self._clients)
+
+    def add_client(self, connection: MessageStream) -> SharedElementMessageStream:
+        """
+        Connect a client to this host.
+
+        Args:
+            connection: The connection to the client.
+
+        Returns:
+            The message stream for the client.
+        """
+        client = SharedElementMessageStream(self, connection)
+        with self._clients_lock:
+            self._clients.append(client)
+        return client
+
+    def remove_client(self, client: SharedElementMessageStream) -> None:
+        """
+        Disconnect a client from this host. Closes the host when the last client disconnects.
+
+        Args:
+            client: The client to disconnect.
+        """
+        with _shared_hosts_lock:
+            with self._clients_lock:
+                self._clients.remove(client)
+                is_empty = len(self._clients) == 0
+            if is_empty:
+                if _shared_hosts.get(self._element) is self:
+                    del _shared_hosts[self._element]
+                self.on_close()
+
+    def set_client_state(
+        self, client: SharedElementMessageStream, state: ExportedRenderState
+    ) -> None:
+        """
+        Handle the initial state sent by a client. The state of the first client is used for all clients, later
+        clients are sent the last document rendered. Called on the render thread.
+
+        Args:
+            client: The client that sent the state.
+            state: The state sent by the client.
+        """
+        if self._last_render is not None:
+            client._send_document_update(*self._last_render)
+        elif not self._is_state_imported:
+            self._is_state_imported = True
+            self._context.import_state(state)
+            self._mark_dirty()
+        else:
+            # The first render has not finished, or failed. Render again, which is sent to this client as well.
+            self._mark_dirty()
+
+    def _send_document_update(
+        self, root: RenderedNode, state: ExportedRenderState
+    ) -> None:
+        """
+        Send the rendered document to all the clients. Each client encodes the document for its connection.
+
+        Args:
+            root: The root node of the document to send
+            state: The state of the node to preserve
+        """
+        self._last_render = (root, state)
+        for client in self.clients:
+            if client._is_closed:
+                continue
+            try:
+                client._send_document_update(root, state)
+            except Exception as e:
+                logger.exception(
+                    "Error sending shared document update to client: %s", e
+                )
+
+
+class SharedElementMessageStream(ElementMessageStream):
+    """
+    Message stream for one client of a shared element. The element is rendered by the host, and this stream encodes
+    the rendered document for its client and handles the messages from it on the render thread of the host.
+    """
+
+    _host: SharedElementHost
+    """
+    The host rendering the element.
+    """
+
+    def __init__(self, host: SharedElementHost, connection: MessageStream):
+        """
+        Create a message stream for a client of a shared element.
+
+        Args:
+            host: The host rendering the element.
+            connection: The connection to the client.
+        """
+        self._host = host
+        super().__init__(host._element, connection)
+
+    def _init_renderer(self) -> None:
+        """
+        Use the render context, metrics and renderer of the host, as the element is rendered by the host.
+        """
+        self._context = self._host._context
+        self._render_metrics = self._host._render_metrics
+        self._renderer = self._host._renderer
+
+    def _queue_callable(
+        self,
+        callable: Any,
+        priority: RenderPriority = RenderPriority.BACKGROUND,
+    ) -> None:
+        """
+        Queue a callable on the render thread of the host.
+
+        Args:
+            callable: The callable to queue
+            priority: The priority of the render loop run that calls it
+        """
+        self._host._queue_callable(callable, priority)
+
+    def _set_state(self, state: ExportedRenderState) -> None:
+        """
+        Set the state of the element. Only the state of the first client to connect is used.
+
+        Args:
+            state: The state to set
+        """
+        logger.debug("Setting shared state: %s", state)
+        # The client is starting fresh, so it needs the entire document and state on the next update
+        self._last_root = None
+        self._last_state = None
+        self._host.set_client_state(self, state)
+
+    def on_close(self) -> None:
+        assert not self._is_closed
+
+        logger.debug("Closing SharedElementMessageStream")
+        self._is_closed = True
+        self._temp_callables.clear()
+        self._host.remove_client(self)
@@ -1,3 +1,4 @@
 from .DashboardType import DashboardType
 from .ElementMessageStream import ElementMessageStream
 from .ElementType import ElementType
+from .SharedElementMessageStream import SharedElementMessageStream, shared
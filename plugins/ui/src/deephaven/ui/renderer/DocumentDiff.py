@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Callable, List, Literal
+
+if sys.version_info < (3, 11):
+    from typing_extensions import TypedDict, NotRequired
+else:
+    from typing import TypedDict, NotRequired
+
+from .RenderedNode import RenderedNode
+
+
+class PatchOperation(TypedDict):
+    """
+    A single JSON-Patch style (RFC 6902) operation to apply to a previously sent document.
+    """
+
+    op: Literal["add", "remove", "replace"]
+    """
+    The operation to perform.
+    """
+
+    path: str
+    """
+    JSON pointer (RFC 6901) to the location in the document the operation applies to.
+    """
+
+    value: NotRequired[Any]
+    """
+    The value to add or replace with. Not set for `remove` operations.
+    """
+
+
+DocumentPatch = List[PatchOperation]
+"""
+A list of operations that turns the previously sent document into the new document when applied in order.
+"""
+
+
+def _escape_path_segment(segment: str | int) -> str:
+    """
+    Escape a path segment for use in a JSON pointer.
+
+    Args:
+        segment: The key or index to escape.
+
+    Returns:
+        The escaped segment.
+    """
+    return str(segment).replace("~", "~0").replace("/", "~1")
+
+
+def _diff_value(old: Any, new: Any, path: str, patch: DocumentPatch) -> None:
+    """
+    Append the operations required to turn `old` into `new` to the patch.
+
+    Args:
+        old: The previous value at `path`.
+        new: The new value at `path`.
+        path: The JSON pointer to the value.
+        patch: The patch to append operations to.
+    """
+    if old is new:
+        return
+
+    old_type = type(old)
+    if old_type is not type(new):
+        patch.append({"op": "replace", "path": path, "value": new})
+        return
+
+    if old_type is dict:
+        for key in old:
+            if key not in new:
+                patch.append(
+                    {"op": "remove", "path": f"{path}/{_escape_path_segment(key)}"}
+                )
+        for key, value in new.items():
+            key_path = f"{path}/{_escape_path_segment(key)}"
+            if key in old:
+                _diff_value(old[key], value, key_path, patch)
+            else:
+                patch.append({"op": "add", "path": key_path, "value": value})
+        return
+
+    if old_type is list:
+        common_length = min(len(old), len(new))
+        for index in range(common_length):
+            _diff_value(old[index], new[index], f"{path}/{index}", patch)
+        # Remove from the end first so the indices of the remaining items stay valid
+        for index in reversed(range(common_length, len(old))):
+            patch.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(common_length, len(new)):
+            patch.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        return
+
+    if old != new:
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+def diff_document(old: Any, new: Any) -> DocumentPatch:
+    """
+    Compute the operations to turn a previously sent document into a new document.
+    Both documents must be the JSON compatible representation of an encoded document, i.e. what
+    `json.loads` returns for the output of `NodeEncoder.encode_node`.
+    Dicts are diffed key by key and lists index by index, so unchanged subtrees produce no operations.
+
+    Args:
+        old: The document that was last sent to the client.
+        new: The newly rendered document.
+
+    Returns:
+        The list of operations, empty if the documents are identical.
+    """
+    patch: DocumentPatch = []
+    _diff_value(old, new, "", patch)
+    return patch
+
+
+def _diff_rendered_value(old: Any, new: Any, path: str, patch: DocumentPatch) -> None:
+    """
+    Append the operations required to turn the rendered value `old` into `new` to the patch.
+    The values of the operations are rendered values, not yet encoded.
+
+    Args:
+        old: The previous rendered value at `path`.
+        new: The new rendered value at `path`.
+        path: The JSON pointer to the value.
+        patch: The patch to append operations to.
+    """
+    if old is new:
+        # The renderer reuses the nodes of components that did not re-render, so their subtrees are skipped
+        return
+
+    if type(old) is not type(new):
+        patch.append({"op": "replace", "path": path, "value": new})
+        return
+
+    if isinstance(old, RenderedNode):
+        if old.name != new.name:
+            patch.append({"op": "replace", "path": path, "value": new})
+        elif old.props is not None and new.props is not None:
+            _diff_rendered_value(old.props, new.props, f"{path}/props", patch)
+        elif new.props is not None:
+            patch.append({"op": "add", "path": f"{path}/props", "value": new.props})
+        elif old.props is not None:
+            patch.append({"op": "remove", "path": f"{path}/props"})
+        return
+
+    if isinstance(old, dict):
+        for key in old:
+            if key not in new:
+                patch.append(
+                    {"op": "remove", "path": f"{path}/{_escape_path_segment(key)}"}
+                )
+        for key, value in new.items():
+            key_path = f"{path}/{_escape_path_segment(key)}"
+            if key in old:
+                _diff_rendered_value(old[key], value, key_path, patch)
+            else:
+                patch.append({"op": "add", "path": key_path, "value": value})
+        return
+
+    if isinstance(old, (list, tuple)):
+        common_length = min(len(old), len(new))
+        for index in range(common_length):
+            _diff_rendered_value(old[index], new[index], f"{path}/{index}", patch)
+        # Remove from the end first so the indices of the remaining items stay valid
+        for index in reversed(range(common_length, len(old))):
+            patch.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(common_length, len(new)):
+            patch.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        return
+
+    if old is None or isinstance(old, (str, int, float)):
+        if old != new:
+            patch.append({"op": "replace", "path": path, "value": new})
+        return
+
+    # Anything else is encoded as a node with the ID of the callable or exported object. The whole node is replaced,
+    # so the client can release the old object and hold the new one.
+    # Equal callables, such as bound methods of the same object, are assigned the same ID.
+    if not callable(old) or old != new:
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+def diff_rendered_document(old: RenderedNode, new: RenderedNode) -> DocumentPatch:
+    """
+    Compute the operations to turn a previously rendered document into a new document.
+    Walks the rendered nodes instead of the encoded documents, and skips the nodes that are the same instance in
+    both documents, so the cost is proportional to the parts of the document that were rendered again.
+    The values of the operations are rendered values, encode the patch with `encode_document_patch`.
+
+    Args:
+        old: The root node of the document that was last sent to the client.
+        new: The root node of the newly rendered document.
+
+    Returns:
+        The list of operations, empty if the documents are identical.
+    """
+    patch: DocumentPatch = []
+    _diff_rendered_value(old, new, "", patch)
+    return patch
+
+
+def encode_document_patch(
+    patch: DocumentPatch, encode_value: Callable[[Any], str]
+) -> str:
+    """
+    Encode a patch computed by `diff_rendered_document`.
+
+    Args:
+        patch: The patch to encode.
+        encode_value: Function encoding a rendered value of the new document, such as `NodeEncoder.encode_value`.
+
+    Returns:
+        The encoded patch.
+    """
+    encoded_operations = []
+    for operation in patch:
+        path = operation["path"]
+        encoded = f'{{"op":"{operation["op"]}","path":{json.dumps(path)}'
+        if "value" in operation:
+            encoded += f',"value":{encode_value(operation["value"])}'
+        encoded_operations.append(encoded + "}")
+    return f"[{','.join(encoded_operations)}]"
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Callable, TypedDict
+from json.encoder import c_make_encoder, encode_basestring, encode_basestring_ascii
+from typing import Any, Callable, List, NamedTuple, TypedDict
+from uuid import uuid4
 from weakref import WeakKeyDictionary
 from .RenderedNode import RenderedNode
 
@@ -42,12 +44,69 @@ class NodeEncoderResult(TypedDict):
     """
 
 
+class _EncodedFragment(NamedTuple):
+    """
+    The encoded JSON of a RenderedNode, kept to reuse if the same node is in the next document.
+    """
+
+    node: RenderedNode
+    """
+    The node that was encoded. Keeps the node alive so its id is not reused while it is cached.
+    """
+
+    fragment: str
+    """
+    The encoded JSON of the node.
+    """
+
+    object_ids: List[int]
+    """
+    Python IDs of the exported objects within the node.
+    """
+
+    children: List[_EncodedFragment]
+    """
+    Fragments of the nodes directly within the node, so they stay cached when the node is reused.
+    """
+
+
+class _FragmentFrame(NamedTuple):
+    """
+    The exported objects and child fragments found while encoding a node.
+    """
+
+    object_ids: List[int]
+    children: List[_EncodedFragment]
+
+
+def _is_leaf_node(node: RenderedNode) -> bool:
+    """
+    Check if a node can't contain other nodes, because none of its props are nodes or containers.
+
+    Args:
+        node: The node to check.
+
+    Returns:
+        True if the node is a leaf node.
+    """
+    props = node.props
+    if props:
+        for value in props.values():
+            if isinstance(value, (RenderedNode, list, tuple, dict)):
+                return False
+    return True
+
+
 class NodeEncoder(json.JSONEncoder):
     """
     Encode the node in JSON. Store any replaced objects and callables in their respective arrays.
     - RenderedNodes in the tree are replaced with a dict with property `ELEMENT_KEY` set to the name of the element, and props set to the props key.
     - callables in the tree are replaced with an object with property `CALLABLE_KEY` set to the index in the callables array.
     - non-serializable objects in the tree are replaced wtih an object with property `OBJECT_KEY` set to the index in the objects array.
+
+    Each RenderedNode containing other nodes is encoded once, with the nodes within it spliced in. The JSON of these
+    nodes is kept until the next document is encoded, and reused if the same node instance is in that document, as it
+    is when a component was not re-rendered.
     """
 
     _callable_id_prefix: str
@@ -88,6 +147,27 @@ class NodeEncoder(json.JSONEncoder):
     Unlike `_callable_dict`, we cannot use a WeakKeyDictionary as we need to pass the exported object instance to the client, so we need to always keep a reference around that the client may still have a reference to.
     """
 
+    _fragment_cache: dict[int, _EncodedFragment]
+    """
+    Encoded fragments of the RenderedNodes in the last document, keyed by the python ID of the node.
+    """
+
+    _next_fragment_cache: dict[int, _EncodedFragment]
+    """
+    Encoded fragments of the RenderedNodes in the document being encoded.
+    """
+
+    _frames: list[_FragmentFrame]
+    """
+    Stack of the RenderedNodes currently being encoded, collecting their exported objects and child fragments.
+    """
+
+    _node_placeholder: str
+    """
+    String that nodes are replaced with when encoding the node they are in, before splicing in the JSON of the node.
+    Contains a random ID so it can't collide with strings in the document.
+    """
+
     def __init__(
         self,
         callable_id_prefix: str = DEFAULT_CALLABLE_ID_PREFIX,
@@ -109,6 +189,54 @@ class NodeEncoder(json.JSONEncoder):
         self._new_objects = []
         self._next_object_id = 0
         self._object_id_dict = {}
+        self._old_objects = set()
+        self._fragment_cache = {}
+        self._next_fragment_cache = {}
+        self._frames = []
+        self._encode_string = (
+            encode_basestring_ascii if self.ensure_ascii else encode_basestring
+        )
+        self._node_placeholder = f"\0{ELEMENT_KEY}{uuid4().hex}"
+        self._encoded_node_placeholder = self._encode_string(self._node_placeholder)
+        self._node_prefix = "{" + self._encode_string(ELEMENT_KEY) + self.key_separator
+        self._props_prefix = (
+            self.item_separator + self._encode_string("props") + self.key_separator
+        )
+        self._encode_within_node = self._make_within_node_encoder()
+
+    def _make_within_node_encoder(self) -> Callable[[Any], str]:
+        """
+        Make the function used to encode the props of a node, calling `_default_within_node` for values that are not
+        serializable. Uses the C encoder directly when it is available, so it is only created once.
+        The document can't have cycles as it would not have finished rendering, so they are not checked.
+
+        Returns:
+            The function to encode a value.
+        """
+        if c_make_encoder is not None and self.indent is None:
+            c_encoder = c_make_encoder(
+                None,
+                self._default_within_node,
+                self._encode_string,
+                None,
+                self.key_separator,
+                self.item_separator,
+                self.sort_keys,
+                self.skipkeys,
+                self.allow_nan,
+            )
+            return lambda value: "".join(c_encoder(value, 0))
+
+        return json.JSONEncoder(
+            skipkeys=self.skipkeys,
+            ensure_ascii=self.ensure_ascii,
+            check_circular=False,
+            allow_nan=self.allow_nan,
+            sort_keys=self.sort_keys,
+            indent=self.indent,
+            separators=(self.item_separator, self.key_separator),
+            default=self._default_within_node,
+        ).encode
 
     def default(self, o: Any):
         if isinstance(o, RenderedNode):
@@ -137,10 +265,19 @@ class NodeEncoder(json.JSONEncoder):
         # Reset the new objects list - they will get set when encoding
         self._new_objects = []
         self._old_objects = set(self._object_id_dict.keys())
+        self._next_fragment_cache = {}
+        root_frame = _FragmentFrame([], [])
+        self._frames = [root_frame]
 
         logger.debug("Encoding node with object_id_dict: %s", self._object_id_dict)
 
-        encoded_node = super().encode(node)
+        try:
+            encoded_node = self._encode_in_frame(node, root_frame)
+        finally:
+            # Only keep the fragments of this document, nodes that are gone will not be reused
+            self._fragment_cache = self._next_fragment_cache
+            self._next_fragment_cache = {}
+            self._frames = []
 
         # Remove the old objects from last render from the object id dict
         for py_id in self._old_objects:
@@ -152,6 +289,113 @@ class NodeEncoder(json.JSONEncoder):
             "callable_id_dict": self._callable_dict,
         }
 
+    def encode_value(self, value: Any) -> str:
+        """
+        Encode a value within the last document encoded by `encode_node`, such as the value of a patch operation.
+        The JSON of the nodes within it is reused, and callables and objects are encoded with the IDs they were
+        assigned in the document.
+
+        Args:
+            value: The value to encode. Must be part of the last document encoded.
+
+        Returns:
+            The encoded value.
+        """
+        frame = _FragmentFrame([], [])
+        self._frames = [frame]
+        # Fragments that are reused stay cached for the next document
+        self._next_fragment_cache = self._fragment_cache
+        try:
+            return self._encode_in_frame(value, frame)
+        finally:
+            self._next_fragment_cache = {}
+            self._frames = []
+
+    def _default_within_node(self, o: Any):
+        """
+        Convert a value the JSON encoder can't serialize. RenderedNodes that may contain other nodes are encoded
+        separately so their JSON can be reused, and replaced with a placeholder that `_encode_in_frame` replaces with
+        the JSON of the node. Other nodes are cheap to encode again, so are encoded as part of the node they are in.
+        """
+        if isinstance(o, RenderedNode):
+            if _is_leaf_node(o):
+                return self._convert_rendered_node(o)
+            self._encode_rendered_node(o)
+            return self._node_placeholder
+        return self.default(o)
+
+    def _encode_in_frame(self, value: Any, frame: _FragmentFrame) -> str:
+        """
+        Encode a value, with the nodes within it collected in a frame.
+
+        Args:
+            value: The value to encode.
+            frame: The frame of the node being encoded, collecting the nodes within the value.
+
+        Returns:
+            The encoded value.
+        """
+        encoded = self._encode_within_node(value)
+        if not frame.children:
+            return encoded
+
+        # The nodes are encoded in order, so each placeholder is replaced by the next child
+        pieces = encoded.split(self._encoded_node_placeholder)
+        parts = [pieces[0]]
+        for child, piece in zip(frame.children, pieces[1:]):
+            parts.append(child.fragment)
+            parts.append(piece)
+        return "".join(parts)
+
+    def _encode_rendered_node(self, node: RenderedNode) -> None:
+        """
+        Encode a RenderedNode, reusing the JSON from the last document if the same node was in it.
+        The encoded node is added to the frame of the parent node.
+
+        Args:
+            node: The node to encode.
+        """
+        cached = self._fragment_cache.get(id(node))
+        if cached is not None and cached.node is node:
+            self._reuse_fragment(cached)
+            return
+
+        frame = _FragmentFrame([], [])
+        self._frames.append(frame)
+        try:
+            if node.props is None:
+                fragment = f"{self._node_prefix}{self._encode_string(node.name)}}}"
+            else:
+                fragment = f"{self._node_prefix}{self._encode_string(node.name)}{self._props_prefix}{self._encode_in_frame(node.props, frame)}}}"
+        finally:
+            self._frames.pop()
+
+        encoded = _EncodedFragment(node, fragment, frame.object_ids, frame.children)
+        self._next_fragment_cache[id(node)] = encoded
+        parent = self._frames[-1]
+        parent.object_ids.extend(encoded.object_ids)
+        parent.children.append(encoded)
+
+    def _reuse_fragment(self, encoded: _EncodedFragment) -> None:
+        """
+        Reuse the fragment of a node from the last document. Keeps the exported objects within it, and keeps it
+        and the fragments within it cached for the next document.
+
+        Args:
+            encoded: The fragment to reuse.
+        """
+        for py_id in encoded.object_ids:
+            self._old_objects.discard(py_id)
+        parent = self._frames[-1]
+        parent.object_ids.extend(encoded.object_ids)
+        parent.children.append(encoded)
+
+        pending = [encoded]
+        while pending:
+            fragment = pending.pop()
+            self._next_fragment_cache[id(fragment.node)] = fragment
+            pending.extend(fragment.children)
+
     def _convert_rendered_node(self, node: RenderedNode):
         result: dict[str, Any] = {ELEMENT_KEY: node.name}
         if node.props is not None:
@@ -183,6 +427,8 @@ class NodeEncoder(json.JSONEncoder):
             object_id, _ = obj_info
 
         self._old_objects.discard(py_id)
+        if self._frames:
+            self._frames[-1].object_ids.append(py_id)
         logger.debug("Converted object %s to id %s", obj, object_id)
 
         return {
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Generator, List, Sequence
+
+DURATION_BOUNDS: Sequence[float] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+)
+"""
+Upper bounds in seconds of the buckets of duration histograms.
+"""
+
+SIZE_BOUNDS: Sequence[float] = tuple(4**i for i in range(4, 13))
+"""
+Upper bounds in bytes of the buckets of size histograms, 256 bytes to 16 MiB.
+"""
+
+COUNT_BOUNDS: Sequence[float] = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+"""
+Upper bounds of the buckets of histograms of counts, such as queue depths.
+"""
+
+
+class Histogram:
+    """
+    Counts of values recorded in fixed buckets, with the count, total, min and max of the values.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Create a histogram.
+
+        Args:
+            bounds: The inclusive upper bound of each bucket, in ascending order.
+                Values greater than the last bound are counted in an extra bucket.
+        """
+        self.bounds = tuple(bounds)
+        self.bucket_counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: The value to record.
+        """
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if self.count == 0 or value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+        index = 0
+        for bound in self.bounds:
+            if value <= bound:
+                break
+            index += 1
+        self.bucket_counts[index] += 1
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean of the values recorded, or 0 if none were recorded.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the values recorded, as the upper bound of the bucket it falls in.
+        The estimate is clamped to the max value recorded.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The estimated quantile, or 0 if no values were recorded.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= rank and bucket_count > 0:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                break
+        return self.max
+
+    def copy(self) -> Histogram:
+        """
+        Copy the histogram.
+
+        Returns:
+            A new histogram with the same values.
+        """
+        result = Histogram(self.bounds)
+        result.bucket_counts = list(self.bucket_counts)
+        result.count = self.count
+        result.total = self.total
+        result.min = self.min
+        result.max = self.max
+        return result
+
+
+_local_data = threading.local()
+
+
+def get_active_metrics() -> RenderMetrics | None:
+    """
+    Get the metrics of the render currently running on this thread.
+
+    Returns:
+        The metrics, or None if no render with metrics is running.
+    """
+    return getattr(_local_data, "metrics", None)
+
+
+@contextmanager
+def active_metrics(metrics: RenderMetrics | None) -> Generator[None, None, None]:
+    """
+    Set the metrics that renders on this thread record to.
+
+    Args:
+        metrics: The metrics to record to, or None to not record.
+    """
+    old_metrics = get_active_metrics()
+    _local_data.metrics = metrics
+    try:
+        yield
+    finally:
+        _local_data.metrics = old_metrics
+
+
+_all_metrics: weakref.WeakSet[RenderMetrics] = weakref.WeakSet()
+_all_metrics_lock = threading.Lock()
+
+
+class RenderMetrics:
+    """
+    Timings and sizes of the render loop of one rendered element, such as a component or dashboard opened by a client.
+    Recording is done on the render thread, reading can be done from any thread.
+    """
+
+    PHASES = (
+        "process_callables",
+        "render",
+        "export_state",
+        "encode",
+        "diff",
+        "encode_state",
+        "serialize",
+        "send",
+    )
+    """
+    The phases of the render loop that are timed:
+    process_callables: Calling queued callables, such as event handlers and state updates from other threads.
+    render: Rendering the element, including all components.
+    export_state: Exporting the state of the element to send to the client.
+    encode: Encoding the rendered document to JSON.
+    diff: Computing the patch from the last document sent.
+    encode_state: Encoding the state to JSON, or the patch from the last state sent.
+    serialize: Serializing the message payload to JSON.
+    send: Sending the payload to the client.
+    Each phase is recorded at most once per render.
+    """
+
+    def __init__(self, name: str):
+        """
+        Create render metrics. They are registered so they can be found with `get_render_metrics` until closed.
+
+        Args:
+            name: The name of the element rendered.
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._render_count = 0
+        self._phases: Dict[str, Histogram] = {
+            phase: Histogram(DURATION_BOUNDS) for phase in self.PHASES
+        }
+        self._components: Dict[str, Histogram] = {}
+        self._component_reuse_counts: Dict[str, int] = {}
+        self._document_bytes = Histogram(SIZE_BOUNDS)
+        self._payload_bytes = Histogram(SIZE_BOUNDS)
+        self._callable_queue_depth = Histogram(COUNT_BOUNDS)
+        self._state_update_batch_size = Histogram(COUNT_BOUNDS)
+        with _all_metrics_lock:
+            _all_metrics.add(self)
+
+    def close(self) -> None:
+        """
+        Stop tracking these metrics in `get_render_metrics`.
+        """
+        with _all_metrics_lock:
+            _all_metrics.discard(self)
+
+    @property
+    def render_count(self) -> int:
+        """
+        The number of times the element was rendered.
+        """
+        return self._render_count
+
+    @property
+    def phases(self) -> Dict[str, Histogram]:
+        """
+        A copy of the duration histograms in seconds of each phase of the render loop, keyed by phase name.
+        """
+        with self._lock:
+            return {name: hist.copy() for name, hist in self._phases.items()}
+
+    @property
+    def components(self) -> Dict[str, Histogram]:
+        """
+        A copy of the duration histograms in seconds of each component, keyed by component name.
+        Only the component function itself is timed, not the rendering of the elements it returns.
+        """
+        with self._lock:
+            return {name: hist.copy() for name, hist in self._components.items()}
+
+    @property
+    def component_reuse_counts(self) -> Dict[str, int]:
+        """
+        The number of times the previous render of each component was reused instead of calling it.
+        """
+        with self._lock:
+            return dict(self._component_reuse_counts)
+
+    @property
+    def document_bytes(self) -> Histogram:
+        """
+        A copy of the histogram of the encoded document sizes in bytes.
+        """
+        with self._lock:
+            return self._document_bytes.copy()
+
+    @property
+    def payload_bytes(self) -> Histogram:
+        """
+        A copy of the histogram of the payload sizes in bytes sent to the client.
+        """
+        with self._lock:
+            return self._payload_bytes.copy()
+
+    @property
+    def callable_queue_depth(self) -> Histogram:
+        """
+        A copy of the histogram of the number of callables queued when the render loop runs.
+        """
+        with self._lock:
+            return self._callable_queue_depth.copy()
+
+    @property
+    def state_update_batch_size(self) -> Histogram:
+        """
+        A copy of the histogram of the number of state updates applied in each render.
+        """
+        with self._lock:
+            return self._state_update_batch_size.copy()
+
+    @contextmanager
+    def time_phase(self, phase: str) -> Generator[None, None, None]:
+        """
+        Time a phase of the render loop.
+
+        Args:
+            phase: The name of the phase, one of `PHASES`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self._phases[phase].record(duration)
+
+    def record_render(self, state_update_count: int) -> None:
+        """
+        Record a render of the element.
+
+        Args:
+            state_update_count: The number of state updates applied before the render.
+        """
+        with self._lock:
+            self._render_count += 1
+            self._state_update_batch_size.record(state_update_count)
+
+    def record_component(self, name: str, duration: float) -> None:
+        """
+        Record the time to call a component function.
+
+        Args:
+            name: The name of the component.
+            duration: The duration in seconds.
+        """
+        with self._lock:
+            histogram = self._components.get(name)
+            if histogram is None:
+                histogram = self._components[name] = Histogram(DURATION_BOUNDS)
+            histogram.record(duration)
+
+    def record_component_reuse(self, name: str) -> None:
+        """
+        Record that the previous render of a component was reused.
+
+        Args:
+            name: The name of the component.
+        """
+        with self._lock:
+            self._component_reuse_counts[name] = (
+                self._component_reuse_counts.get(name, 0) + 1
+            )
+
+    def record_callable_queue_depth(self, depth: int) -> None:
+        """
+        Record the number of callables queued when the render loop runs.
+
+        Args:
+            depth: The number of callables queued.
+        """
+        with self._lock:
+            self._callable_queue_depth.record(depth)
+
+    def record_document_size(self, document_bytes: int, payload_bytes: int) -> None:
+        """
+        Record the size of a document sent to the client.
+
+        Args:
+            document_bytes: The size of the encoded document.
+            payload_bytes: The size of the payload sent, which may be a patch instead of the document.
+        """
+        with self._lock:
+            self._document_bytes.record(document_bytes)
+            self._payload_bytes.record(payload_bytes)
+
+    def rows(self) -> List[tuple]:
+        """
+        Get the metrics as rows of (category, name, count, total, mean, min, max, p50, p99, reused).
+        Durations are in seconds. Reused is only set for components.
+
+        Returns:
+            The rows of the metrics.
+        """
+
+        def row(category: str, name: str, hist: Histogram, reused: int = 0) -> tuple:
+            return (
+                category,
+                name,
+                hist.count,
+                hist.total,
+                hist.mean,
+                hist.min,
+                hist.max,
+                hist.quantile(0.5),
+                hist.quantile(0.99),
+                reused,
+            )
+
+        with self._lock:
+            result = [row("phase", name, hist) for name, hist in self._phases.items()]
+            result += [
+                row(
+                    "component",
+                    name,
+                    hist,
+                    self._component_reuse_counts.get(name, 0),
+                )
+                for name, hist in self._components.items()
+            ]
+            result += [
+                row("size", "document_bytes", self._document_bytes),
+                row("size", "payload_bytes", self._payload_bytes),
+                row("count", "callable_queue_depth", self._callable_queue_depth),
+                row("count", "state_update_batch_size", self._state_update_batch_size),
+            ]
+        return result
+
+
+def get_render_metrics() -> List[RenderMetrics]:
+    """
+    Get the render metrics of all the elements currently opened by clients.
+
+    Returns:
+        The render metrics.
+    """
+    with _all_metrics_lock:
+        return list(_all_metrics)
+
+
+def render_metrics_table(metrics: Sequence[RenderMetrics] | None = None):
+    """
+    Create a table with a snapshot of render metrics. Each row is the histogram of one phase of the render loop,
+    one component, one size or one count of an element. Durations are in milliseconds and sizes in bytes.
+    Filter by the `component` category and sort by `Total` to find the components taking the most time.
+
+    Args:
+        metrics: The metrics to include. Defaults to the metrics of all elements currently opened by clients.
+
+    Returns:
+        The table.
+    """
+    from deephaven import new_table
+    from deephaven.column import double_col, long_col, string_col
+
+    if metrics is None:
+        metrics = get_render_metrics()
+
+    columns: Dict[str, list] = {
+        name: []
+        for name in (
+            "Element",
+            "Category",
+            "Name",
+            "Count",
+            "Total",
+            "Mean",
+            "Min",
+            "Max",
+            "P50",
+            "P99",
+            "Reused",
+        )
+    }
+    for element_metrics in metrics:
+        for row in element_metrics.rows():
+            category = row[0]
+            # Durations are shown in milliseconds, sizes and counts as is
+            scale = 1000 if category in ("phase", "component") else 1
+            columns["Element"].append(element_metrics.name)
+            columns["Category"].append(category)
+            columns["Name"].append(row[1])
+            columns["Count"].append(row[2])
+            for name, value in zip(
+                ("Total", "Mean", "Min", "Max", "P50", "P99"), row[3:9]
+            ):
+                columns[name].append(value * scale)
+            columns["Reused"].append(row[9])
+
+    return new_table(
+        [
+            string_col("Element", columns["Element"]),
+            string_col("Category", columns["Category"]),
+            string_col("Name", columns["Name"]),
+            long_col("Count", columns["Count"]),
+            double_col("Total", columns["Total"]),
+            double_col("Mean", columns["Mean"]),
+            double_col("Min", columns["Min"]),
+            double_col("Max", columns["Max"]),
+            double_col("P50", columns["P50"]),
+            double_col("P99", columns["P99"]),
+            long_col("Reused", columns["Reused"]),
+        ]
+    )
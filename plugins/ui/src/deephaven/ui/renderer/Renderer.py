@@ -1,10 +1,12 @@
 from __future__ import annotations
 from dataclasses import asdict as dataclass_asdict, is_dataclass
 import logging
+import time
 from typing import Any, Union
 from .._internal import RenderContext
-from ..elements import Element, PropsType
+from ..elements import Element, FunctionElement, PropsType
 from .RenderedNode import RenderedNode
+from .RenderMetrics import RenderMetrics, active_metrics, get_active_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -103,9 +105,27 @@ def _render_dict_in_open_context(item: PropsType, context: RenderContext) -> Pro
     return {key: _render_child_item(value, context, key) for key, value in item.items()}
 
 
+def _can_reuse_render(element: Element, cached_element: Element) -> bool:
+    """
+    Check if the render of a previously rendered element can be reused for an element.
+    This is the case if it is the same element instance, or a memoized component called with equal props.
+
+    Args:
+        element: The element to render.
+        cached_element: The element previously rendered in the same context.
+
+    Returns:
+        True if the previous render can be reused.
+    """
+    return cached_element is element or (
+        isinstance(element, FunctionElement) and element.is_memo_equal(cached_element)
+    )
+
+
 def _render_element(element: Element, context: RenderContext) -> RenderedNode:
     """
-    Render an Element.
+    Render an Element. If the state of the context has not changed since the last render of the same element,
+    reuses the previous result, re-rendering only the children that have a state change.
 
     Args:
         element: The element to render.
@@ -114,15 +134,48 @@ def _render_element(element: Element, context: RenderContext) -> RenderedNode:
     Returns:
         The RenderedNode representing the element.
     """
+    cached_render = context.get_cached_render()
+    if (
+        cached_render is not None
+        and not context.is_dirty
+        and _can_reuse_render(element, cached_render.element)
+    ):
+        if not context.has_dirty_descendant:
+            logger.debug(
+                "Reusing render of element %s in context %s", element.name, context
+            )
+            metrics = get_active_metrics()
+            if metrics is not None and isinstance(element, FunctionElement):
+                metrics.record_component_reuse(element.name)
+            return cached_render.result
+
+        # Only descendants changed, render the children from the last render without rendering this element
+        logger.debug(
+            "Rendering children of element %s in context %s", element.name, context
+        )
+        with context.open_children():
+            props = _render_dict_in_open_context(cached_render.props, context)
+        node = RenderedNode(element.name, props)
+        context.set_cached_render(cached_render.element, cached_render.props, node)
+        return node
+
     logger.debug("Rendering element %s in context %s", element.name, context)
 
+    metrics = get_active_metrics()
     with context.open():
-        props = element.render(context)
+        if metrics is not None and isinstance(element, FunctionElement):
+            start = time.perf_counter()
+            element_props = element.render(context)
+            metrics.record_component(element.name, time.perf_counter() - start)
+        else:
+            element_props = element.render(context)
 
         # We also need to render any elements that are passed in as props (including `children`)
-        props = _render_dict_in_open_context(props, context)
+        props = _render_dict_in_open_context(element_props, context)
 
-    return RenderedNode(element.name, props)
+    node = RenderedNode(element.name, props)
+    context.set_cached_render(element, element_props, node)
+    return node
 
 
 class Renderer:
@@ -137,8 +190,14 @@ class Renderer:
     Context to render the element into. This is essentially the state of the element.
     """
 
-    def __init__(self, context: RenderContext):
+    _metrics: RenderMetrics | None
+    """
+    Metrics to record the time taken by each component to, or None to not record.
+    """
+
+    def __init__(self, context: RenderContext, metrics: RenderMetrics | None = None):
         self._context = context
+        self._metrics = metrics
 
     def render(self, element: Element) -> RenderedNode:
         """
@@ -150,4 +209,5 @@ class Renderer:
         Returns:
             The rendered element.
         """
-        return _render_element(element, self._context)
+        with active_metrics(self._metrics):
+            return _render_element(element, self._context)
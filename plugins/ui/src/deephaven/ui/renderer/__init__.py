@@ -1,3 +1,9 @@
 from .NodeEncoder import NodeEncoder
 from .Renderer import Renderer
 from .RenderedNode import RenderedNode
+from .RenderMetrics import (
+    Histogram,
+    RenderMetrics,
+    get_render_metrics,
+    render_metrics_table,
+)
@@ -461,6 +461,7 @@ QuickFilterExpression = str
 RowData = Dict[ColumnName, Any]
 ColumnData = List[Any]
 TableData = Dict[ColumnName, ColumnData]
+ColumnArrays = Dict[ColumnName, numpy.ndarray]
 SelectionArea = Literal["CELL", "ROW", "COLUMN"]
 SelectionMode = Literal["SINGLE", "MULTIPLE"]
 SelectionStyle = Literal["checkbox", "highlight"]
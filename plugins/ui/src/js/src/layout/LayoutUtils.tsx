@@ -91,6 +91,7 @@ export type StackElementProps = React.PropsWithChildren<{
   height?: number;
   width?: number;
   activeItemIndex?: number;
+  onActiveItemChange?: (index: number) => void;
 }>;
 
 /**
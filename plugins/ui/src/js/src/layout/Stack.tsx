@@ -1,6 +1,10 @@
 import React, { useEffect, useMemo } from 'react';
 import { useLayoutManager } from '@deephaven/dashboard';
-import type { Stack as StackType, RowOrColumn } from '@deephaven/golden-layout';
+import type {
+  ContentItem,
+  Stack as StackType,
+  RowOrColumn,
+} from '@deephaven/golden-layout';
 import { normalizeStackChildren, type StackElementProps } from './LayoutUtils';
 import { ParentItemContext, useParentItem } from './ParentItemContext';
 
@@ -9,6 +13,7 @@ function Stack({
   height,
   width,
   activeItemIndex,
+  onActiveItemChange,
 }: StackElementProps): JSX.Element | null {
   const layoutManager = useLayoutManager();
   const parent = useParentItem();
@@ -36,6 +41,19 @@ function Stack({
     }
   }, [activeItemIndex, parent, stack]);
 
+  useEffect(() => {
+    if (onActiveItemChange == null) {
+      return;
+    }
+    function handleActiveContentItemChanged(item: ContentItem) {
+      onActiveItemChange?.(stack.contentItems.indexOf(item));
+    }
+    stack.on('activeContentItemChanged', handleActiveContentItemChanged);
+    return () => {
+      stack.off('activeContentItemChanged', handleActiveContentItemChanged);
+    };
+  }, [onActiveItemChange, stack]);
+
   const normalizedChildren = normalizeStackChildren(children);
 
   return (
@@ -0,0 +1,139 @@
+import {
+  applyDocumentPatch,
+  forEachJsonValue,
+  getDocumentValue,
+  parsePatchPath,
+  reviveJson,
+} from './DocumentPatchUtils';
+
+describe('parsePatchPath', () => {
+  it('parses the root path', () => {
+    expect(parsePatchPath('')).toEqual([]);
+  });
+
+  it('parses and unescapes segments', () => {
+    expect(parsePatchPath('/props/a~1b/c~0d/0')).toEqual([
+      'props',
+      'a/b',
+      'c~d',
+      '0',
+    ]);
+  });
+
+  it('throws on invalid paths', () => {
+    expect(() => parsePatchPath('props')).toThrow();
+  });
+});
+
+describe('applyDocumentPatch', () => {
+  const document = {
+    __dhElemName: 'root',
+    props: { children: [{ __dhElemName: 'a' }, 'text'], label: 'foo' },
+  };
+
+  it('replaces, adds and removes values', () => {
+    const result = applyDocumentPatch(document, [
+      { op: 'replace', path: '/props/label', value: 'bar' },
+      { op: 'add', path: '/props/children/2', value: 'more' },
+      { op: 'remove', path: '/props/children/1' },
+      { op: 'add', path: '/props/isDisabled', value: true },
+    ]);
+    expect(result).toEqual({
+      __dhElemName: 'root',
+      props: {
+        children: [{ __dhElemName: 'a' }, 'more'],
+        label: 'bar',
+        isDisabled: true,
+      },
+    });
+  });
+
+  it('does not modify the original document and shares unchanged subtrees', () => {
+    const result = applyDocumentPatch(document, [
+      { op: 'replace', path: '/props/label', value: 'bar' },
+    ]) as typeof document;
+    expect(document.props.label).toBe('foo');
+    expect(result.props.children).toBe(document.props.children);
+  });
+
+  it('replaces the root', () => {
+    expect(
+      applyDocumentPatch(document, [{ op: 'replace', path: '', value: 'x' }])
+    ).toBe('x');
+  });
+});
+
+describe('reviveJson', () => {
+  it('visits values like JSON.parse', () => {
+    const text = '{"a":[1,{"b":2}],"c":"d"}';
+    const reviver = jest.fn((key: string, value: unknown) =>
+      typeof value === 'number' ? value * 10 : value
+    );
+    const expected = JSON.parse(text, (key, value) =>
+      typeof value === 'number' ? value * 10 : value
+    );
+    expect(reviveJson(JSON.parse(text), reviver)).toEqual(expected);
+    expect(reviver.mock.calls.map(([key]) => key)).toEqual([
+      '0',
+      'b',
+      '1',
+      'a',
+      'c',
+      '',
+    ]);
+  });
+
+  it('only revives the patched subtrees with a cache', () => {
+    const document = {
+      props: { children: [{ label: 'a' }, { label: 'b' }] },
+    };
+    const cache = new WeakMap<object, unknown>();
+    const reviver = jest.fn((key: string, value: unknown) => value);
+    const revived = reviveJson(
+      document,
+      reviver,
+      '',
+      cache
+    ) as typeof document;
+
+    reviver.mockClear();
+    const patched = applyDocumentPatch(document, [
+      { op: 'replace', path: '/props/children/1/label', value: 'c' },
+    ]);
+    const revivedPatch = reviveJson(
+      patched,
+      reviver,
+      '',
+      cache
+    ) as typeof document;
+    expect(revivedPatch).toEqual({
+      props: { children: [{ label: 'a' }, { label: 'c' }] },
+    });
+    expect(revivedPatch.props.children[0]).toBe(revived.props.children[0]);
+    expect(reviver.mock.calls.map(([key]) => key)).toEqual([
+      'label',
+      '1',
+      'children',
+      'props',
+      '',
+    ]);
+  });
+});
+
+describe('getDocumentValue', () => {
+  it('gets the value at a path', () => {
+    const document = { props: { children: ['a', { label: 'b' }] } };
+    expect(getDocumentValue(document, '/props/children/1/label')).toBe('b');
+    expect(getDocumentValue(document, '')).toBe(document);
+    expect(getDocumentValue(document, '/props/missing/0')).toBeUndefined();
+  });
+});
+
+describe('forEachJsonValue', () => {
+  it('visits every value', () => {
+    const values: unknown[] = [];
+    forEachJsonValue({ a: [1, { b: 2 }] }, value => values.push(value));
+    expect(values.filter(value => typeof value === 'number')).toEqual([1, 2]);
+    expect(values).toHaveLength(5);
+  });
+});
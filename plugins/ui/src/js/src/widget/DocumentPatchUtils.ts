@@ -0,0 +1,172 @@
+/** A single JSON-Patch style operation sent in a `documentPatched` message */
+export type DocumentPatchOperation =
+  | { op: 'add' | 'replace'; path: string; value: unknown }
+  | { op: 'remove'; path: string };
+
+export type DocumentPatch = DocumentPatchOperation[];
+
+export type JsonReviver = (key: string, value: unknown) => unknown;
+
+/**
+ * Split a JSON pointer into its unescaped segments.
+ * @param path JSON pointer, e.g. `/props/children/0`. The empty string refers to the root.
+ * @returns The segments of the path
+ */
+export function parsePatchPath(path: string): string[] {
+  if (path === '') {
+    return [];
+  }
+  if (!path.startsWith('/')) {
+    throw new Error(`Invalid patch path ${path}`);
+  }
+  return path
+    .slice(1)
+    .split('/')
+    .map(segment => segment.replace(/~1/g, '/').replace(/~0/g, '~'));
+}
+
+function shallowCopy(value: unknown, path: string): Record<string, unknown> {
+  if (Array.isArray(value)) {
+    return [...value] as unknown as Record<string, unknown>;
+  }
+  if (value != null && typeof value === 'object') {
+    return { ...value } as Record<string, unknown>;
+  }
+  throw new Error(`Cannot apply patch at ${path}, parent is not a container`);
+}
+
+/**
+ * Apply a single operation to the document without modifying the original.
+ * Only the containers along the path of the operation are copied, the rest are shared.
+ * @param document Document to apply the operation to
+ * @param operation Operation to apply
+ * @returns The new document
+ */
+export function applyDocumentPatchOperation(
+  document: unknown,
+  operation: DocumentPatchOperation
+): unknown {
+  const segments = parsePatchPath(operation.path);
+  if (segments.length === 0) {
+    if (operation.op === 'remove') {
+      return undefined;
+    }
+    return operation.value;
+  }
+
+  const root = shallowCopy(document, operation.path);
+  let parent = root;
+  for (let i = 0; i < segments.length - 1; i += 1) {
+    const child = shallowCopy(parent[segments[i]], operation.path);
+    parent[segments[i]] = child;
+    parent = child;
+  }
+
+  const key = segments[segments.length - 1];
+  if (Array.isArray(parent)) {
+    const index = Number(key);
+    if (operation.op === 'add') {
+      parent.splice(index, 0, operation.value);
+    } else if (operation.op === 'remove') {
+      parent.splice(index, 1);
+    } else {
+      parent[index] = operation.value;
+    }
+  } else if (operation.op === 'remove') {
+    delete parent[key];
+  } else {
+    parent[key] = operation.value;
+  }
+  return root;
+}
+
+/**
+ * Apply a patch to a document without modifying the original.
+ * @param document Document to apply the patch to
+ * @param patch Operations to apply, in order
+ * @returns The patched document
+ */
+export function applyDocumentPatch(
+  document: unknown,
+  patch: DocumentPatch
+): unknown {
+  return patch.reduce(applyDocumentPatchOperation, document);
+}
+
+/**
+ * Get the value at a path in a document.
+ * @param document Document to get the value from
+ * @param path JSON pointer to the value
+ * @returns The value, or undefined if there is no value at the path
+ */
+export function getDocumentValue(document: unknown, path: string): unknown {
+  return parsePatchPath(path).reduce<unknown>(
+    (parent, segment) =>
+      parent != null && typeof parent === 'object'
+        ? (parent as Record<string, unknown>)[segment]
+        : undefined,
+    document
+  );
+}
+
+/**
+ * Call a callback for a parsed JSON value and every value within it.
+ * @param value Parsed JSON value to visit
+ * @param callback Callback to call for each value
+ */
+export function forEachJsonValue(
+  value: unknown,
+  callback: (value: unknown) => void
+): void {
+  callback(value);
+  if (Array.isArray(value)) {
+    value.forEach(item => forEachJsonValue(item, callback));
+  } else if (value != null && typeof value === 'object') {
+    Object.values(value).forEach(item => forEachJsonValue(item, callback));
+  }
+}
+
+/**
+ * Revive an already parsed JSON value the same way `JSON.parse` would with the reviver provided.
+ * Values are visited depth first, so the reviver receives children that have already been revived.
+ * The original value is not modified.
+ * If a cache is provided, objects and arrays that were already revived with it are not visited again, and the
+ * value revived the last time is returned. As applying a patch only copies the containers along the paths it
+ * changes, only the patched subtrees of a patched document are revived.
+ * @param value Parsed JSON value to revive
+ * @param reviver Reviver to call for each value
+ * @param key Key of the value in its parent
+ * @param cache Cache of the values already revived
+ * @returns The revived value
+ */
+export function reviveJson(
+  value: unknown,
+  reviver: JsonReviver,
+  key = '',
+  cache?: WeakMap<object, unknown>
+): unknown {
+  if (value == null || typeof value !== 'object') {
+    return reviver(key, value);
+  }
+  if (cache?.has(value) === true) {
+    return cache.get(value);
+  }
+  let result: unknown;
+  if (Array.isArray(value)) {
+    result = value.map((item, index) =>
+      reviveJson(item, reviver, `${index}`, cache)
+    );
+  } else {
+    const revived: Record<string, unknown> = {};
+    Object.entries(value).forEach(([childKey, childValue]) => {
+      const revivedChild = reviveJson(childValue, reviver, childKey, cache);
+      if (revivedChild !== undefined) {
+        revived[childKey] = revivedChild;
+      }
+    });
+    result = revived;
+  }
+  result = reviver(key, result);
+  cache?.set(value, result);
+  return result;
+}
@@ -8,6 +8,7 @@ import { DocumentHandlerProps } from './DocumentHandler';
 import {
   makeWidget,
   makeWidgetDescriptor,
+  makeWidgetEventDocumentPatched,
   makeWidgetEventDocumentUpdated,
   makeWidgetEventJsonRpcResponse,
 } from './WidgetTestUtils';
@@ -268,3 +269,59 @@ it('updates the initial data only when widget has changed', async () => {
   unmount();
   expect(cleanup).toHaveBeenCalledTimes(1);
 });
+
+it('closes an exported object when a patch replaces it', async () => {
+  const addEventListener = jest.fn(() => jest.fn());
+  mockWidgetWrapper = {
+    widget: makeWidget({
+      addEventListener,
+      getDataAsString: jest.fn(() => ''),
+    }),
+    error: null,
+  };
+  const oldTable = TestUtils.createMockProxy<dh.WidgetExportedObject>({
+    close: jest.fn(),
+  });
+  const newTable = TestUtils.createMockProxy<dh.WidgetExportedObject>({
+    close: jest.fn(),
+  });
+
+  const { unmount } = render(makeWidgetHandler());
+
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const listener = (addEventListener.mock.calls[0] as any)[1];
+
+  await act(async () => {
+    listener(makeWidgetEventJsonRpcResponse(1));
+    listener(
+      makeWidgetEventDocumentUpdated(
+        { props: { table: { __dhObid: 0 } } },
+        [oldTable]
+      )
+    );
+  });
+  expect(oldTable.close).not.toHaveBeenCalled();
+
+  // The whole object node is replaced with the node of the new table
+  await act(async () => {
+    listener(
+      makeWidgetEventDocumentPatched(
+        [
+          {
+            op: 'replace',
+            path: '/props/table',
+            value: { __dhObid: 1 },
+          },
+        ],
+        [newTable]
+      )
+    );
+  });
+  expect(oldTable.close).toHaveBeenCalledTimes(1);
+  expect(newTable.close).not.toHaveBeenCalled();
+  expect(mockDocumentHandler).toHaveBeenLastCalledWith(
+    expect.objectContaining({ children: { props: { table: newTable } } })
+  );
+
+  unmount();
+});
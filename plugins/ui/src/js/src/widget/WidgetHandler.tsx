@@ -32,9 +32,18 @@ import {
   WidgetMessageEvent,
   WidgetError,
   METHOD_DOCUMENT_ERROR,
+  METHOD_DOCUMENT_PATCHED,
   METHOD_DOCUMENT_UPDATED,
 } from './WidgetTypes';
 import DocumentHandler from './DocumentHandler';
+import {
+  DocumentPatch,
+  applyDocumentPatch,
+  applyDocumentPatchOperation,
+  forEachJsonValue,
+  getDocumentValue,
+  reviveJson,
+} from './DocumentPatchUtils';
 import { getComponentForElement, wrapCallable } from './WidgetUtils';
 import WidgetStatusContext, {
   WidgetStatus,
@@ -43,6 +52,25 @@ import WidgetErrorView from './WidgetErrorView';
 
 const log = Log.module('@deephaven/js-plugin-ui/WidgetHandler');
 
+/**
+ * Add to the number of references to each exported object within a document value.
+ * @param value Document value to count the references in
+ * @param counts Number of references to each exported object, by object key
+ * @param delta Number to add for each reference, negative when the value is removed
+ */
+function countObjectReferences(
+  value: unknown,
+  counts: Map<number, number>,
+  delta: number
+): void {
+  forEachJsonValue(value, item => {
+    if (isObjectNode(item)) {
+      const objectKey = item[OBJECT_KEY];
+      counts.set(objectKey, (counts.get(objectKey) ?? 0) + delta);
+    }
+  });
+}
+
 export interface WidgetHandlerProps {
   /** Widget for this to handle */
   widgetDescriptor: WidgetDescriptor;
@@ -85,6 +113,21 @@ function WidgetHandler({
   );
   const exportedObjectCount = useRef(0);
 
+  // The last document received from the server, before any nodes were replaced.
+  // Patches sent by the server are applied to this document.
+  const documentData = useRef<unknown>();
+
+  // The last state received from the server. State patches sent by the server are applied to this state.
+  const stateData = useRef<unknown>();
+
+  // The nodes of the document that were already parsed, so only the parts of the document changed by a patch
+  // are parsed again.
+  const parsedNodes = useRef(new WeakMap<object, unknown>());
+
+  // Number of references to each exported object in the document, by object key.
+  // Kept up to date as patches are applied, so unreferenced objects are found without walking the whole document.
+  const objectReferenceCounts = useRef(new Map<number, number>());
+
   // Bi-directional communication as defined in https://www.npmjs.com/package/json-rpc-2.0
   const jsonClient = useMemo(
     () =>
@@ -133,57 +176,66 @@ function WidgetHandler({
      * Replaces all Callables with an async callback that will automatically call the server use JSON-RPC.
      * Replaces all Objects with the exported object from the server.
      * Replaces all Element nodes with the ReactNode derived from that Element.
+     * Nodes that were already parsed are reused, so only the parts of the document changed by a patch are parsed.
      *
-     * @param data The data to parse
+     * @param data The data to parse, already parsed from JSON
      * @returns The parsed data
      */
-    (data: string) => {
+    (data: unknown) => {
       assertNotNull(jsonClient);
-      // Keep track of exported objects that are no longer in use after this render.
-      // We close those objects that are no longer referenced, as they will never be referenced again.
-      const deadObjectMap = new Map(exportedObjectMap.current);
-
-      const parsedData = JSON.parse(data, (key, value) => {
-        // Need to re-hydrate any objects that are defined
-        if (isCallableNode(value)) {
-          const callableId = value[CALLABLE_KEY];
-          log.debug2('Registering callableId', callableId);
-          return wrapCallable(
-            jsonClient,
-            callableId,
-            callableFinalizationRegistry
-          );
-        }
-        if (isObjectNode(value)) {
-          // Replace this node with the exported object
-          const objectKey = value[OBJECT_KEY];
-          const exportedObject = exportedObjectMap.current.get(objectKey);
-          if (exportedObject === undefined) {
-            // The map should always have the exported object for a key, otherwise the protocol is broken
-            throw new Error(`Invalid exported object key ${objectKey}`);
+
+      const parsedData = reviveJson(
+        data,
+        (key, value) => {
+          // Need to re-hydrate any objects that are defined
+          if (isCallableNode(value)) {
+            const callableId = value[CALLABLE_KEY];
+            log.debug2('Registering callableId', callableId);
+            return wrapCallable(
+              jsonClient,
+              callableId,
+              callableFinalizationRegistry
+            );
+          }
+          if (isObjectNode(value)) {
+            // Replace this node with the exported object
+            const objectKey = value[OBJECT_KEY];
+            const exportedObject = exportedObjectMap.current.get(objectKey);
+            if (exportedObject === undefined) {
+              // The map should always have the exported object for a key, otherwise the protocol is broken
+              throw new Error(`Invalid exported object key ${objectKey}`);
+            }
+            return exportedObject;
           }
-          deadObjectMap.delete(objectKey);
-          return exportedObject;
-        }
 
-        if (isElementNode(value)) {
-          // Replace the elements node with the Component it maps to
-          try {
-            return getComponentForElement(value);
-          } catch (e) {
-            log.warn('Error getting component for element', e);
-            return value;
+          if (isElementNode(value)) {
+            // Replace the elements node with the Component it maps to
+            try {
+              return getComponentForElement(value);
+            } catch (e) {
+              log.warn('Error getting component for element', e);
+              return value;
+            }
           }
-        }
 
-        return value;
-      });
+          return value;
+        },
+        '',
+        parsedNodes.current
+      );
 
-      // Close any objects that are no longer referenced
-      deadObjectMap.forEach((deadObject, objectKey) => {
-        log.debug('Closing dead object', objectKey);
-        deadObject.close();
+      // Close any objects that are no longer referenced, as they will never be referenced again
+      const deadObjectKeys: number[] = [];
+      exportedObjectMap.current.forEach((deadObject, objectKey) => {
+        if ((objectReferenceCounts.current.get(objectKey) ?? 0) <= 0) {
+          log.debug('Closing dead object', objectKey);
+          deadObject.close();
+          deadObjectKeys.push(objectKey);
+        }
+      });
+      deadObjectKeys.forEach(objectKey => {
         exportedObjectMap.current.delete(objectKey);
+        objectReferenceCounts.current.delete(objectKey);
       });
 
       log.debug2(
@@ -191,8 +243,8 @@ function WidgetHandler({
         parsedData,
         'exportedObjectMap',
         exportedObjectMap.current,
-        'deadObjectMap',
-        deadObjectMap
+        'deadObjectKeys',
+        deadObjectKeys
       );
       return parsedData;
     },
@@ -211,6 +263,24 @@ function WidgetHandler({
     []
   );
 
+  const updateDocument = useCallback(
+    (data: unknown, getNewState: () => unknown) => {
+      const newDocument = parseDocument(data);
+      setInternalError(undefined);
+      setDocument(newDocument);
+      try {
+        const newState = getNewState();
+        if (newState !== undefined) {
+          stateData.current = newState;
+          onDataChange({ state: newState });
+        }
+      } catch (e) {
+        log.warn('Error parsing state, widget state may not be persisted.', e);
+      }
+    },
+    [onDataChange, parseDocument]
+  );
+
   useEffect(
     function initMethods() {
       if (jsonClient == null) {
@@ -223,20 +293,58 @@ function WidgetHandler({
         async (params: [string, string]) => {
           log.debug2(METHOD_DOCUMENT_UPDATED, params);
           const [documentParam, stateParam] = params;
-          const newDocument = parseDocument(documentParam);
-          setInternalError(undefined);
-          setDocument(newDocument);
-          if (stateParam != null) {
-            try {
-              const newState = JSON.parse(stateParam);
-              onDataChange({ state: newState });
-            } catch (e) {
-              log.warn(
-                'Error parsing state, widget state may not be persisted.',
-                e
+          documentData.current = JSON.parse(documentParam);
+          objectReferenceCounts.current = new Map();
+          countObjectReferences(
+            documentData.current,
+            objectReferenceCounts.current,
+            1
+          );
+          updateDocument(documentData.current, () =>
+            stateParam != null ? JSON.parse(stateParam) : undefined
+          );
+        }
+      );
+
+      jsonClient.addMethod(
+        METHOD_DOCUMENT_PATCHED,
+        async (params: [string, string?, string?]) => {
+          log.debug2(METHOD_DOCUMENT_PATCHED, params);
+          // The state is omitted if it has not changed, or sent as a patch of the last state
+          const [patchParam, stateParam, statePatchParam] = params;
+          const patch: DocumentPatch = JSON.parse(patchParam);
+          patch.forEach(operation => {
+            if (operation.op !== 'add') {
+              countObjectReferences(
+                getDocumentValue(documentData.current, operation.path),
+                objectReferenceCounts.current,
+                -1
               );
             }
-          }
+            documentData.current = applyDocumentPatchOperation(
+              documentData.current,
+              operation
+            );
+            if (operation.op !== 'remove') {
+              countObjectReferences(
+                operation.value,
+                objectReferenceCounts.current,
+                1
+              );
+            }
+          });
+          updateDocument(documentData.current, () => {
+            if (stateParam != null) {
+              return JSON.parse(stateParam);
+            }
+            if (statePatchParam != null) {
+              return applyDocumentPatch(
+                stateData.current,
+                JSON.parse(statePatchParam)
+              );
+            }
+            return undefined;
+          });
         }
       );
 
@@ -254,7 +362,7 @@ function WidgetHandler({
         jsonClient.rejectAllPendingRequests('Widget was changed');
       };
     },
-    [jsonClient, onDataChange, parseDocument, sendSetState]
+    [jsonClient, updateDocument, sendSetState]
   );
 
   /**
@@ -27,12 +27,25 @@ export function makeDocumentUpdatedJsonRpcString(
   return JSON.stringify(makeDocumentUpdatedJsonRpc(document));
 }
 
-export function makeWidgetEvent(data = ''): WidgetMessageEvent {
+export function makeDocumentPatchedJsonRpcString(
+  patch: Record<string, unknown>[] = []
+): string {
+  return JSON.stringify({
+    jsonrpc: '2.0',
+    method: 'documentPatched',
+    params: [JSON.stringify(patch)],
+  });
+}
+
+export function makeWidgetEvent(
+  data = '',
+  exportedObjects: dh.WidgetExportedObject[] = []
+): WidgetMessageEvent {
   return new CustomEvent('message', {
     detail: {
       getDataAsBase64: () => '',
       getDataAsString: () => data,
-      exportedObjects: [],
+      exportedObjects,
     },
   });
 }
@@ -45,9 +58,23 @@ export function makeWidgetEventJsonRpcResponse(
 }
 
 export function makeWidgetEventDocumentUpdated(
-  document: Record<string, unknown> = {}
+  document: Record<string, unknown> = {},
+  exportedObjects: dh.WidgetExportedObject[] = []
+): WidgetMessageEvent {
+  return makeWidgetEvent(
+    makeDocumentUpdatedJsonRpcString(document),
+    exportedObjects
+  );
+}
+
+export function makeWidgetEventDocumentPatched(
+  patch: Record<string, unknown>[] = [],
+  exportedObjects: dh.WidgetExportedObject[] = []
 ): WidgetMessageEvent {
-  return makeWidgetEvent(makeDocumentUpdatedJsonRpcString(document));
+  return makeWidgetEvent(
+    makeDocumentPatchedJsonRpcString(patch),
+    exportedObjects
+  );
 }
 
 export function makeWidgetDescriptor({
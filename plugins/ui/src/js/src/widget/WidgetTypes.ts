@@ -71,3 +71,9 @@ export const METHOD_DOCUMENT_UPDATED = 'documentUpdated';
 
 /** Message containing a document error */
 export const METHOD_DOCUMENT_ERROR = 'documentError';
+
+/**
+ * Message containing a patch to apply to the last document received.
+ * The state is omitted if it has not changed, otherwise it is either the entire state or a patch of the last state.
+ */
+export const METHOD_DOCUMENT_PATCHED = 'documentPatched';
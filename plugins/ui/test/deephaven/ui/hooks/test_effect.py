@@ -188,3 +188,42 @@ class UseEffectTestCase(BaseTestCase):
         self.assertEqual(effect2.call_count, 0)
         self.assertEqual(cleanup2.call_count, 1)
         self.assertEqual(self.called_funcs, ["cleanup2"])
+
+    def test_async_effect(self) -> None:
+        """
+        Test the use_effect hook with an async effect.
+        It should run on the event loop, call the cleanup it returns if it finished, and be cancelled if not.
+        """
+        import asyncio
+        import threading
+        import time
+
+        finished = threading.Event()
+        cancelled = threading.Event()
+        release = asyncio.Event()
+
+        async def effect():
+            await asyncio.sleep(0)
+            finished.set()
+            return self.cleanup
+
+        async def blocked_effect():
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        result = render_hook(self._test_use_effect, effect, dependencies=[1])
+        self.assertTrue(finished.wait(timeout=5))
+
+        # The cleanup returned by the finished coroutine is called when dependencies change
+        result["rerender"](blocked_effect, dependencies=[2])
+        deadline = time.monotonic() + 5
+        while self.cleanup.call_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.cleanup.call_count, 1)
+
+        # A coroutine still running is cancelled on unmount
+        result["unmount"]()
+        self.assertTrue(cancelled.wait(timeout=5))
@@ -275,6 +275,216 @@ class UseTableTestCase(BaseTestCase):
 
         self.assertEqual(result, expected)
 
+    def test_table_arrays(self):
+        from deephaven.ui.hooks import use_table_arrays
+        from deephaven import new_table
+        from deephaven.column import int_col, string_col
+
+        table = new_table(
+            [
+                int_col("X", [1, 2, 3, 4]),
+                int_col("Y", [2, 4, 6, 8]),
+                string_col("Z", ["a", "b", "c", "d"]),
+            ]
+        )
+
+        def _test_table_arrays(t=table):
+            return use_table_arrays(t, ["X", "Z"], first_row=1, row_limit=2)
+
+        render_result = render_hook(_test_table_arrays)
+
+        result, rerender = itemgetter("result", "rerender")(render_result)
+
+        self.assertEqual(list(result.keys()), ["X", "Z"])
+        self.assertEqual(result["X"].tolist(), [2, 3])
+        self.assertEqual(result["Z"].tolist(), ["b", "c"])
+
+    def test_none_table_arrays(self):
+        from deephaven.ui.hooks import use_table_arrays
+
+        def _test_table_arrays(t=None):
+            return use_table_arrays(t)
+
+        render_result = render_hook(_test_table_arrays)
+
+        result, rerender = itemgetter("result", "rerender")(render_result)
+
+        self.assertEqual(result, None)
+
+    def test_table_op(self):
+        from deephaven.ui.hooks import use_table_op
+        from deephaven.ui._internal.TableOpCache import get_table_op_cache
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        table = new_table([int_col("X", [1, 2, 3, 4])])
+        cache = get_table_op_cache()
+        before = cache.metrics
+
+        def _test_table_op(size=2):
+            return use_table_op(table, "head", size)
+
+        # Two components deriving the same table share the result
+        render_result1 = render_hook(_test_table_op)
+        render_result2 = render_hook(_test_table_op, size=2)
+        result1 = render_result1["result"]
+        self.assertIs(render_result2["result"], result1)
+        self.assertEqual(result1.size, 2)
+
+        metrics = cache.metrics
+        self.assertEqual(metrics.misses - before.misses, 1)
+        self.assertEqual(metrics.hits - before.hits, 1)
+
+        # Changing the arguments releases the reference to the old table
+        result2 = render_result2["rerender"](size=1)
+        self.assertIsNot(result2, result1)
+        self.assertEqual(result2.size, 1)
+        self.assertEqual(cache.metrics.evictions, before.evictions)
+
+        # The tables are released when no component uses them
+        render_result1["unmount"]()
+        self.assertEqual(cache.metrics.evictions - before.evictions, 1)
+        render_result2["unmount"]()
+        self.assertEqual(cache.metrics.evictions - before.evictions, 2)
+        self.assertEqual(cache.metrics.size, before.size)
+
+    def test_table_op_cache_concurrent(self):
+        from deephaven.ui._internal.TableOpCache import TableOpCache
+        from deephaven.liveness_scope import LivenessScope
+        from deephaven import empty_table
+
+        cache = TableOpCache()
+        holder = LivenessScope()
+        started = threading.Event()
+        finish = threading.Event()
+        compute_count = 0
+
+        def slow_compute():
+            nonlocal compute_count
+            compute_count += 1
+            started.set()
+            finish.wait(LISTENER_TIMEOUT)
+            return empty_table(1)
+
+        results = Queue()
+
+        def acquire_slow():
+            results.put(cache.acquire("slow", slow_compute, holder.manage))
+
+        threads = [threading.Thread(target=acquire_slow) for _ in range(2)]
+        threads[0].start()
+        self.assertTrue(started.wait(LISTENER_TIMEOUT))
+        threads[1].start()
+
+        # Other operations are computed while the slow one is computing
+        fast = cache.acquire("fast", lambda: empty_table(2), holder.manage)
+        self.assertEqual(fast.table.size, 2)
+
+        finish.set()
+        for thread in threads:
+            thread.join(LISTENER_TIMEOUT)
+        entry1 = results.get(timeout=QUEUE_TIMEOUT)
+        entry2 = results.get(timeout=QUEUE_TIMEOUT)
+
+        # The slow operation is computed once for both requests
+        self.assertIs(entry1, entry2)
+        self.assertEqual(compute_count, 1)
+        metrics = cache.metrics
+        self.assertEqual((metrics.misses, metrics.hits, metrics.size), (2, 1, 2))
+
+        # The results are released with the liveness scope holding them
+        holder.release()
+        metrics = cache.metrics
+        self.assertEqual((metrics.evictions, metrics.size), (2, 0))
+
+    def test_table_op_query_scope(self):
+        import jpy
+        from deephaven.ui._internal.TableOpCache import make_table_op_key
+        from deephaven.execution_context import ExecutionContext, get_exec_ctx
+        from deephaven import empty_table
+
+        table = empty_table(1)
+        key = make_table_op_key(table, "update", ("Y = x",), {})
+        self.assertEqual(make_table_op_key(table, "update", ("Y = x",), {}), key)
+
+        # Formulas may read different variables in another query scope, so the key differs
+        query_scope = jpy.get_type("io.deephaven.engine.context.StandaloneQueryScope")()
+        with ExecutionContext(get_exec_ctx().j_exec_ctx.withQueryScope(query_scope)):
+            self.assertNotEqual(make_table_op_key(table, "update", ("Y = x",), {}), key)
+
+    def test_none_table_op(self):
+        from deephaven.ui.hooks import use_table_op
+
+        def _test_table_op(t=None):
+            return use_table_op(t, "head", 2)
+
+        render_result = render_hook(_test_table_op)
+
+        self.assertEqual(render_result["result"], None)
+
+    def test_table_delta(self):
+        from deephaven.ui.hooks import use_table_delta
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        table = new_table(
+            [
+                int_col("X", [1, 2, 3]),
+                int_col("Y", [2, 4, 6]),
+            ]
+        )
+
+        def _test_table_delta(t=table):
+            return use_table_delta(t, ["Y"])
+
+        render_result = render_hook(_test_table_delta)
+
+        result, rerender = itemgetter("result", "rerender")(render_result)
+
+        self.assertEqual(list(result.keys()), ["Y"])
+        self.assertEqual(result["Y"].tolist(), [2, 4, 6])
+
+    def test_ticking_table_delta(self):
+        from deephaven.ui.hooks import use_table_delta
+        from deephaven import DynamicTableWriter
+        import deephaven.dtypes as dht
+
+        column_definitions = {"Numbers": dht.int32, "Words": dht.string}
+
+        table_writer = DynamicTableWriter(column_definitions)
+        table = table_writer.table
+
+        def _test_table_delta(t=table):
+            return use_table_delta(t, sentinel="sentinel")
+
+        queue = NotifyQueue()
+
+        render_result = render_hook(_test_table_delta, queue=queue)
+
+        result, rerender = itemgetter("result", "rerender")(render_result)
+
+        # the initial render should return the sentinel value since the table has not been read yet
+        self.assertEqual(result, "sentinel")
+
+        # the empty table is replayed after the initial render
+        self.verify_queue_has_size(queue, 1)
+        result = rerender()
+        self.assertEqual(result, "sentinel")
+
+        table_writer.write_row(1, "Testing")
+        self.verify_queue_has_size(queue, 1)
+        result = rerender()
+
+        self.assertEqual(result["Numbers"].tolist(), [1])
+        self.assertEqual(result["Words"].tolist(), ["Testing"])
+
+        table_writer.write_row(2, "Again")
+        self.verify_queue_has_size(queue, 1)
+        result = rerender()
+
+        self.assertEqual(result["Numbers"].tolist(), [1, 2])
+        self.assertEqual(result["Words"].tolist(), ["Testing", "Again"])
+
     def test_column_data(self):
         from deephaven.ui.hooks import use_column_data
         from deephaven import new_table
@@ -0,0 +1,216 @@
+from .BaseTest import BaseTestCase
+
+
+class DocumentDiffTest(BaseTestCase):
+    def expect_patch(self, old, new, expected_patch):
+        from deephaven.ui.renderer.DocumentDiff import diff_document
+
+        self.assertListEqual(diff_document(old, new), expected_patch)
+
+    def test_identical(self):
+        document = {"__dhElemName": "test", "props": {"children": ["a", 1, None]}}
+        self.expect_patch(document, document, [])
+        self.expect_patch(document, {**document}, [])
+
+    def test_replace_value(self):
+        self.expect_patch(
+            {"__dhElemName": "test", "props": {"label": "foo"}},
+            {"__dhElemName": "test", "props": {"label": "bar"}},
+            [{"op": "replace", "path": "/props/label", "value": "bar"}],
+        )
+
+    def test_replace_type(self):
+        self.expect_patch(
+            {"props": {"value": 1}},
+            {"props": {"value": True}},
+            [{"op": "replace", "path": "/props/value", "value": True}],
+        )
+        self.expect_patch(
+            {"props": {"children": ["a"]}},
+            {"props": {"children": "a"}},
+            [{"op": "replace", "path": "/props/children", "value": "a"}],
+        )
+
+    def test_add_remove_keys(self):
+        self.expect_patch(
+            {"props": {"a": 1, "b": 2}},
+            {"props": {"b": 2, "c": 3}},
+            [
+                {"op": "remove", "path": "/props/a"},
+                {"op": "add", "path": "/props/c", "value": 3},
+            ],
+        )
+
+    def test_list_changes(self):
+        self.expect_patch(
+            {"children": ["a", "b", "c"]},
+            {"children": ["a", "x"]},
+            [
+                {"op": "replace", "path": "/children/1", "value": "x"},
+                {"op": "remove", "path": "/children/2"},
+            ],
+        )
+        self.expect_patch(
+            {"children": ["a", "b", "c"]},
+            {"children": ["a"]},
+            [
+                {"op": "remove", "path": "/children/2"},
+                {"op": "remove", "path": "/children/1"},
+            ],
+        )
+        self.expect_patch(
+            {"children": ["a"]},
+            {"children": ["a", "b", "c"]},
+            [
+                {"op": "add", "path": "/children/1", "value": "b"},
+                {"op": "add", "path": "/children/2", "value": "c"},
+            ],
+        )
+
+    def test_escaped_path(self):
+        self.expect_patch(
+            {"a/b": {"c~d": 1}},
+            {"a/b": {"c~d": 2}},
+            [{"op": "replace", "path": "/a~1b/c~0d", "value": 2}],
+        )
+
+    def test_replace_root(self):
+        self.expect_patch("a", "b", [{"op": "replace", "path": "", "value": "b"}])
+
+
+def apply_patch(document, patch):
+    for operation in patch:
+        segments = [
+            segment.replace("~1", "/").replace("~0", "~")
+            for segment in operation["path"].split("/")[1:]
+        ]
+        if not segments:
+            document = operation.get("value")
+            continue
+        parent = document
+        for segment in segments[:-1]:
+            parent = parent[int(segment) if isinstance(parent, list) else segment]
+        key = segments[-1]
+        if isinstance(parent, list):
+            key = int(key)
+            if operation["op"] == "add":
+                parent.insert(key, operation["value"])
+                continue
+        if operation["op"] == "remove":
+            del parent[key]
+        else:
+            parent[key] = operation["value"]
+    return document
+
+
+class RenderedDocumentDiffTest(BaseTestCase):
+    def encode_patch(self, old, new):
+        import json
+        from deephaven.ui.renderer import NodeEncoder
+        from deephaven.ui.renderer.DocumentDiff import (
+            diff_rendered_document,
+            encode_document_patch,
+        )
+
+        encoder = NodeEncoder(separators=(",", ":"))
+        old_document = json.loads(encoder.encode_node(old)["encoded_node"])
+        new_document = json.loads(encoder.encode_node(new)["encoded_node"])
+        patch = json.loads(
+            encode_document_patch(
+                diff_rendered_document(old, new), encoder.encode_value
+            )
+        )
+        # Applying the patch to the old document gives the new document
+        self.assertEqual(apply_patch(old_document, patch), new_document)
+        return patch
+
+    def test_reused_nodes_skipped(self):
+        from unittest.mock import patch
+        from deephaven.ui.renderer import RenderedNode
+        from deephaven.ui.renderer import DocumentDiff
+
+        unchanged = RenderedNode("child", {"children": [RenderedNode("leaf")]})
+        old = RenderedNode("root", {"children": [unchanged, "a"]})
+        new = RenderedNode("root", {"children": [unchanged, "b"]})
+
+        with patch.object(
+            DocumentDiff,
+            "_diff_rendered_value",
+            wraps=DocumentDiff._diff_rendered_value,
+        ) as diff_value:
+            self.assertListEqual(
+                self.encode_patch(old, new),
+                [{"op": "replace", "path": "/props/children/1", "value": "b"}],
+            )
+        # The unchanged node is not walked into
+        paths = [call.args[2] for call in diff_value.call_args_list]
+        self.assertNotIn("/props/children/0/props", paths)
+
+    def test_changed_nodes(self):
+        from deephaven.ui.renderer import RenderedNode
+
+        def on_press():
+            pass
+
+        old = RenderedNode(
+            "root",
+            {
+                "children": [
+                    RenderedNode("button", {"label": "a", "on_press": on_press}),
+                    RenderedNode("text"),
+                ]
+            },
+        )
+        new = RenderedNode(
+            "root",
+            {
+                "children": [
+                    RenderedNode("button", {"label": "b", "on_press": on_press}),
+                    RenderedNode("heading", {"children": [RenderedNode("text")]}),
+                    True,
+                ]
+            },
+        )
+        patch = self.encode_patch(old, new)
+        self.assertListEqual(
+            patch,
+            [
+                {
+                    "op": "replace",
+                    "path": "/props/children/0/props/label",
+                    "value": "b",
+                },
+                {
+                    "op": "replace",
+                    "path": "/props/children/1",
+                    "value": {
+                        "__dhElemName": "heading",
+                        "props": {"children": [{"__dhElemName": "text"}]},
+                    },
+                },
+                {"op": "add", "path": "/props/children/2", "value": True},
+            ],
+        )
+
+    def test_callables_and_objects(self):
+        from deephaven.ui.renderer import RenderedNode
+
+        class Exported:
+            pass
+
+        exported = Exported()
+        old = RenderedNode("root", {"table": exported, "on_press": lambda: None})
+        new = RenderedNode("root", {"table": Exported(), "on_press": lambda: None})
+        patch = self.encode_patch(old, new)
+        # The whole nodes are replaced, so the client can count the references to each exported object
+        self.assertListEqual(
+            patch,
+            [
+                {"op": "replace", "path": "/props/table", "value": {"__dhObid": 1}},
+                {
+                    "op": "replace",
+                    "path": "/props/on_press",
+                    "value": {"__dhCbid": "cb1"},
+                },
+            ],
+        )
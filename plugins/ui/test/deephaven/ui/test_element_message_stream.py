@@ -0,0 +1,368 @@
+from __future__ import annotations
+import json
+import threading
+from typing import Any, Callable, List
+from unittest.mock import Mock, patch
+from .BaseTest import BaseTestCase
+
+
+def make_request(method: str, *params: Any, id: int = 1) -> bytes:
+    return json.dumps(
+        {"jsonrpc": "2.0", "method": method, "params": params, "id": id}
+    ).encode()
+
+
+class ElementMessageStreamTestCase(BaseTestCase):
+    def test_async_handler(self):
+        import asyncio
+        from deephaven import ui
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+        submitted = threading.Condition()
+
+        def submit(task: Callable[[], None]) -> None:
+            with submitted:
+                tasks.append(task)
+                submitted.notify_all()
+
+        def run_tasks():
+            while len(tasks) > 0:
+                tasks.pop(0)()
+
+        release = threading.Event()
+
+        @ui.component
+        def counter():
+            count, set_count = ui.use_state(0)
+
+            async def handle_press():
+                # Waits without blocking the render thread, then updates state from the event loop
+                await asyncio.get_running_loop().run_in_executor(None, release.wait)
+                set_count(count + 1)
+
+            return ui.button(f"{count}", on_press=handle_press)
+
+        connection = Mock()
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+            return_value=RenderScheduler(submit=submit),
+        ):
+            stream = ElementMessageStream(counter(), connection)
+        stream.on_data(make_request("setState", {}), [])
+        run_tasks()
+
+        document = json.loads(
+            json.loads(connection.on_data.call_args.args[0])["params"][0]
+        )
+        callable_id = document["props"]["children"]["props"]["onPress"]["__dhCbid"]
+
+        # The handler returns right away, before the coroutine finishes
+        stream.on_data(make_request("callCallable", callable_id, [], id=2), [])
+        run_tasks()
+        response = json.loads(connection.on_data.call_args.args[0])
+        self.assertEqual(response["id"], 2)
+
+        # The state update from the coroutine is queued on the render thread
+        release.set()
+        with submitted:
+            self.assertTrue(submitted.wait_for(lambda: len(tasks) > 0, timeout=5))
+        run_tasks()
+        notification = json.loads(connection.on_data.call_args.args[0])
+        # The document is small enough that it may be sent whole instead of patched
+        self.assertIn(notification["method"], ("documentPatched", "documentUpdated"))
+        self.assertIn('"1"', notification["params"][0])
+        stream.on_close()
+
+    def test_reconnect(self):
+        from deephaven import ui
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui.object_types.ReconnectCache import ReconnectCache
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+
+        def run_tasks():
+            while len(tasks) > 0:
+                tasks.pop(0)()
+
+        render_count = 0
+
+        @ui.component
+        def counter():
+            nonlocal render_count
+            render_count += 1
+            count, set_count = ui.use_state(0)
+            return ui.button(f"{count}", on_press=lambda: set_count(count + 1))
+
+        element = counter()
+        cache = ReconnectCache()
+
+        def open_stream(state: Any) -> tuple[Any, Mock]:
+            connection = Mock()
+            with patch(
+                "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+                return_value=RenderScheduler(submit=tasks.append),
+            ), patch(
+                "deephaven.ui.object_types.ElementMessageStream.get_reconnect_cache",
+                return_value=cache,
+            ):
+                stream = ElementMessageStream(element, connection)
+            stream.on_data(make_request("setState", state), [])
+            run_tasks()
+            return stream, connection
+
+        def last_notification(connection: Mock) -> Any:
+            for call in reversed(connection.on_data.call_args_list):
+                message = json.loads(call.args[0])
+                if "method" in message:
+                    return message
+            return None
+
+        stream, connection = open_stream({})
+        self.assertEqual(render_count, 1)
+        state = json.loads(last_notification(connection)["params"][1])
+
+        # The client reconnects with the state it was sent, so the last document is sent without rendering again
+        stream.on_close()
+        stream, connection = open_stream(state)
+        self.assertEqual(render_count, 1)
+        notification = last_notification(connection)
+        self.assertEqual(notification["method"], "documentUpdated")
+        self.assertIn('"children":"0"', notification["params"][0])
+        self.assertEqual(cache.metrics.hits, 1)
+
+        # The resumed context is live, and renders for the new stream
+        document = json.loads(notification["params"][0])
+        callable_id = document["props"]["children"]["props"]["onPress"]["__dhCbid"]
+        stream.on_data(make_request("callCallable", callable_id, [], id=2), [])
+        run_tasks()
+        self.assertEqual(render_count, 2)
+        self.assertIn('"1"', last_notification(connection)["params"][0])
+
+        # A client with different state renders from scratch
+        stream.on_close()
+        stream, connection = open_stream({})
+        self.assertEqual(render_count, 3)
+        self.assertEqual(cache.metrics.misses, 1)
+        stream.on_close()
+
+    def test_reconnect_eviction(self):
+        from deephaven import ui
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui.object_types.ReconnectCache import ReconnectCache
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+        unmount_count = 0
+
+        @ui.component
+        def effect():
+            def unmount():
+                nonlocal unmount_count
+                unmount_count += 1
+
+            ui.use_effect(lambda: unmount, [])
+            return ui.text("hello")
+
+        cache = ReconnectCache(max_entries=1)
+        for _ in range(2):
+            with patch(
+                "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+                return_value=RenderScheduler(submit=tasks.append),
+            ), patch(
+                "deephaven.ui.object_types.ElementMessageStream.get_reconnect_cache",
+                return_value=cache,
+            ):
+                stream = ElementMessageStream(effect(), Mock())
+            stream.on_data(make_request("setState", {}), [])
+            while len(tasks) > 0:
+                tasks.pop(0)()
+            stream.on_close()
+
+        # The oldest element is unmounted when the cache is full
+        self.assertEqual(unmount_count, 1)
+        self.assertEqual(cache.metrics.parked, 2)
+        self.assertEqual(cache.metrics.evictions, 1)
+
+        cache.configure(max_entries=0)
+        self.assertEqual(unmount_count, 2)
+        self.assertEqual(cache.metrics.evictions, 2)
+
+    def test_temp_callables(self):
+        from deephaven import ui
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+
+        def run_tasks():
+            while len(tasks) > 0:
+                tasks.pop(0)()
+
+        calls = []
+
+        @ui.component
+        def handler():
+            def get_callbacks():
+                return [lambda: calls.append(1), lambda: calls.append(2)]
+
+            return ui.button("Press", on_press=get_callbacks)
+
+        connection = Mock()
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+            return_value=RenderScheduler(submit=tasks.append),
+        ):
+            stream = ElementMessageStream(handler(), connection)
+        stream.on_data(make_request("setState", {}), [])
+        run_tasks()
+        document = json.loads(
+            json.loads(connection.on_data.call_args.args[0])["params"][0]
+        )
+        callable_id = document["props"]["children"]["props"]["onPress"]["__dhCbid"]
+
+        stream.on_data(make_request("callCallable", callable_id, [], id=2), [])
+        run_tasks()
+        result = json.loads(json.loads(connection.on_data.call_args.args[0])["result"])
+        temp_ids = [item["__dhCbid"] for item in result]
+        self.assertEqual(len(stream._temp_callables), 2)
+
+        stream.on_data(make_request("callCallable", temp_ids[1], [], id=3), [])
+        stream.on_data(make_request("closeCallable", temp_ids[0]), [])
+        run_tasks()
+        self.assertEqual(calls, [2])
+        self.assertEqual(len(stream._temp_callables), 1)
+
+        # Temporary callables are released when the client disconnects
+        stream.on_close()
+        self.assertEqual(len(stream._temp_callables), 0)
+        self.assertEqual(stream._temp_callables.metrics.closed, 2)
+
+    def test_handler_table_in_state(self):
+        from deephaven import ui, time_table
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+
+        def run_tasks():
+            while len(tasks) > 0:
+                tasks.pop(0)()
+
+        rendered_tables = []
+
+        @ui.component
+        def table_button():
+            t, set_t = ui.use_state(None)
+            rendered_tables.append(t)
+            return ui.button("Create", on_press=lambda: set_t(time_table("PT1s")))
+
+        connection = Mock()
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+            return_value=RenderScheduler(submit=tasks.append),
+        ):
+            stream = ElementMessageStream(table_button(), connection)
+        stream.on_data(make_request("setState", {}), [])
+        run_tasks()
+        document = json.loads(
+            json.loads(connection.on_data.call_args.args[0])["params"][0]
+        )
+        callable_id = document["props"]["children"]["props"]["onPress"]["__dhCbid"]
+
+        # The table created by the handler is still live when the next render manages it
+        stream.on_data(make_request("callCallable", callable_id, [], id=2), [])
+        run_tasks()
+        table = rendered_tables[-1]
+        self.assertIsNotNone(table)
+        self.assertTrue(table.j_table.tryRetainReference())
+        table.j_table.dropReference()
+        self.assertEqual(len(stream._temp_callables), 0)
+        stream.on_close()
+
+    def test_phases_recorded_once_per_render(self):
+        from deephaven import ui
+        from deephaven.ui.renderer import RenderMetrics
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+
+        def run_tasks():
+            while len(tasks) > 0:
+                tasks.pop(0)()
+
+        @ui.component
+        def counter():
+            count, set_count = ui.use_state(0)
+            return ui.button(f"{count}", on_press=lambda: set_count(count + 1))
+
+        connection = Mock()
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+            return_value=RenderScheduler(submit=tasks.append),
+        ):
+            stream = ElementMessageStream(counter(), connection)
+        stream.on_data(make_request("setState", {}), [])
+        run_tasks()
+        document = json.loads(
+            json.loads(connection.on_data.call_args.args[0])["params"][0]
+        )
+        callable_id = document["props"]["children"]["props"]["onPress"]["__dhCbid"]
+
+        # The second render sends a patch with a state patch
+        stream.on_data(make_request("callCallable", callable_id, [], id=2), [])
+        run_tasks()
+        self.assertEqual(stream.payload_metrics.patch_update_count, 1)
+
+        metrics = stream.render_metrics
+        self.assertEqual(metrics.render_count, 2)
+        # Each phase is recorded once per render, for both the document and the state
+        for phase in RenderMetrics.PHASES:
+            if phase != "process_callables":
+                self.assertEqual(metrics.phases[phase].count, 2, phase)
+        stream.on_close()
+
+    def test_wrapped_callables_reused(self):
+        from deephaven import ui
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+
+        def run_tasks():
+            while len(tasks) > 0:
+                tasks.pop(0)()
+
+        @ui.component
+        def counter():
+            count, set_count = ui.use_state(0)
+            increment = ui.use_callback(lambda: set_count(lambda c: c + 1), [])
+            return ui.button(f"{count}", on_press=increment)
+
+        connection = Mock()
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+            return_value=RenderScheduler(submit=tasks.append),
+        ):
+            stream = ElementMessageStream(counter(), connection)
+        stream.on_data(make_request("setState", {}), [])
+        run_tasks()
+        document = json.loads(
+            json.loads(connection.on_data.call_args.args[0])["params"][0]
+        )
+        callable_id = document["props"]["children"]["props"]["onPress"]["__dhCbid"]
+        wrapped = stream._callable_dict[callable_id]
+
+        # The handler did not change, so it is not wrapped again
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.wrap_callable"
+        ) as wrap_callable:
+            stream.on_data(make_request("callCallable", callable_id, [], id=2), [])
+            run_tasks()
+        self.assertEqual(stream.render_metrics.render_count, 2)
+        wrap_callable.assert_not_called()
+        self.assertIs(stream._callable_dict[callable_id], wrapped)
+        stream.on_close()
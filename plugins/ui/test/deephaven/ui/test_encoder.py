@@ -580,6 +580,90 @@ class EncoderTest(BaseTestCase):
             expected_objects=[obj1],
         )
 
+    def test_same_output_as_json(self):
+        from deephaven.ui.renderer import NodeEncoder
+
+        props = {
+            "text": 'quote " backslash \\ unicode \u00e9',
+            "numbers": [0, -1, 1.5, 1e100, float("nan"), float("inf")],
+            "flags": (True, False, None),
+            "nested": {"a": {}, "b": [], 1: "int key", 2.5: "float key"},
+        }
+        encoder = NodeEncoder(separators=(",", ":"))
+        result = encoder.encode_node(make_node("test", props))
+        self.assertEqual(
+            result["encoded_node"],
+            json.dumps({"__dhElemName": "test", "props": props}, separators=(",", ":")),
+        )
+
+    def test_reused_fragments(self):
+        from deephaven.ui.renderer import NodeEncoder
+
+        obj1 = TestObject()
+        obj2 = TestObject()
+        cb = lambda: None
+        unchanged = make_node("unchanged", {"children": [obj1], "on_press": cb})
+        encoder = NodeEncoder()
+
+        result = encoder.encode_node(
+            make_node(
+                "root",
+                {"children": [unchanged, make_node("changed", {"children": [obj2]})]},
+            )
+        )
+        self.assertListEqual(result["new_objects"], [obj1, obj2])
+        fragment = encoder._fragment_cache[id(unchanged)].fragment
+
+        # The unchanged node is reused, keeping its objects and callables
+        obj3 = TestObject()
+        result = encoder.encode_node(
+            make_node(
+                "root",
+                {"children": [unchanged, make_node("changed", {"children": [obj3]})]},
+            )
+        )
+        self.assertIs(encoder._fragment_cache[id(unchanged)].fragment, fragment)
+        self.assertListEqual(result["new_objects"], [obj3])
+        self.assertListEqual(list(result["callable_id_dict"].values()), ["cb0"])
+        self.assertDictEqual(
+            json.loads(result["encoded_node"]),
+            {
+                "__dhElemName": "root",
+                "props": {
+                    "children": [
+                        {
+                            "__dhElemName": "unchanged",
+                            "props": {
+                                "children": [{"__dhObid": 0}],
+                                "on_press": {"__dhCbid": "cb0"},
+                            },
+                        },
+                        {
+                            "__dhElemName": "changed",
+                            "props": {"children": [{"__dhObid": 2}]},
+                        },
+                    ]
+                },
+            },
+        )
+
+        # Nodes within a reused node stay cached when the parent changes
+        wrapper = make_node("wrapper", {"children": [unchanged]})
+        encoder.encode_node(make_node("root", {"children": [wrapper]}))
+        encoder.encode_node(make_node("root", {"children": [wrapper, obj2]}))
+        self.assertIn(id(unchanged), encoder._fragment_cache)
+        result = encoder.encode_node(make_node("root", {"children": [unchanged]}))
+        self.assertListEqual(result["new_objects"], [])
+
+        # Objects of nodes no longer in the document are released
+        result = encoder.encode_node(make_node("root", {"children": [obj1]}))
+        self.assertNotIn(id(unchanged), encoder._fragment_cache)
+        self.assertListEqual(result["new_objects"], [])
+        encoder.encode_node(make_node("root"))
+        self.assertDictEqual(encoder._fragment_cache, {}, "leaf nodes are not cached")
+        result = encoder.encode_node(make_node("root", {"children": [unchanged]}))
+        self.assertListEqual(result["new_objects"], [obj1])
+
 
 if __name__ == "__main__":
     unittest.main()
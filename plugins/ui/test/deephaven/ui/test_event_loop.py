@@ -0,0 +1,94 @@
+import threading
+
+from .BaseTest import BaseTestCase
+
+
+class EventLoopTest(BaseTestCase):
+    def test_run_coroutine(self):
+        import asyncio
+        from deephaven.ui._internal.EventLoop import EventLoop
+
+        loop = EventLoop(name="test-event-loop")
+
+        async def add(a: int, b: int) -> int:
+            await asyncio.sleep(0)
+            return a + b
+
+        self.assertEqual(loop.run_coroutine(add(1, 2)).result(timeout=5), 3)
+
+    def test_cancel(self):
+        import asyncio
+        from deephaven.ui._internal.EventLoop import EventLoop
+
+        loop = EventLoop(name="test-event-loop")
+        started = threading.Event()
+        closed = threading.Event()
+        errors = []
+
+        async def ignore_cancel():
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError as e:
+                errors.append(type(e))
+            try:
+                # Catching the cancel and awaiting again doesn't keep the coroutine running
+                await asyncio.sleep(60)
+            except BaseException as e:
+                errors.append(type(e))
+                raise
+            finally:
+                closed.set()
+
+        future = loop.run_coroutine(ignore_cancel())
+        self.assertTrue(started.wait(timeout=5))
+        future.cancel()
+        self.assertTrue(closed.wait(timeout=5))
+        self.assertEqual(errors, [asyncio.CancelledError, GeneratorExit])
+        self.assertTrue(future.cancelled())
+
+    def test_close(self):
+        from deephaven.execution_context import get_exec_ctx
+        from deephaven.ui._internal.EventLoop import _ContextCoroutine
+
+        class Suspend:
+            def __await__(self):
+                yield
+
+        closed = []
+        errors = []
+
+        async def suspend():
+            try:
+                await Suspend()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                closed.append(True)
+
+        steps = _ContextCoroutine(suspend(), get_exec_ctx()).__await__()
+        next(steps)
+        # Closing the awaiting generator closes the coroutine instead of throwing GeneratorExit into it as an error
+        steps.close()
+        self.assertEqual(closed, [True])
+        self.assertEqual(errors, [])
+
+    def test_exception_passed_to_coroutine(self):
+        from deephaven.execution_context import get_exec_ctx
+        from deephaven.ui._internal.EventLoop import _ContextCoroutine
+
+        class Suspend:
+            def __await__(self):
+                yield
+
+        async def handle_error():
+            try:
+                await Suspend()
+            except ValueError as e:
+                return str(e)
+
+        steps = _ContextCoroutine(handle_error(), get_exec_ctx()).__await__()
+        next(steps)
+        with self.assertRaises(StopIteration) as context:
+            steps.throw(ValueError("handled"))
+        self.assertEqual(context.exception.value, "handled")
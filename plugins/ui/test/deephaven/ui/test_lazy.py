@@ -0,0 +1,130 @@
+from __future__ import annotations
+from typing import Any, Dict, List
+from .BaseTest import BaseTestCase
+
+
+def run_on_change(x):
+    x()
+
+
+class LazyTestCase(BaseTestCase):
+    def render_counts(self, lazy: bool, unmount_hidden: bool = False):
+        from deephaven import ui
+        from deephaven.ui._internal.RenderContext import RenderContext
+        from deephaven.ui.renderer.Renderer import Renderer
+
+        render_counts: Dict[str, int] = {}
+        unmounted: List[str] = []
+
+        @ui.component
+        def content(name: str):
+            render_counts[name] = render_counts.get(name, 0) + 1
+            ui.use_effect(lambda: lambda: unmounted.append(name), [])
+            return ui.text(name)
+
+        tabs = ui.tabs(
+            ui.tab(content("a"), title="A"),
+            ui.tab(content("b"), title="B"),
+            ui.tab(content("c"), title="C"),
+            lazy=lazy,
+            unmount_hidden=unmount_hidden,
+        )
+        renderer = Renderer(RenderContext(run_on_change, run_on_change))
+        return renderer, tabs, render_counts, unmounted
+
+    def find_tabs(self, node: Any) -> Any:
+        from deephaven.ui.renderer.RenderedNode import RenderedNode
+
+        while node.name != "deephaven.ui.components.Tabs":
+            node = node.props["children"]
+            self.assertIsInstance(node, RenderedNode)
+        return node
+
+    def test_eager_tabs(self):
+        renderer, tabs, render_counts, unmounted = self.render_counts(lazy=False)
+        renderer.render(tabs)
+        self.assertEqual(render_counts, {"a": 1, "b": 1, "c": 1})
+
+    def test_lazy_tabs(self):
+        renderer, tabs, render_counts, unmounted = self.render_counts(lazy=True)
+        root = renderer.render(tabs)
+        self.assertEqual(render_counts, {"a": 1})
+
+        tabs_node = self.find_tabs(root)
+        self.assertEqual(tabs_node.props["selectedKey"], "A")
+        hidden_tab = tabs_node.props["children"][1]
+        self.assertNotIn("children", hidden_tab.props)
+
+        # Selecting a tab renders it, and keeps the tabs selected before rendered
+        tabs_node.props["onSelectionChange"]("B")
+        renderer.render(tabs)
+        self.assertEqual(set(render_counts), {"a", "b"})
+        self.assertEqual(unmounted, [])
+
+    def test_lazy_tabs_unmount_hidden(self):
+        renderer, tabs, render_counts, unmounted = self.render_counts(
+            lazy=True, unmount_hidden=True
+        )
+        root = renderer.render(tabs)
+        self.find_tabs(root).props["onSelectionChange"]("C")
+        renderer.render(tabs)
+        self.assertEqual(set(render_counts), {"a", "c"})
+        self.assertEqual(unmounted, ["a"])
+
+    def test_lazy_stack(self):
+        from deephaven import ui
+        from deephaven.ui._internal.RenderContext import RenderContext
+        from deephaven.ui.renderer.Renderer import Renderer
+
+        rendered: List[str] = []
+        selected: List[int] = []
+
+        @ui.component
+        def content(name: str):
+            rendered.append(name)
+            return ui.text(name)
+
+        stack = ui.stack(
+            ui.panel(content("a"), title="A"),
+            ui.panel(content("b"), title="B"),
+            lazy=True,
+            on_active_item_change=selected.append,
+        )
+        renderer = Renderer(RenderContext(run_on_change, run_on_change))
+        root = renderer.render(stack)
+        self.assertEqual(rendered, ["a"])
+
+        stack_node = root.props["children"]
+        stack_node.props["onActiveItemChange"](1)
+        renderer.render(stack)
+        self.assertIn("b", rendered)
+        self.assertEqual(selected, [1])
+
+    def test_lazy_stack_controlled(self):
+        from deephaven import ui
+        from deephaven.ui._internal.RenderContext import RenderContext
+        from deephaven.ui.renderer.Renderer import Renderer
+
+        rendered: List[str] = []
+
+        @ui.component
+        def content(name: str):
+            rendered.append(name)
+            return ui.text(name)
+
+        def make_stack(active_item_index: int):
+            return ui.stack(
+                ui.panel(content("a"), title="A"),
+                ui.panel(content("b"), title="B"),
+                lazy=True,
+                unmount_hidden=True,
+                active_item_index=active_item_index,
+            )
+
+        renderer = Renderer(RenderContext(run_on_change, run_on_change))
+        renderer.render(make_stack(0))
+        self.assertEqual(rendered, ["a"])
+
+        # A new active item index from the parent renders the new active panel
+        renderer.render(make_stack(1))
+        self.assertEqual(rendered, ["a", "b"])
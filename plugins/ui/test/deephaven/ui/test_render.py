@@ -21,7 +21,7 @@ class RenderTestCase(BaseTestCase):
         on_change = Mock(side_effect=run_on_change)
         rc = make_render_context(on_change)
         self.assertEqual(rc._hook_index, -2)
-        self.assertEqual(rc._state, {})
+        self.assertEqual(len(rc._state), 0)
         self.assertEqual(rc._children_context, {})
         on_change.assert_not_called()
 
@@ -192,6 +192,49 @@ class RenderExportTestCase(BaseTestCase):
         state = rc.export_state()
         self.assertEqual(state, {})
 
+    def test_export_cached_state(self):
+        rc = make_render_context()
+
+        with rc.open():
+            rc.init_state(0, 1)
+            child_context0 = rc.get_child_context("0")
+            with child_context0.open():
+                child_context0.init_state(0, 2)
+            child_context1 = rc.get_child_context("1")
+            with child_context1.open():
+                child_context1.init_state(0, 3)
+
+        state = rc.export_state()
+        self.assertIs(rc.export_state(), state, "unchanged state is not exported again")
+
+        # Only the changed context and its ancestors are exported again
+        child_context1.set_state(0, 4)
+        new_state = rc.export_state()
+        self.assertIsNot(new_state, state)
+        self.assertIs(new_state["children"]["0"], state["children"]["0"])
+        self.assertEqual(
+            new_state,
+            {
+                "state": {0: 1},
+                "children": {"0": {"state": {0: 2}}, "1": {"state": {0: 4}}},
+            },
+        )
+
+        # State initialized in a new child is exported
+        with rc.open():
+            rc.get_state(0)
+            rc.get_child_context("0")
+            rc.get_child_context("1")
+            child_context2 = rc.get_child_context("2")
+            with child_context2.open():
+                child_context2.init_state(0, 5)
+        self.assertEqual(rc.export_state()["children"]["2"], {"state": {0: 5}})
+
+        # Deleted children are no longer exported
+        with rc.open():
+            rc.get_state(0)
+        self.assertEqual(rc.export_state(), {"state": {0: 1}})
+
 
 class RenderImportTestCase(BaseTestCase):
     def test_import_empty_context(self):
@@ -242,6 +285,32 @@ class RenderImportTestCase(BaseTestCase):
                     self.assertEqual(child_context1.has_state(1), True)
                     self.assertEqual(child_context1.get_state(1), 5)
 
+    def test_import_sparse_state(self):
+        rc = make_render_context()
+        # Only serializable values are exported, so the imported state can skip hooks
+        state = {"state": {"2": "c", "0": 1}}
+        rc.import_state(state)
+        with rc.open():
+            self.assertEqual(rc.get_state(0), 1)
+            self.assertEqual(rc.has_state(1), False)
+            self.assertRaises(KeyError, rc.get_state, 1)
+            rc.init_state(1, lambda: object())
+            self.assertEqual(rc.get_state(2), "c")
+        self.assertEqual(rc.export_state(), {"state": {0: 1, 2: "c"}})
+
+    def test_compact_context(self):
+        rc = make_render_context()
+        # Contexts use slots, and share empty collections until they are used
+        self.assertFalse(hasattr(rc, "__dict__"))
+        leaf = make_render_context()
+        with rc.open():
+            child = rc.get_child_context("0")
+            with child.open():
+                pass
+        self.assertIs(child._children_context, leaf._children_context)
+        self.assertIs(child._collected_effects, leaf._collected_effects)
+        self.assertIsNot(rc._children_context, leaf._children_context)
+
 
 class RenderUnmountChildrenTestCase(BaseTestCase):
     def test_unmount_children(self):
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from unittest.mock import Mock
+from .BaseTest import BaseTestCase
+
+run_on_change = lambda x: x()
+
+
+class RenderMetricsTestCase(BaseTestCase):
+    def test_histogram(self):
+        from deephaven.ui.renderer.RenderMetrics import Histogram
+
+        hist = Histogram((1, 10, 100))
+        self.assertEqual(hist.mean, 0)
+        self.assertEqual(hist.quantile(0.5), 0)
+
+        for value in (0.5, 2, 3, 50, 500):
+            hist.record(value)
+
+        self.assertEqual(hist.count, 5)
+        self.assertEqual(hist.total, 555.5)
+        self.assertEqual(hist.mean, 111.1)
+        self.assertEqual(hist.min, 0.5)
+        self.assertEqual(hist.max, 500)
+        self.assertListEqual(hist.bucket_counts, [1, 2, 1, 1])
+        self.assertEqual(hist.quantile(0.5), 10)
+        self.assertEqual(hist.quantile(1), 500)
+
+        copy = hist.copy()
+        hist.record(1)
+        self.assertEqual(copy.count, 5)
+        self.assertListEqual(copy.bucket_counts, [1, 2, 1, 1])
+
+    def test_component_metrics(self):
+        from deephaven.ui.renderer.Renderer import Renderer
+        from deephaven.ui.renderer.RenderMetrics import (
+            RenderMetrics,
+            get_render_metrics,
+        )
+        from deephaven.ui._internal.RenderContext import RenderContext
+        from deephaven import ui
+
+        @ui.component
+        def child():
+            return ui.text("child")
+
+        @ui.memo
+        def memo_child():
+            return ui.text("memo_child")
+
+        @ui.component
+        def parent():
+            value, set_value = ui.use_state(0)
+            return ui.flex(
+                ui.button(f"{value}", on_press=lambda _: set_value(value + 1)),
+                child(),
+                memo_child(),
+            )
+
+        on_change = Mock(side_effect=run_on_change)
+        rc = RenderContext(on_change, on_change)
+        metrics = RenderMetrics("test")
+        self.assertIn(metrics, get_render_metrics())
+        renderer = Renderer(rc, metrics)
+
+        result = renderer.render(parent())
+        flex = result.props["children"]
+        flex.props["children"][0].props["onPress"](None)
+        renderer.render(parent())
+
+        components = metrics.components
+        parent_name = parent().name
+        child_name = child().name
+        memo_child_name = memo_child().name
+        self.assertEqual(components[parent_name].count, 2)
+        # the memoized child is reused on the second render, the other is rendered again
+        self.assertEqual(components[child_name].count, 2)
+        self.assertEqual(components[memo_child_name].count, 1)
+        self.assertDictEqual(metrics.component_reuse_counts, {memo_child_name: 1})
+
+        # elements that are not components are not timed
+        self.assertEqual(len(components), 3)
+
+        metrics.close()
+        self.assertNotIn(metrics, get_render_metrics())
+
+    def test_render_metrics_rows(self):
+        from deephaven.ui.renderer.RenderMetrics import RenderMetrics
+
+        metrics = RenderMetrics("test")
+        metrics.record_render(3)
+        metrics.record_callable_queue_depth(2)
+        metrics.record_document_size(1000, 100)
+        metrics.record_component("foo", 0.5)
+        with metrics.time_phase("encode"):
+            pass
+        metrics.close()
+
+        self.assertEqual(metrics.render_count, 1)
+        self.assertEqual(metrics.phases["encode"].count, 1)
+        self.assertEqual(metrics.phases["render"].count, 0)
+        self.assertEqual(metrics.state_update_batch_size.total, 3)
+        self.assertEqual(metrics.callable_queue_depth.max, 2)
+        self.assertEqual(metrics.document_bytes.total, 1000)
+        self.assertEqual(metrics.payload_bytes.total, 100)
+
+        rows = {(row[0], row[1]): row for row in metrics.rows()}
+        self.assertEqual(
+            len(rows), len(RenderMetrics.PHASES) + 5, "phases, component and sizes"
+        )
+        self.assertEqual(rows[("component", "foo")][2:5], (1, 0.5, 0.5))
+        self.assertEqual(rows[("count", "state_update_batch_size")][3], 3)
+
+    def test_render_metrics_table(self):
+        from deephaven.ui.renderer.RenderMetrics import (
+            RenderMetrics,
+            render_metrics_table,
+        )
+
+        metrics = RenderMetrics("test")
+        metrics.record_component("foo", 0.5)
+        metrics.close()
+
+        table = render_metrics_table([metrics])
+        self.assertEqual(table.size, len(RenderMetrics.PHASES) + 5)
+        self.assertListEqual(
+            [column.name for column in table.columns],
+            [
+                "Element",
+                "Category",
+                "Name",
+                "Count",
+                "Total",
+                "Mean",
+                "Min",
+                "Max",
+                "P50",
+                "P99",
+                "Reused",
+            ],
+        )
@@ -0,0 +1,108 @@
+from typing import Callable, List
+
+from .BaseTest import BaseTestCase
+
+
+class RenderSchedulerTest(BaseTestCase):
+    def test_bounded_workers(self):
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        submitted: List[Callable[[], None]] = []
+        scheduler = RenderScheduler(max_workers=2, submit=submitted.append)
+        ran = []
+
+        for key in range(5):
+            scheduler.schedule(key, lambda key=key: ran.append(key))
+        # scheduling a key that is already queued does nothing
+        scheduler.schedule(0, lambda: ran.append("duplicate"))
+
+        self.assertEqual(len(submitted), 2)
+        self.assertEqual(scheduler.metrics.queue_depth, 5)
+        self.assertEqual(scheduler.metrics.active_workers, 2)
+
+        # each worker runs one task, then submits itself again while tasks are queued
+        while len(submitted) > 0:
+            submitted.pop(0)()
+            self.assertLessEqual(scheduler.metrics.active_workers, 2)
+
+        self.assertEqual(ran, [0, 1, 2, 3, 4])
+        metrics = scheduler.metrics
+        self.assertEqual(metrics.tasks_scheduled, 5)
+        self.assertEqual(metrics.tasks_run, 5)
+        self.assertEqual(metrics.queue_depth, 0)
+        self.assertEqual(metrics.active_workers, 0)
+        self.assertEqual(metrics.queue_latency["BACKGROUND"].count, 5)
+
+    def test_priority(self):
+        from deephaven.ui._internal.RenderScheduler import (
+            RenderPriority,
+            RenderScheduler,
+        )
+
+        submitted: List[Callable[[], None]] = []
+        scheduler = RenderScheduler(
+            max_workers=1, interactive_burst=2, submit=submitted.append
+        )
+        ran = []
+
+        def schedule(key, priority):
+            scheduler.schedule(key, lambda: ran.append(key), priority)
+
+        schedule("b1", RenderPriority.BACKGROUND)
+        schedule("b2", RenderPriority.BACKGROUND)
+        schedule("i1", RenderPriority.INTERACTIVE)
+        schedule("i2", RenderPriority.INTERACTIVE)
+        schedule("i3", RenderPriority.INTERACTIVE)
+        # a queued background task is promoted when scheduled as interactive
+        schedule("b2", RenderPriority.INTERACTIVE)
+
+        while len(submitted) > 0:
+            submitted.pop(0)()
+
+        # interactive tasks run first, with a background task after each burst
+        self.assertEqual(ran, ["i1", "i2", "b1", "i3", "b2"])
+        self.assertEqual(scheduler.metrics.tasks_promoted, 1)
+
+    def test_cancel_and_errors(self):
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        submitted: List[Callable[[], None]] = []
+        scheduler = RenderScheduler(max_workers=1, submit=submitted.append)
+        ran = []
+
+        def fail():
+            raise ValueError("fail")
+
+        scheduler.schedule("fail", fail)
+        scheduler.schedule("cancelled", lambda: ran.append("cancelled"))
+        scheduler.schedule("ok", lambda: ran.append("ok"))
+        scheduler.cancel("cancelled")
+
+        while len(submitted) > 0:
+            submitted.pop(0)()
+
+        self.assertEqual(ran, ["ok"])
+        self.assertEqual(scheduler.metrics.tasks_failed, 1)
+        self.assertEqual(scheduler.metrics.tasks_run, 2)
+        self.assertRaises(ValueError, scheduler.configure, max_workers=0)
+
+    def test_backlogged(self):
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        submitted: List[Callable[[], None]] = []
+        scheduler = RenderScheduler(
+            max_workers=1, max_queue_depth=1, submit=submitted.append
+        )
+
+        scheduler.schedule(1, lambda: None)
+        self.assertFalse(scheduler.is_backlogged)
+        scheduler.schedule(2, lambda: None)
+        self.assertTrue(scheduler.is_backlogged)
+
+        # raising the max workers submits more workers for the queued tasks
+        self.assertEqual(len(submitted), 1)
+        scheduler.configure(max_workers=8)
+        self.assertEqual(len(submitted), 2)
+        while len(submitted) > 0:
+            submitted.pop(0)()
+        self.assertFalse(scheduler.is_backlogged)
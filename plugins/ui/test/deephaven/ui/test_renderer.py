@@ -243,3 +243,180 @@ class RendererTestCase(BaseTestCase):
         )
 
         self.assertIsInstance(nested_dataclass["b"], RenderedNode)
+
+    def test_memo_component(self):
+        on_change: Callable[[Callable[[], None]], None] = Mock(
+            side_effect=run_on_change
+        )
+        render_counts: dict[str, int] = {"parent": 0, "child": 0}
+        set_parent_count: Callable[[int], None] = Mock()
+        set_child_count: Callable[[int], None] = Mock()
+
+        @ui.memo
+        def ui_child(label: str):
+            nonlocal set_child_count
+            render_counts["child"] += 1
+            count, set_child_count = ui.use_state(0)
+            return ui.text(f"{label} {count}")
+
+        @ui.component
+        def ui_parent():
+            nonlocal set_parent_count
+            render_counts["parent"] += 1
+            count, set_parent_count = ui.use_state(0)
+            return ui_child("Child" if count < 2 else "Changed")
+
+        def get_text(root: RenderedNode) -> Any:
+            # parent -> child -> text
+            node = root
+            for _ in range(3):
+                assert node.props is not None
+                node = node.props["children"]
+            return node
+
+        rc = RenderContext(on_change, on_change)
+        renderer = Renderer(rc)
+        element = ui_parent()
+
+        renderer.render(element)
+        self.assertEqual(render_counts, {"parent": 1, "child": 1})
+
+        # Rendering the same element again with no state changes reuses the render
+        renderer.render(element)
+        self.assertEqual(render_counts, {"parent": 1, "child": 1})
+
+        # Parent state changes, but the child is called with the same props
+        set_parent_count(1)
+        renderer.render(element)
+        self.assertEqual(render_counts, {"parent": 2, "child": 1})
+
+        # Child props changed
+        set_parent_count(2)
+        result = renderer.render(element)
+        self.assertEqual(render_counts, {"parent": 3, "child": 2})
+        self.assertEqual(get_text(result), ["Changed 0"])
+
+        # Child state changed
+        set_child_count(1)
+        result = renderer.render(element)
+        self.assertEqual(render_counts["child"], 3)
+        self.assertEqual(get_text(result), ["Changed 1"])
+
+    def test_memo_are_props_equal(self):
+        render_count = 0
+
+        @ui.memo(
+            are_props_equal=lambda prev, next: prev.args[0] // 10 == next.args[0] // 10
+        )
+        def ui_child(value: int):
+            nonlocal render_count
+            render_count += 1
+            return ui.text(str(value))
+
+        @ui.component
+        def ui_parent(value: int):
+            return ui_child(value)
+
+        rc = RenderContext(Mock(side_effect=run_on_change), Mock())
+        renderer = Renderer(rc)
+
+        renderer.render(ui_parent(1))
+        renderer.render(ui_parent(5))
+        self.assertEqual(render_count, 1)
+        renderer.render(ui_parent(15))
+        self.assertEqual(render_count, 2)
+
+    def test_render_dirty_descendants_only(self):
+        on_change: Callable[[Callable[[], None]], None] = Mock(
+            side_effect=run_on_change
+        )
+        render_counts: dict[str, int] = {}
+        setters: dict[str, Callable[[int], None]] = {}
+        called_funcs: List[str] = []
+
+        @ui.component
+        def ui_counter(name: str):
+            render_counts[name] = render_counts.get(name, 0) + 1
+            count, setters[name] = ui.use_state(0)
+            ui.use_effect(lambda: called_funcs.append(f"{name}_effect"), [])
+            return ui.text(f"{name} {count}")
+
+        @ui.component
+        def ui_parent():
+            render_counts["parent"] = render_counts.get("parent", 0) + 1
+            return ui.flex(ui_counter("a"), ui.flex(ui_counter("b")))
+
+        rc = RenderContext(on_change, on_change)
+        renderer = Renderer(rc)
+        element = ui_parent()
+
+        renderer.render(element)
+        self.assertEqual(render_counts, {"parent": 1, "a": 1, "b": 1})
+        self.assertEqual(called_funcs, ["a_effect", "b_effect"])
+
+        # Only the nested counter is rendered again, its ancestors and siblings are reused
+        setters["b"](1)
+        result = renderer.render(element)
+        self.assertEqual(render_counts, {"parent": 1, "a": 1, "b": 2})
+        self.assertEqual(called_funcs, ["a_effect", "b_effect"])
+
+        assert result.props is not None
+        flex = result.props["children"]
+        assert flex.props is not None
+        counter_a, nested_flex = flex.props["children"]
+        assert counter_a.props is not None and nested_flex.props is not None
+        self.assertEqual(counter_a.props["children"].props["children"], ["a 0"])
+        counter_b = nested_flex.props["children"]
+        assert counter_b.props is not None
+        self.assertEqual(counter_b.props["children"].props["children"], ["b 1"])
+
+        # The state of the skipped contexts is still live
+        setters["a"](2)
+        result = renderer.render(element)
+        self.assertEqual(render_counts, {"parent": 1, "a": 2, "b": 2})
+        assert result.props is not None
+        counter_a = result.props["children"].props["children"][0]
+        self.assertEqual(counter_a.props["children"].props["children"], ["a 2"])
+
+    def test_keyed_children_reorder(self):
+        on_change: Callable[[Callable[[], None]], None] = Mock(
+            side_effect=run_on_change
+        )
+        called_funcs: List[str] = []
+        set_order: Callable[[List[str]], None] = lambda _: None
+
+        @ui.component
+        def ui_row(name: str):
+            ui.use_effect(
+                lambda: called_funcs.append(f"{name}_effect")
+                or (lambda: called_funcs.append(f"{name}_cleanup")),
+                [],
+            )
+            return ui.text(name)
+
+        @ui.component
+        def ui_list():
+            nonlocal set_order
+            order, set_order = ui.use_state(["a", "b", "c"])
+            return ui.flex([ui_row(name, key=name) for name in order])
+
+        rc = RenderContext(on_change, on_change)
+        renderer = Renderer(rc)
+        element = ui_list()
+
+        renderer.render(element)
+        self.assertEqual(called_funcs, ["a_effect", "b_effect", "c_effect"])
+        called_funcs.clear()
+
+        # Inserting, removing and reordering keyed children keeps the contexts of the children still rendered
+        set_order(["d", "c", "a"])
+        result = renderer.render(element)
+        self.assertEqual(called_funcs, ["d_effect", "b_cleanup"])
+
+        assert result.props is not None
+        flex = result.props["children"]
+        assert flex.props is not None
+        self.assertEqual(
+            [row.props["children"].props["children"] for row in flex.props["children"]],
+            [["d"], ["c"], ["a"]],
+        )
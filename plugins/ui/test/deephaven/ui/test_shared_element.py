@@ -0,0 +1,113 @@
+from __future__ import annotations
+import json
+from typing import Any, Callable, List
+from unittest.mock import Mock, patch
+from .BaseTest import BaseTestCase
+
+
+def make_request(method: str, *params: Any, id: int = 1) -> bytes:
+    return json.dumps(
+        {"jsonrpc": "2.0", "method": method, "params": params, "id": id}
+    ).encode()
+
+
+def get_notifications(connection: Mock) -> List[dict]:
+    notifications = []
+    for call in connection.on_data.call_args_list:
+        payload = call.args[0]
+        if len(payload) > 0:
+            message = json.loads(payload.decode())
+            if "method" in message:
+                notifications.append(message)
+    return notifications
+
+
+class SharedElementTestCase(BaseTestCase):
+    def test_shared_render(self):
+        from deephaven import ui
+        from deephaven.ui.object_types import ElementType, SharedElementMessageStream
+        from deephaven.ui.object_types.SharedElementMessageStream import (
+            _shared_hosts,
+        )
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        tasks: List[Callable[[], None]] = []
+
+        def run_tasks():
+            while len(tasks) > 0:
+                tasks.pop(0)()
+
+        render_count = 0
+
+        @ui.component
+        def counter():
+            nonlocal render_count
+            render_count += 1
+            count, set_count = ui.use_state(0)
+            return ui.button(f"{count}", on_press=lambda: set_count(count + 1))
+
+        element = ui.shared(counter())
+        element_type = ElementType()
+
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+            return_value=RenderScheduler(submit=tasks.append),
+        ):
+            connection1 = Mock()
+            client1 = element_type.create_client_connection(element, connection1)
+            self.assertIsInstance(client1, SharedElementMessageStream)
+            client1.on_data(make_request("setState", {"state": {0: 5}}), [])
+            run_tasks()
+            self.assertEqual(render_count, 1)
+
+            # The second client is sent the last render without rendering again, and its state is not used
+            connection2 = Mock()
+            client2 = element_type.create_client_connection(element, connection2)
+            client2.on_data(make_request("setState", {"state": {0: 1}}), [])
+            run_tasks()
+            self.assertEqual(render_count, 1)
+            # The clients use the renderer of the host instead of creating their own
+            self.assertIs(client1._renderer, client2._renderer)
+            self.assertIs(client1._context, client2._context)
+
+            notifications1 = get_notifications(connection1)
+            notifications2 = get_notifications(connection2)
+            self.assertEqual(notifications1[-1]["method"], "documentUpdated")
+            self.assertEqual(notifications2[-1]["method"], "documentUpdated")
+            self.assertEqual(notifications1[-1]["params"], notifications2[-1]["params"])
+            document = json.loads(notifications2[-1]["params"][0])
+            button = document["props"]["children"]
+            self.assertEqual(button["props"]["children"], "5")
+
+            # An event from one client renders once and updates all clients
+            callable_id = button["props"]["onPress"]["__dhCbid"]
+            client2.on_data(make_request("callCallable", callable_id, [], id=2), [])
+            run_tasks()
+            self.assertEqual(render_count, 2)
+            for connection in (connection1, connection2):
+                notification = get_notifications(connection)[-1]
+                self.assertIn('"6"', notification["params"][0])
+
+            # The host is closed when the last client disconnects
+            self.assertIn(element, _shared_hosts)
+            client1.on_close()
+            self.assertIn(element, _shared_hosts)
+            client2.on_close()
+            self.assertNotIn(element, _shared_hosts)
+
+    def test_not_shared(self):
+        from deephaven import ui
+        from deephaven.ui.object_types import ElementType, SharedElementMessageStream
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+
+        @ui.component
+        def text():
+            return ui.text("text")
+
+        with patch(
+            "deephaven.ui.object_types.ElementMessageStream.get_render_scheduler",
+            return_value=RenderScheduler(submit=Mock()),
+        ):
+            client = ElementType().create_client_connection(text(), Mock())
+            self.assertNotIsInstance(client, SharedElementMessageStream)
+            client.on_close()
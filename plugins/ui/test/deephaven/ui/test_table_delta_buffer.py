@@ -0,0 +1,100 @@
+import numpy as np
+
+from .BaseTest import BaseTestCase
+
+
+def keys(*values):
+    return np.array(values, dtype=np.int64)
+
+
+class TableDeltaBufferTest(BaseTestCase):
+    def make_buffer(self, row_keys, values):
+        from deephaven.ui._internal.TableDeltaBuffer import TableDeltaBuffer
+
+        buffer = TableDeltaBuffer()
+        buffer.add(keys(*row_keys), {"X": np.array(values, dtype=np.int32)})
+        return buffer
+
+    def expect_buffer(self, buffer, row_keys, values):
+        self.assertEqual(buffer.size, len(row_keys))
+        self.assertListEqual(buffer.row_keys.tolist(), row_keys)
+        self.assertListEqual(buffer.data()["X"].tolist(), values)
+
+    def test_append(self):
+        buffer = self.make_buffer([0, 1], [10, 11])
+        previous = buffer.data()["X"]
+
+        buffer.add(keys(2, 3, 4), {"X": np.array([12, 13, 14], dtype=np.int32)})
+        self.expect_buffer(buffer, [0, 1, 2, 3, 4], [10, 11, 12, 13, 14])
+        self.assertEqual(buffer.data()["X"].dtype, np.int32)
+        # previously returned data does not include the appended rows
+        self.assertListEqual(previous.tolist(), [10, 11])
+
+        for i in range(5, 100):
+            buffer.add(keys(i), {"X": np.array([i + 10], dtype=np.int32)})
+        self.expect_buffer(buffer, list(range(100)), list(range(10, 110)))
+
+    def test_insert(self):
+        buffer = self.make_buffer([2, 5, 8], [2, 5, 8])
+        buffer.add(keys(0, 3, 9), {"X": np.array([0, 3, 9], dtype=np.int32)})
+        self.expect_buffer(buffer, [0, 2, 3, 5, 8, 9], [0, 2, 3, 5, 8, 9])
+
+    def test_remove(self):
+        buffer = self.make_buffer([0, 1, 2, 3, 4], [10, 11, 12, 13, 14])
+        previous = buffer.data()["X"]
+
+        buffer.remove(keys(0, 2, 4))
+        self.expect_buffer(buffer, [1, 3], [11, 13])
+        self.assertListEqual(previous.tolist(), [10, 11, 12, 13, 14])
+
+        buffer.remove(keys(1, 3))
+        self.expect_buffer(buffer, [], [])
+
+        buffer.add(keys(7), {"X": np.array([17], dtype=np.int32)})
+        self.expect_buffer(buffer, [7], [17])
+
+    def test_modify(self):
+        buffer = self.make_buffer([0, 4, 8], [10, 14, 18])
+        buffer.modify(keys(4, 8), {"X": np.array([24, 28], dtype=np.int32)})
+        self.expect_buffer(buffer, [0, 4, 8], [10, 24, 28])
+
+        # columns that are not in the buffer are ignored
+        buffer.modify(keys(0), {"Y": np.array([1], dtype=np.int32)})
+        self.expect_buffer(buffer, [0, 4, 8], [10, 24, 28])
+
+    def test_strings(self):
+        from deephaven.ui._internal.TableDeltaBuffer import TableDeltaBuffer
+
+        # Strings are read as fixed width arrays as wide as the longest value read
+        buffer = TableDeltaBuffer()
+        buffer.add(keys(0, 2), {"S": np.array(["a", "bb"], np.str_)})
+        buffer.add(keys(3), {"S": np.array(["longer"], np.str_)})
+        buffer.add(keys(1), {"S": np.array(["inserted"], np.str_)})
+        self.assertListEqual(
+            buffer.data()["S"].tolist(), ["a", "inserted", "bb", "longer"]
+        )
+
+        buffer.modify(keys(0, 3), {"S": np.array(["modified", "zzzzzz"], np.str_)})
+        self.assertListEqual(
+            buffer.data()["S"].tolist(), ["modified", "inserted", "bb", "zzzzzz"]
+        )
+
+    def test_shift(self):
+        buffer = self.make_buffer([0, 1, 2, 5, 6], [10, 11, 12, 15, 16])
+
+        # shifting right into keys that another range is shifting away from
+        buffer.shift([1, 5], [2, 6], [4, 10])
+        self.expect_buffer(buffer, [0, 5, 6, 15, 16], [10, 11, 12, 15, 16])
+
+        buffer.shift([5], [16], [-4])
+        self.expect_buffer(buffer, [0, 1, 2, 11, 12], [10, 11, 12, 15, 16])
+
+    def test_update(self):
+        buffer = self.make_buffer([0, 1, 2, 3], [10, 11, 12, 13])
+
+        # removed, shifted, added, then modified, the order updates are applied in
+        buffer.remove(keys(1))
+        buffer.shift([2], [3], [-1])
+        buffer.add(keys(3), {"X": np.array([20], dtype=np.int32)})
+        buffer.modify(keys(0), {"X": np.array([30], dtype=np.int32)})
+        self.expect_buffer(buffer, [0, 1, 2, 3], [30, 12, 13, 20])
@@ -0,0 +1,63 @@
+from unittest.mock import Mock
+
+from .BaseTest import BaseTestCase
+
+
+class TempCallableRegistryTest(BaseTestCase):
+    def test_lru_eviction(self):
+        from deephaven.ui._internal.TempCallableRegistry import (
+            SharedLivenessScope,
+            TempCallableRegistry,
+        )
+
+        liveness_scope = Mock()
+        shared_scope = SharedLivenessScope(liveness_scope)
+        registry = TempCallableRegistry(max_size=2, ttl=0)
+        callables = [Mock() for _ in range(3)]
+        ids = [registry.register(c, shared_scope) for c in callables[:2]]
+        shared_scope.release()
+
+        # Using the first callable makes the second the least recently used
+        self.assertIs(registry.get(ids[0]), callables[0])
+        ids.append(registry.register(callables[2]))
+        self.assertIsNone(registry.get(ids[1]))
+        self.assertIs(registry.get(ids[0]), callables[0])
+        self.assertIs(registry.get(ids[2]), callables[2])
+        liveness_scope.release.assert_not_called()
+
+        # The scope is released once all the callables sharing it are removed
+        registry.close(ids[0])
+        liveness_scope.release.assert_called_once()
+
+        metrics = registry.metrics
+        self.assertEqual(metrics.registered, 3)
+        self.assertEqual(metrics.evicted, 1)
+        self.assertEqual(metrics.closed, 1)
+        self.assertEqual(metrics.live, 1)
+
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+        self.assertEqual(registry.metrics.live, 0)
+
+    def test_ttl_eviction(self):
+        from deephaven.ui._internal.TempCallableRegistry import TempCallableRegistry
+
+        now = 0.0
+        registry = TempCallableRegistry(max_size=10, ttl=60, clock=lambda: now)
+        first = registry.register(Mock())
+        now = 30
+        second = registry.register(Mock())
+
+        # Using a callable refreshes it
+        now = 50
+        self.assertIsNotNone(registry.get(first))
+        now = 100
+        self.assertIsNone(registry.get(second))
+        self.assertIsNotNone(registry.get(first))
+        self.assertEqual(registry.metrics.evicted, 1)
+
+    def test_invalid_limits(self):
+        from deephaven.ui._internal.TempCallableRegistry import TempCallableRegistry
+
+        self.assertRaises(ValueError, TempCallableRegistry, max_size=0)
+        self.assertRaises(ValueError, TempCallableRegistry, ttl=-1)
@@ -0,0 +1,151 @@
+import threading
+
+from .BaseTest import BaseTestCase
+
+THROTTLE_TIMEOUT = 2.0
+
+
+class UpdateThrottleTest(BaseTestCase):
+    def test_coalesce_pending(self):
+        from deephaven.ui._internal.UpdateThrottle import UpdateThrottle
+
+        applied = []
+        submitted = []
+        throttle = UpdateThrottle(lambda: applied.append(True), submitted.append)
+
+        throttle.notify()
+        throttle.notify()
+        throttle.notify()
+
+        # only one update is submitted while it is pending
+        self.assertEqual(len(submitted), 1)
+        self.assertEqual(len(applied), 0)
+
+        submitted.pop()()
+        self.assertEqual(len(applied), 1)
+
+        # after the pending update is applied, the next update is submitted again
+        throttle.notify()
+        self.assertEqual(len(submitted), 1)
+
+        metrics = throttle.metrics
+        self.assertEqual(metrics.updates_received, 4)
+        self.assertEqual(metrics.updates_coalesced, 2)
+        self.assertEqual(metrics.updates_delayed, 0)
+        self.assertEqual(metrics.updates_applied, 1)
+
+    def test_serialized_apply(self):
+        from deephaven.ui._internal.UpdateThrottle import UpdateThrottle
+
+        applied = []
+        submitted = []
+
+        def apply():
+            # an update notified while applying waits for this one to finish
+            if len(applied) == 0:
+                throttle.notify()
+                throttle.notify()
+                self.assertEqual(len(submitted), 0)
+            applied.append(True)
+
+        throttle = UpdateThrottle(apply, submitted.append)
+        throttle.notify()
+        submitted.pop()()
+
+        # the update notified while applying is submitted once the first finishes
+        self.assertEqual(len(applied), 1)
+        self.assertEqual(len(submitted), 1)
+        submitted.pop()()
+        self.assertEqual(len(applied), 2)
+        self.assertEqual(len(submitted), 0)
+
+        metrics = throttle.metrics
+        self.assertEqual(metrics.updates_received, 3)
+        self.assertEqual(metrics.updates_coalesced, 1)
+        self.assertEqual(metrics.updates_applied, 2)
+
+    def test_max_update_rate(self):
+        from deephaven.ui._internal.UpdateThrottle import UpdateThrottle
+
+        event = threading.Event()
+        throttle = UpdateThrottle(event.set, max_update_rate=20)
+
+        # the first update is applied right away
+        throttle.notify()
+        self.assertTrue(event.is_set())
+        event.clear()
+
+        # updates too soon after are delayed and coalesced
+        throttle.notify()
+        throttle.notify()
+        self.assertFalse(event.is_set())
+
+        if not event.wait(timeout=THROTTLE_TIMEOUT):
+            assert False, "delayed update was not applied"
+
+        # delayed updates are applied on one thread shared by all throttles
+        thread_count = threading.active_count()
+        event.clear()
+        throttle.notify()
+        self.assertTrue(event.wait(timeout=THROTTLE_TIMEOUT))
+        self.assertEqual(threading.active_count(), thread_count)
+
+        metrics = throttle.metrics
+        self.assertEqual(metrics.updates_received, 4)
+        self.assertEqual(metrics.updates_coalesced, 1)
+        self.assertEqual(metrics.updates_delayed, 2)
+        self.assertEqual(metrics.updates_applied, 3)
+
+    def test_default_max_update_rate(self):
+        from deephaven.ui._internal.UpdateThrottle import UpdateThrottle
+        from deephaven import ui
+
+        self.assertIsNone(ui.get_default_max_update_rate())
+        self.assertRaises(ValueError, ui.set_default_max_update_rate, 0)
+
+        before = ui.get_update_throttle_metrics()
+        applied = []
+        throttle = UpdateThrottle(lambda: applied.append(True))
+
+        ui.set_default_max_update_rate(0.001)
+        try:
+            throttle.notify()
+            throttle.notify()
+        finally:
+            ui.set_default_max_update_rate(None)
+
+        self.assertEqual(len(applied), 1)
+        after = ui.get_update_throttle_metrics()
+        self.assertEqual(after.updates_received - before.updates_received, 2)
+        self.assertEqual(after.updates_delayed - before.updates_delayed, 1)
+
+        # cancelling stops the delayed update
+        throttle.cancel()
+        throttle.notify()
+        self.assertEqual(throttle.metrics.updates_received, 2)
+
+    def test_backlogged_scheduler(self):
+        from unittest.mock import patch
+        from deephaven.ui._internal.RenderScheduler import RenderScheduler
+        from deephaven.ui._internal.UpdateThrottle import UpdateThrottle
+
+        scheduler = RenderScheduler(
+            max_queue_depth=0, backlog_update_interval=1000, submit=lambda task: None
+        )
+        applied = []
+        throttle = UpdateThrottle(lambda: applied.append(True))
+
+        with patch(
+            "deephaven.ui._internal.UpdateThrottle.get_render_scheduler",
+            return_value=scheduler,
+        ):
+            throttle.notify()
+            throttle.notify()
+            self.assertEqual(len(applied), 2)
+
+            # updates are delayed while the render scheduler is backlogged
+            scheduler.schedule("key", lambda: None)
+            throttle.notify()
+            self.assertEqual(len(applied), 2)
+            self.assertEqual(throttle.metrics.updates_delayed, 1)
+            throttle.cancel()
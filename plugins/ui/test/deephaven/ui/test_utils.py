@@ -101,6 +101,23 @@ class UtilsTest(BaseTestCase):
             {"bar": "biz", "UNSAFE_className": "harry", "aria-label": "ron"},
         )
 
+    def test_dict_to_react_props_cache(self):
+        from unittest.mock import patch
+        from deephaven.ui._internal import utils
+
+        with patch.object(utils, "_react_prop_name_cache", {}) as cache, patch.object(
+            utils, "_REACT_PROP_NAME_CACHE_SIZE", 2
+        ):
+            props = {"aria_label": "a", "UNSAFE_class_name": "b", "margin_top": 1}
+            expected = {"aria-label": "a", "UNSAFE_className": "b", "marginTop": 1}
+            self.assertDictEqual(utils.dict_to_react_props(props), expected)
+            # Names are cached up to the max size, and converted the same way from the cache
+            self.assertDictEqual(
+                cache,
+                {"aria_label": "aria-label", "UNSAFE_class_name": "UNSAFE_className"},
+            )
+            self.assertDictEqual(utils.dict_to_react_props(props), expected)
+
     def test_remove_empty_keys(self):
         from deephaven.ui._internal.utils import remove_empty_keys
 
@@ -240,6 +257,34 @@ class UtilsTest(BaseTestCase):
         # Test that wrapping a function without a signature doesn't throw an error
         wrapped = wrap_callable(print)
 
+    def test_wrap_callable_cache(self):
+        import gc
+        import weakref
+        from unittest.mock import patch
+        from deephaven.ui._internal import utils
+
+        def test_func(a):
+            return a
+
+        with patch.object(utils, "signature", wraps=utils.signature) as sig_mock:
+            wrapped1 = utils.wrap_callable(test_func)
+            wrapped2 = utils.wrap_callable(test_func)
+            self.assertEqual(sig_mock.call_count, 1, "signature is only read once")
+            self.assertEqual(wrapped1(1, 2), 1)
+            self.assertEqual(wrapped2(3, b=4), 3)
+
+            # A new function is a different callable, even if it has the same code
+            utils.wrap_callable(lambda a: a)
+            self.assertEqual(sig_mock.call_count, 2)
+
+        # the cache does not keep the function alive
+        self.assertIn(test_func, utils._args_filter_cache)
+        func_ref = weakref.ref(test_func)
+        # the mock records the calls, so delete it too
+        del test_func, wrapped1, wrapped2, sig_mock
+        gc.collect()
+        self.assertIsNone(func_ref())
+
     def test_create_props(self):
         from deephaven.ui._internal.utils import create_props
 